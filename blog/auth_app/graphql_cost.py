@@ -0,0 +1,80 @@
+"""
+Static analysis of GraphQL operations for the throttles (auth_app.throttling).
+
+Kept apart from the throttles so that REST-only workers never import graphql.
+"""
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLList,
+    InlineFragmentNode,
+    OperationType,
+    get_named_type,
+    get_nullable_type,
+    get_operation_ast,
+)
+
+from auth_app.utils.constants import GRAPHQL_LIST_COST_FACTOR, GRAPHQL_MUTATION_COST
+
+
+def graphql_root_fields(document, operation_name=None):
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return set()
+    return {
+        selection.name.value
+        for selection in operation.selection_set.selections
+        if isinstance(selection, FieldNode)
+    }
+
+
+def graphql_query_cost(schema, document, operation_name=None):
+    """Static cost of an operation: 1 per field, children of list fields
+    weighted by GRAPHQL_LIST_COST_FACTOR, GRAPHQL_MUTATION_COST per mutation.
+    """
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return 0
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+
+    def selection_cost(selection_set, parent_type, visited):
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                field = getattr(parent_type, "fields", {}).get(selection.name.value)
+                if field is None:  # __typename, introspection
+                    continue
+                child_cost = 0
+                if selection.selection_set:
+                    child_cost = selection_cost(
+                        selection.selection_set, get_named_type(field.type), visited
+                    )
+                if isinstance(get_nullable_type(field.type), GraphQLList):
+                    child_cost *= GRAPHQL_LIST_COST_FACTOR
+                cost += 1 + child_cost
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                if name in fragments and name not in visited:
+                    fragment = fragments[name]
+                    fragment_type = schema.get_type(fragment.type_condition.name.value)
+                    cost += selection_cost(
+                        fragment.selection_set, fragment_type, visited | {name}
+                    )
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition:
+                    fragment_type = schema.get_type(selection.type_condition.name.value)
+                cost += selection_cost(selection.selection_set, fragment_type, visited)
+        return cost
+
+    root_type = schema.get_root_type(operation.operation)
+    cost = selection_cost(operation.selection_set, root_type, frozenset())
+    if operation.operation == OperationType.MUTATION:
+        cost += GRAPHQL_MUTATION_COST * len(operation.selection_set.selections)
+    return cost
@@ -0,0 +1,123 @@
+import logging
+import threading
+import time
+
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from auth_app.utils.constants import MAX_LOCAL_BUCKETS
+
+from django.core.cache import cache
+
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate):
+    """``"10/min"`` -> ``(10, 60)``: bucket capacity and seconds to refill it."""
+    capacity, period = rate.split("/")
+    return int(capacity), PERIODS[period[0]]
+
+
+class BucketStore:
+    """Bucket states in the default cache, shared by every worker when
+    CACHE_URL points to Redis (per worker with the local-memory fallback).
+
+    If the cache backend fails, states are kept in this process instead, so
+    throttling degrades to per-worker limits rather than to no limits.
+    Read-modify-write is not atomic: concurrent requests may overshoot a
+    bucket by a few tokens, which is fine for throttling.
+    """
+
+    def __init__(self):
+        self.local = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        try:
+            return cache.get(key)
+        except Exception:
+            logger.warning("Throttle cache unavailable, using local buckets")
+            return self.local.get(key)
+
+    def set(self, key, value, timeout):
+        try:
+            cache.set(key, value, timeout)
+        except Exception:
+            with self.lock:
+                if len(self.local) >= MAX_LOCAL_BUCKETS:
+                    self.local.clear()
+                self.local[key] = value
+
+
+buckets = BucketStore()
+
+
+def consume(key, rate, cost=1):
+    """Take ``cost`` tokens from the bucket ``key``.
+
+    Returns the seconds until enough tokens are available (0: allowed).
+    """
+    capacity, period = parse_rate(rate)
+    refill = capacity / period  # tokens per second
+    now = time.time()
+
+    tokens, updated_at = buckets.get(key) or (capacity, now)
+    tokens = min(capacity, tokens + (now - updated_at) * refill)
+    wait = 0 if tokens >= cost else (cost - tokens) / refill
+    if not wait:
+        tokens -= cost
+    buckets.set(key, (tokens, now), timeout=period)
+    return wait
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """Token bucket per user (``user`` rate) or per IP (``anon`` rate).
+
+    Subclasses with a ``scope`` use that rate and always key by IP (login,
+    registration: the callers are anonymous by definition).
+    """
+
+    scope = None
+
+    def get_bucket(self, request):
+        if self.scope:
+            return self.scope, f"ip-{self.get_ident(request)}"
+        if request.user and request.user.is_authenticated:
+            return "user", f"user-{request.user.pk}"
+        return "anon", f"ip-{self.get_ident(request)}"
+
+    def allow_request(self, request, view):
+        scope, ident = self.get_bucket(request)
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(scope)
+        if rate is None:
+            return True
+        self.wait_seconds = consume(f"throttle:{scope}:{ident}", rate)
+        return not self.wait_seconds
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class LoginRateThrottle(TokenBucketThrottle):
+    scope = "login"  # /api/token/: one password hash per attempt
+
+
+class RegisterRateThrottle(TokenBucketThrottle):
+    scope = "register"
+
+
+class GraphQLThrottle(TokenBucketThrottle):
+    """Cost-weighted bucket (``graphql`` rate) shared by all GraphQL views."""
+
+    def allow_query(self, request, cost):
+        _, ident = self.get_bucket(request)
+        rate = api_settings.DEFAULT_THROTTLE_RATES["graphql"]
+        self.wait_seconds = consume(f"throttle:graphql:{ident}", rate, cost)
+        return not self.wait_seconds
+
+    @staticmethod
+    def capacity():
+        return parse_rate(api_settings.DEFAULT_THROTTLE_RATES["graphql"])[0]
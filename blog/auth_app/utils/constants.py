@@ -9,3 +9,14 @@ SUCCESS_USER_CREATED = "Usuario creado correctamente."
 
 # --- GraphQL messages ---
 ERROR_GRAPHQL_NOT_AUTHENTICATED = "Debes iniciar sesión para usar GraphQL."
+ERROR_GRAPHQL_QUERY_TOO_EXPENSIVE = (
+    "La consulta es demasiado costosa ({cost} puntos, máximo {limit})."
+)
+ERROR_GRAPHQL_THROTTLED = (
+    "Demasiadas peticiones. Inténtalo de nuevo en {wait} segundos."
+)
+
+# --- Throttling ---
+GRAPHQL_LIST_COST_FACTOR = 10  # children of a list field count N times
+GRAPHQL_MUTATION_COST = 10  # extra points per mutation (writes)
+MAX_LOCAL_BUCKETS = 10000  # in-memory fallback size (cleared when full)
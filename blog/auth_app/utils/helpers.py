@@ -22,10 +22,11 @@ def is_superuser(user):
 
 
 def is_owner(user, obj):
-    if hasattr(obj, "user"):
-        return obj.user == user
+    # Compare ids: no query for the user (and none for the blog if it is loaded)
+    if hasattr(obj, "user_id"):
+        return obj.user_id == user.pk
     if hasattr(obj, "blog"):
-        return obj.blog.user == user
+        return obj.blog.user_id == user.pk
     return False
 
 
@@ -1,9 +1,41 @@
-from graphene_django.views import GraphQLView  # pyright: ignore[reportMissingImports]
+import logging
+import math
+
+from asgiref.sync import sync_to_async
+from graphene_django.views import (  # pyright: ignore[reportMissingImports]
+    GraphQLView,
+    HttpError,
+)
+from graphql import OperationType, get_operation_ast, parse
 from graphql_jwt.shortcuts import (  # pyright: ignore[reportMissingImports]
     get_user_by_token,  # pyright: ignore[reportMissingImports]
 )
 
-from auth_app.utils.constants import ERROR_NOT_OBTAIN_USER_BYTOKEN
+from auth_app.graphql_cost import graphql_query_cost, graphql_root_fields
+from auth_app.throttling import (
+    GraphQLThrottle,
+    LoginRateThrottle,
+    RegisterRateThrottle,
+)
+from auth_app.utils.constants import (
+    ERROR_GRAPHQL_QUERY_TOO_EXPENSIVE,
+    ERROR_GRAPHQL_THROTTLED,
+    ERROR_NOT_OBTAIN_USER_BYTOKEN,
+)
+from blog_app.db_routing import pin_to_primary, read_from_replica
+
+from django.db import close_old_connections
+from django.http import HttpResponse, HttpResponseBadRequest
+
+
+logger = logging.getLogger(__name__)
+
+# Mutations sharing the per-IP buckets of their REST endpoints
+SCOPED_THROTTLES = {
+    "loginTokenAuth": LoginRateThrottle,
+    "registerUser": RegisterRateThrottle,
+}
+TOO_MANY_REQUESTS = 429
 
 
 class CustomGraphQLView(GraphQLView):
@@ -16,5 +48,97 @@ class CustomGraphQLView(GraphQLView):
                 user = get_user_by_token(token)
                 request.user = user
             except Exception:
-                print(ERROR_NOT_OBTAIN_USER_BYTOKEN)
+                logger.warning(ERROR_NOT_OBTAIN_USER_BYTOKEN)
         return request
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, show_graphiql=False
+    ):
+        if query:
+            self.check_throttles(request, query, operation_name)
+        if not self.is_query(query, operation_name):
+            # Mutations: the user reads its own writes from the primary
+            pin_to_primary(request.user)
+            return super().execute_graphql_request(
+                request, data, query, variables, operation_name, show_graphiql
+            )
+        with read_from_replica(request.user):
+            return super().execute_graphql_request(
+                request, data, query, variables, operation_name, show_graphiql
+            )
+
+    @staticmethod
+    def is_query(query, operation_name):
+        try:
+            operation = get_operation_ast(parse(query), operation_name)
+        except Exception:
+            return False
+        return operation is not None and operation.operation == OperationType.QUERY
+
+    def check_throttles(self, request, query, operation_name):
+        try:
+            document = parse(query)
+        except Exception:
+            return  # graphene reports the syntax error
+
+        throttle = GraphQLThrottle()
+        cost = graphql_query_cost(self.schema.graphql_schema, document, operation_name)
+        if cost > throttle.capacity():
+            raise HttpError(
+                HttpResponseBadRequest(),
+                ERROR_GRAPHQL_QUERY_TOO_EXPENSIVE.format(
+                    cost=cost, limit=throttle.capacity()
+                ),
+            )
+
+        self.get_context(request)  # JWT user: the bucket is per user
+        throttles = [
+            SCOPED_THROTTLES[name]()
+            for name in graphql_root_fields(document, operation_name)
+            if name in SCOPED_THROTTLES
+        ]
+        for scoped in throttles:
+            if not scoped.allow_request(request, self):
+                self.throttled(scoped.wait())
+        if not throttle.allow_query(request, cost):
+            self.throttled(throttle.wait())
+
+    @staticmethod
+    def throttled(wait):
+        wait = math.ceil(wait)
+        response = HttpResponse(status=TOO_MANY_REQUESTS)
+        response["Retry-After"] = str(wait)
+        raise HttpError(response, ERROR_GRAPHQL_THROTTLED.format(wait=wait))
+
+
+class AsyncGraphQLView(CustomGraphQLView):
+    # Resolvers (and graphene-django) are synchronous, so queries run in the
+    # thread pool without pinning the event loop; mutations keep the single
+    # thread-sensitive executor so transactions behave as in the WSGI view.
+
+    async def get(self, request, *args, **kwargs):  # Marks the view as async
+        return await self.dispatch(request, *args, **kwargs)
+
+    post = get
+
+    async def dispatch(self, request, *args, **kwargs):
+        if self.is_query_request(request):
+            execute = sync_to_async(self.dispatch_query, thread_sensitive=False)
+        else:
+            execute = sync_to_async(super().dispatch)
+        return await execute(request, *args, **kwargs)
+
+    def dispatch_query(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            # Worker threads don't get request_started/finished signals
+            close_old_connections()
+
+    def is_query_request(self, request):
+        try:
+            data = self.parse_body(request)
+            query, _, operation_name, _ = self.get_graphql_params(request, data)
+        except Exception:
+            return False
+        return self.is_query(query, operation_name)
@@ -0,0 +1,282 @@
+"""
+Latency, throughput and query counts of every read route (REST and GraphQL).
+
+Seeds a throwaway test database with blogs, posts and tags (blog_app.seeding,
+as ``manage.py seed``), then requests each route as the owner of one blog
+and reports p50/p90/p99 latency, throughput and queries per request. Write
+routes are left out: they would change the data being measured.
+
+    python -m benchmarks.bench_endpoints --blogs 2000 --posts-per-blog 500
+    python -m benchmarks.bench_endpoints --save-baseline   # after a wanted change
+    python -m benchmarks.bench_endpoints --check           # exit 1 on regressions
+
+Baselines are stored per machine in benchmarks/baselines/endpoints.json: a
+route regresses when it runs more queries than its baseline or its median is
+slower than the baseline by more than --tolerance (and by more than 1 ms: the
+tails are reported but too noisy to gate on).
+
+With --base-url the same routes are load tested (benchmarks.loadtest) against
+a running server instead; its database must be seeded beforehand
+(``manage.py seed``) and its THROTTLE_RATE_* raised, as done here for the in-process run.
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "blog.settings.dev")
+# The benchmark is the only client: don't let the token buckets answer 429
+for scope in ("USER", "ANON", "GRAPHQL"):
+    os.environ.setdefault(f"THROTTLE_RATE_{scope}", "100000000/s")
+os.environ.setdefault("QUERY_REPEAT_DETECTION", "off")
+os.environ.setdefault("CHANGE_FEED_SETTLE_SECONDS", "0")  # Rows were just seeded
+
+import django  # noqa: E402
+
+
+django.setup()
+
+from rest_framework_simplejwt.tokens import (  # noqa: E402  # pyright: ignore[reportMissingImports]
+    AccessToken,
+)
+
+from graphql_jwt.shortcuts import (  # noqa: E402  # pyright: ignore[reportMissingImports]
+    get_token,
+)
+
+from benchmarks.loadtest import percentile, run_load  # noqa: E402
+from blog_app.models import Blog  # noqa: E402
+from blog_app.seeding import DISTRIBUTIONS, seed_data  # noqa: E402
+
+from django.db import connection  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import (  # noqa: E402
+    CaptureQueriesContext,
+    setup_test_environment,
+)
+
+
+BASELINE = Path(__file__).parent / "baselines" / "endpoints.json"
+
+ROUTES = {
+    "GET /api/blogs/": "/api/blogs/",
+    "GET /api/blogs/<id>/": "/api/blogs/{blog}/",
+    "GET /api/posts/": "/api/posts/",
+    "GET /api/posts/?fields=id,title": "/api/posts/?fields=id,title",
+    "GET /api/posts/<id>/": "/api/posts/{post}/",
+    "GET /api/tags/": "/api/tags/",
+    "GET /api/tags/<id>/": "/api/tags/{tag}/",
+    "GET /api/changes/": "/api/changes/",
+    "GET /api/async/blogs/": "/api/async/blogs/",
+    "GET /api/async/posts/": "/api/async/posts/",
+    "GET /api/async/tags/": "/api/async/tags/",
+    "GET /api/public/blogs/<slug>/": "/api/public/blogs/{slug}/",
+    "GET /api/public/blogs/<slug>/posts/": "/api/public/blogs/{slug}/posts/",
+    "GET /api/public/blogs/<slug>/posts/<id>/": (
+        "/api/public/blogs/{slug}/posts/{post}/"
+    ),
+}
+GRAPHQL_QUERIES = {
+    "allPosts": "{ allPosts { id title excerpt tags { name } } }",
+    "allBlogs": "{ allBlogs { title posts { id title } } }",
+    "allTags": "{ allTags { name posts { id } } }",
+    "changes": "{ changes(limit: 100) { next changes { token action post { id } } } }",
+}
+
+
+# --- Data ---
+def first_blog():
+    # The requests are made as its owner
+    return Blog.objects.select_related("user").order_by("id").first()
+
+
+def route_urls(blog):
+    ids = {
+        "blog": blog.id,
+        "slug": blog.slug,
+        "post": blog.posts.values_list("id", flat=True).first(),
+        "tag": blog.tags.values_list("id", flat=True).first(),
+    }
+    urls = {name: ("GET", url.format(**ids)) for name, url in ROUTES.items()}
+    for name, query in GRAPHQL_QUERIES.items():
+        urls[f"POST /graphql/ {name}"] = ("POST", json.dumps({"query": query}))
+    return urls
+
+
+# --- Measurements ---
+def measure(client, method, target, requests):
+    latencies, queries = [], 0
+    for _ in range(requests):
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            if method == "GET":
+                response = client.get(target)
+            else:
+                response = client.post(
+                    "/graphql/", target, content_type="application/json"
+                )
+            latencies.append((time.perf_counter() - start) * 1000)
+        if response.status_code != 200 or (  # noqa: PLR2004
+            method == "POST" and "errors" in response.json()
+        ):
+            raise RuntimeError(f"{method} {target}: {response.content[:200]}")
+        queries = len(captured)
+    return {
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p90_ms": round(percentile(latencies, 90), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "throughput_rps": round(1000 * len(latencies) / sum(latencies), 1),
+        "queries": queries,
+    }
+
+
+def auth_headers(user):
+    # REST authenticates with simplejwt tokens, GraphQL with django-graphql-jwt's
+    return {
+        "GET": {"Authorization": f"Bearer {AccessToken.for_user(user)}"},
+        "POST": {"Authorization": f"Bearer {get_token(user)}"},
+    }
+
+
+def run_in_process(blog, requests):
+    clients = {
+        method: Client(headers=headers)
+        for method, headers in auth_headers(blog.user).items()
+    }
+    results = {}
+    for name, (method, target) in route_urls(blog).items():
+        measure(clients[method], method, target, 1)  # warm-up
+        results[name] = measure(clients[method], method, target, requests)
+    return results
+
+
+def run_against_server(base_url, blog, requests, concurrency):
+    headers = auth_headers(blog.user)
+    results = {}
+    for name, (method, target) in route_urls(blog).items():
+        if method == "GET":
+            stats = run_load(
+                base_url + target,
+                requests,
+                concurrency,
+                {"Accept": "application/json", **headers["GET"]},
+            )
+        else:
+            stats = run_load(
+                f"{base_url}/graphql/",
+                requests,
+                concurrency,
+                {"Content-Type": "application/json", **headers["POST"]},
+                target.encode(),
+            )
+        results[name] = {
+            key: stats[key]
+            for key in ("p50_ms", "p90_ms", "p99_ms", "throughput_rps", "errors")
+        }
+    return results
+
+
+# --- Baselines ---
+def compare(results, baseline, tolerance):
+    """Regressions against ``baseline``: more queries or a slower median."""
+    regressions = []
+    for name, stats in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if stats.get("queries", 0) > before.get("queries", 0):
+            regressions.append(
+                f"{name}: {stats['queries']} queries (baseline {before['queries']})"
+            )
+        allowed = max(before["p50_ms"] * (1 + tolerance), before["p50_ms"] + 1)
+        if stats["p50_ms"] > allowed:
+            regressions.append(
+                f"{name}: p50 {stats['p50_ms']} ms (baseline {before['p50_ms']} ms)"
+            )
+    return regressions
+
+
+def print_table(results):
+    print(
+        f"{'route':<48}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}"
+        f"{'req/s':>9}{'queries':>9}"
+    )
+    for name, stats in results.items():
+        print(
+            f"{name:<48}{stats['p50_ms']:>9}{stats['p90_ms']:>9}{stats['p99_ms']:>9}"
+            f"{stats['throughput_rps']:>9}{stats.get('queries', '-'):>9}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blogs", type=int, default=200)
+    parser.add_argument("--posts-per-blog", type=int, default=50)
+    parser.add_argument("--tags-per-blog", type=int, default=20)
+    parser.add_argument("--tags-per-post", type=int, default=3)
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--requests", type=int, default=50, help="per route")
+    parser.add_argument("--concurrency", type=int, default=20, help="--base-url")
+    parser.add_argument("--base-url", help="load test a running server instead")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true", help="exit 1 on regressions")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.5, help="allowed median slowdown"
+    )
+    args = parser.parse_args()
+    sizes = {
+        "blogs": args.blogs,
+        "posts_per_blog": args.posts_per_blog,
+        "tags_per_blog": args.tags_per_blog,
+        "tags_per_post": args.tags_per_post,
+        "distribution": args.distribution,
+        "mode": "server" if args.base_url else "in-process",
+    }
+
+    if args.base_url:
+        results = run_against_server(
+            args.base_url.rstrip("/"), first_blog(), args.requests, args.concurrency
+        )
+    else:
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0)
+        try:
+            start = time.perf_counter()
+            seed_data(
+                args.blogs,
+                args.posts_per_blog,
+                args.tags_per_blog,
+                args.tags_per_post,
+                distribution=args.distribution,
+            )
+            print(f"Seeded in {time.perf_counter() - start:.1f} s")
+            results = run_in_process(first_blog(), args.requests)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+    print_table(results)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(exist_ok=True)
+        args.baseline.write_text(
+            # Sorted keys: the form the pretty-format-json hook leaves it in
+            json.dumps({"sizes": sizes, "routes": results}, indent=2, sort_keys=True)
+            + "\n"
+        )
+        print(f"Baseline saved to {args.baseline}")
+    elif args.check:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline["sizes"] != sizes:
+            sys.exit(f"Baseline was measured with {baseline['sizes']}, not {sizes}")
+        regressions = compare(results, baseline["routes"], args.tolerance)
+        if regressions:
+            sys.exit("Regressions:\n  " + "\n  ".join(regressions))
+        print("No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
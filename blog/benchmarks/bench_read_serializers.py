@@ -0,0 +1,120 @@
+"""
+Per-row cost of the list serializers: ModelSerializer vs values() read serializer.
+
+Creates a throwaway test database, seeds one blog with N posts (and a few tags
+per post), then times the whole list rendering (queries included) of
+PostSerializer/TagSerializer over prefetched instances against
+PostReadSerializer/TagReadSerializer over .values() rows.
+
+    python -m benchmarks.bench_read_serializers --sizes 100 1000 5000
+"""
+
+import argparse
+import os
+import time
+
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "blog.settings.dev")
+
+import django  # noqa: E402
+
+
+django.setup()
+
+from blog_app.models import Blog, Post, Tag  # noqa: E402
+from blog_app.read_serializers import (  # noqa: E402
+    PostReadSerializer,
+    TagReadSerializer,
+)
+from blog_app.serializers import PostSerializer, TagSerializer  # noqa: E402
+from blog_app.utils.helpers import POST_PKS, POST_TAGS_PREFETCH  # noqa: E402
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.db.models import Prefetch  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+
+
+TAGS = 10
+TAGS_PER_POST = 3
+PARAGRAPH = "<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>" * 20
+
+
+def seed(count):
+    Blog.objects.all().delete()
+    user, _ = User.objects.get_or_create(username="benchmark")
+    blog = Blog.objects.create(user=user, title="Benchmark")
+    tags = Tag.objects.bulk_create(Tag(blog=blog, name=f"tag{i}") for i in range(TAGS))
+    posts = Post.objects.bulk_create(
+        Post(blog=blog, title=f"Post {i}", content=PARAGRAPH) for i in range(count)
+    )
+    Tag.posts.through.objects.bulk_create(
+        Tag.posts.through(post_id=post.id, tag_id=tags[(i + j) % TAGS].id)
+        for i, post in enumerate(posts)
+        for j in range(TAGS_PER_POST)
+    )
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(sizes, repeat):
+    cases = {
+        "posts": (
+            lambda: PostSerializer(
+                Post.objects.select_related("blog__user").prefetch_related(
+                    *POST_TAGS_PREFETCH
+                ),
+                many=True,
+            ).data,
+            lambda: PostReadSerializer().serialize(Post.objects.all()),
+        ),
+        "tags": (
+            lambda: TagSerializer(
+                Tag.objects.select_related("blog__user").prefetch_related(
+                    Prefetch("posts", queryset=POST_PKS)
+                ),
+                many=True,
+            ).data,
+            lambda: TagReadSerializer().serialize(Tag.objects.all()),
+        ),
+    }
+    print(
+        f"{'case':<8}{'posts':>7}{'model ms':>10}{'values ms':>11}"
+        f"{'model µs/row':>14}{'values µs/row':>15}{'speedup':>9}"
+    )
+    for size in sizes:
+        seed(size)
+        for name, (model_case, values_case) in cases.items():
+            rows = size if name == "posts" else TAGS
+            model = best_of(repeat, model_case)
+            values = best_of(repeat, values_case)
+            print(
+                f"{name:<8}{size:>7}{model * 1000:>10.1f}{values * 1000:>11.1f}"
+                f"{model * 1e6 / rows:>14.1f}{values * 1e6 / rows:>15.1f}"
+                f"{model / values:>8.1f}x"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        run(args.sizes, args.repeat)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Serialization micro-benchmark: PostSerializer/BlogSerializer on large lists.
+
+Builds in-memory instances (no database), then measures, per list size,
+the time and peak allocations of to_representation and of the JSON encode
+with DRF's stdlib JSONRenderer and with ORJSONRenderer.
+
+    python -m benchmarks.bench_serializers --sizes 100 1000 5000
+"""
+
+import argparse
+import os
+import time
+import tracemalloc
+
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "blog.settings.dev")
+
+import django  # noqa: E402
+
+
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from blog_app.models import Blog, Post, Tag  # noqa: E402
+from blog_app.renderers import ORJSONRenderer  # noqa: E402
+from blog_app.serializers import BlogSerializer, PostSerializer  # noqa: E402
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+
+TAGS_PER_POST = 3
+PARAGRAPH = "<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>" * 20
+
+
+def build_posts(count):
+    now = timezone.now()
+    user = User(id=1, username="benchmark")
+    blog = Blog(id=1, user=user, title="Benchmark", slug="benchmark")
+    tags = [Tag(id=i, blog=blog, name=f"tag{i}") for i in range(TAGS_PER_POST)]
+    for tag in tags:
+        tag._prefetched_objects_cache = {"posts": []}
+
+    posts = []
+    for i in range(count):
+        post = Post(
+            id=i + 1,
+            blog=blog,
+            title=f"Post {i}",
+            content=PARAGRAPH,
+            content_html=PARAGRAPH,
+            excerpt=PARAGRAPH[:280],
+            reading_time=1,
+            status=Post.Status.PUBLISHED,
+            published_at=now,
+            created_at=now,
+            updated_at=now,
+        )
+        post._prefetched_objects_cache = {"tags": tags}  # As if prefetched
+        posts.append(post)
+    blog._prefetched_objects_cache = {"posts": posts}
+    return blog, posts
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed * 1000, peak / 1024
+
+
+def run(sizes, repeat):
+    renderers = {"json": JSONRenderer(), "orjson": ORJSONRenderer()}
+    print(f"{'case':<28}{'rows':>7}{'ms':>10}{'peak KiB':>11}{'bytes':>11}")
+    for size in sizes:
+        blog, posts = build_posts(size)
+        cases = {
+            "PostSerializer(many)": lambda: PostSerializer(posts, many=True).data,
+            "BlogSerializer(posts)": lambda: BlogSerializer(blog).data,
+        }
+        for name, serialize in cases.items():
+            data, ms, peak = min(
+                (measure(serialize) for _ in range(repeat)), key=lambda r: r[1]
+            )
+            print(f"{name:<28}{size:>7}{ms:>10.1f}{peak:>11.0f}{'':>11}")
+            for label, renderer in renderers.items():
+                body, ms, peak = min(
+                    (measure(lambda: renderer.render(data)) for _ in range(repeat)),
+                    key=lambda r: r[1],
+                )
+                print(
+                    f"  encode {label:<19}{size:>7}{ms:>10.1f}{peak:>11.0f}{len(body):>11}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    args = parser.parse_args()
+    run(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
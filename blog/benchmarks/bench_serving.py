@@ -0,0 +1,161 @@
+"""
+Throughput, latency, boot time and memory of the gunicorn worker profiles.
+
+Seeds a throwaway SQLite database (blog_app.seeding), then starts gunicorn
+with gunicorn.conf.py once per SERVER_WORKER_CLASS, all with the same number
+of workers, and load tests the same public routes (benchmarks.loadtest).
+Boot time is measured until the first successful response; memory is the
+proportional set size (PSS, Linux only) of the master and its workers.
+
+    python -m benchmarks.bench_serving
+    python -m benchmarks.bench_serving --profiles gthread uvicorn --workers 4
+    python -m benchmarks.bench_serving --no-preload   # compare with preload_app
+"""
+
+import argparse
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+PROFILES = ("sync", "gthread", "uvicorn")
+DATABASE = Path(tempfile.gettempdir()) / "bench_serving.sqlite3"
+SERVER_ENV = {
+    "DJANGO_SETTINGS_MODULE": "blog.settings.prod",
+    "DJANGO_SECRET_KEY": "bench-serving",
+    "DJANGO_ALLOWED_HOSTS": "127.0.0.1,localhost",
+    "DATABASE_URL": f"sqlite:///{DATABASE}",
+    "QUERY_REPEAT_DETECTION": "off",
+    # The benchmark is the only client: don't let the token buckets answer 429
+    **{f"THROTTLE_RATE_{scope}": "100000000/s" for scope in ("USER", "ANON")},
+}
+ROUTES = {
+    "blog": "/api/public/blogs/{slug}/",
+    "posts": "/api/public/blogs/{slug}/posts/",
+    "post": "/api/public/blogs/{slug}/posts/{post}/",
+}
+BOOT_TIMEOUT = 60  # seconds
+
+os.environ.update(SERVER_ENV)
+
+import django  # noqa: E402
+
+
+django.setup()
+
+from benchmarks.loadtest import run_load  # noqa: E402
+from blog_app.models import Blog  # noqa: E402
+from blog_app.seeding import seed_data  # noqa: E402
+
+from django.core.management import call_command  # noqa: E402
+from django.db import connections  # noqa: E402
+
+
+def seed_database(blogs, posts_per_blog):
+    connections.close_all()  # Opened by django.setup(): start from a new file
+    DATABASE.unlink(missing_ok=True)
+    call_command("migrate", verbosity=0)
+    seed_data(blogs, posts_per_blog, tags_per_blog=10, tags_per_post=3)
+    blog = Blog.objects.order_by("id").first()
+    post = blog.posts.order_by("id").values_list("id", flat=True).first()
+    return {name: url.format(slug=blog.slug, post=post) for name, url in ROUTES.items()}
+
+
+def process_tree_pss_mb(pid):
+    """PSS of ``pid`` and its children in MB, or None off Linux."""
+    children_file = Path(f"/proc/{pid}/task/{pid}/children")
+    if not children_file.exists():
+        return None
+    pids = [pid, *map(int, children_file.read_text().split())]
+    total_kb = 0
+    for process_id in pids:
+        for line in Path(f"/proc/{process_id}/smaps_rollup").read_text().splitlines():
+            if line.startswith("Pss:"):
+                total_kb += int(line.split()[1])
+    return round(total_kb / 1024, 1)
+
+
+def wait_until_up(url, server):
+    start = time.perf_counter()
+    while time.perf_counter() - start < BOOT_TIMEOUT:
+        if server.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with code {server.returncode}")
+        try:
+            with urllib.request.urlopen(url) as response:  # noqa: S310
+                if response.status == 200:  # noqa: PLR2004
+                    return time.perf_counter() - start
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(0.05)
+    raise RuntimeError(f"{url} did not answer in {BOOT_TIMEOUT} s")
+
+
+def run_profile(profile, urls, args):
+    base_url = f"http://127.0.0.1:{args.port}"
+    env = {
+        **os.environ,
+        "SERVER_WORKER_CLASS": profile,
+        "PORT": str(args.port),
+        "WEB_CONCURRENCY": str(args.workers),
+        "GUNICORN_PRELOAD": str(not args.no_preload),
+    }
+    server = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py"],
+        cwd=PROJECT_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        boot_s = wait_until_up(base_url + urls["blog"], server)
+        results = {}
+        for name, url in urls.items():
+            stats = run_load(base_url + url, args.requests, args.concurrency)
+            results[name] = {
+                key: stats[key]
+                for key in ("throughput_rps", "p50_ms", "p99_ms", "errors")
+            }
+        memory_mb = process_tree_pss_mb(server.pid)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    return {"boot_s": round(boot_s, 2), "memory_mb": memory_mb, "routes": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profiles", nargs="+", choices=PROFILES, default=PROFILES)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--no-preload", action="store_true")
+    parser.add_argument("--blogs", type=int, default=50)
+    parser.add_argument("--posts-per-blog", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=500, help="per route")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    urls = seed_database(args.blogs, args.posts_per_blog)
+    results = {profile: run_profile(profile, urls, args) for profile in args.profiles}
+
+    print(
+        f"{'profile':<10}{'route':<8}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}"
+        f"{'errors':>8}{'boot s':>8}{'PSS MB':>8}"
+    )
+    for profile, stats in results.items():
+        for name, route in stats["routes"].items():
+            print(
+                f"{profile:<10}{name:<8}{route['throughput_rps']:>9}"
+                f"{route['p50_ms']:>9}{route['p99_ms']:>9}{route['errors']:>8}"
+                f"{stats['boot_s']:>8}{stats['memory_mb'] or '-':>8}"
+            )
+    DATABASE.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
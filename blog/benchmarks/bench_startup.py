@@ -0,0 +1,123 @@
+"""
+Worker startup time per process profile (PROCESS_PROFILE), from -X importtime.
+
+Each run is a fresh interpreter doing what a gunicorn worker does before its
+first request: import the WSGI application (django.setup(), middleware) and
+load the URLconf. Reports the median wall time, the total import time, the
+modules imported and the packages that took longest to import in the last run.
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --runs 20 --top 20 --profile api
+"""
+
+import argparse
+from collections import Counter
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import time
+
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+PROFILES = ("full", "api")
+STARTUP = (
+    "import sys, blog.wsgi; "
+    "from django.urls import get_resolver; "
+    "get_resolver().url_patterns; "
+    "print(*sorted(sys.modules))"  # importtime misses modules imported by Django
+)
+# Stacks the api profile is meant to keep out of the workers
+STACKS = {
+    "admin": "blog_app.admin",  # DRF imports django.contrib.admin regardless
+    "import_export": "import_export",
+    "tinymce": "tinymce",
+    "drf_yasg": "drf_yasg",
+    "graphene": "graphene",
+}
+
+
+def parse_importtime(stderr):
+    """``[(module, self_us)]`` from -X importtime output."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        imports.append((name.strip(), int(self_us)))
+    return imports
+
+
+def package_times(imports):
+    """``[(package, ms)]``, slowest first: own import time of its modules."""
+    totals = Counter()
+    for name, self_us in imports:
+        totals[name.split(".")[0]] += self_us / 1000
+    return totals.most_common()
+
+
+def start_worker(profile):
+    env = {
+        **os.environ,
+        "PROCESS_PROFILE": profile,
+        "DJANGO_SETTINGS_MODULE": os.environ.get(
+            "DJANGO_SETTINGS_MODULE", "blog.settings.dev"
+        ),
+    }
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP],
+        cwd=PROJECT_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    return wall_ms, parse_importtime(result.stderr), result.stdout.split()
+
+
+def measure(profile, runs):
+    walls, import_totals = [], []
+    for _ in range(runs):
+        wall_ms, imports, modules = start_worker(profile)
+        walls.append(wall_ms)
+        import_totals.append(sum(self_us for _, self_us in imports) / 1000)
+    return {
+        "wall_ms": round(statistics.median(walls), 1),
+        "imports_ms": round(statistics.median(import_totals), 1),
+        "modules": len(modules),
+        "stacks": [
+            stack
+            for stack, module in STACKS.items()
+            if any(name == module or name.startswith(f"{module}.") for name in modules)
+        ],
+        "packages": package_times(imports),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="packages listed")
+    parser.add_argument("--profile", choices=PROFILES, action="append")
+    args = parser.parse_args()
+
+    results = {
+        profile: measure(profile, args.runs) for profile in args.profile or PROFILES
+    }
+    print(f"{'profile':<10}{'wall ms':>10}{'imports ms':>12}{'modules':>9}  stacks")
+    for profile, stats in results.items():
+        print(
+            f"{profile:<10}{stats['wall_ms']:>10}{stats['imports_ms']:>12}"
+            f"{stats['modules']:>9}  {', '.join(stats['stacks']) or '-'}"
+        )
+    for profile, stats in results.items():
+        print(f"\nSlowest packages to import ({profile}):")
+        for package, import_ms in stats["packages"][: args.top]:
+            print(f"  {import_ms:>8.1f} ms  {package}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Concurrent HTTP load generator (stdlib only).
+
+Compare the WSGI and ASGI deployments against the same database:
+
+    gunicorn blog.wsgi:application --workers 3 --bind 127.0.0.1:8001
+    uvicorn blog.asgi:application --workers 3 --port 8002
+
+    python -m benchmarks.loadtest http://127.0.0.1:8001/api/posts/ --token <jwt>
+    python -m benchmarks.loadtest http://127.0.0.1:8002/api/async/posts/ --token <jwt>
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+import statistics
+import time
+import urllib.error
+import urllib.request
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def timed_request(url, headers=None, data=None):
+    request = urllib.request.Request(url, data=data, headers=headers or {})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request) as response:  # noqa: S310
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except urllib.error.URLError:
+        status = 0
+    return status, time.perf_counter() - start
+
+
+def run_load(url, requests=500, concurrency=20, headers=None, data=None):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(
+            pool.map(lambda _: timed_request(url, headers, data), range(requests))
+        )
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency * 1000 for _, latency in results]
+    errors = sum(1 for status, _ in results if not 200 <= status < 400)  # noqa: PLR2004
+    return {
+        "url": url,
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "throughput_rps": round(requests / elapsed, 1),
+        "mean_ms": round(statistics.fmean(latencies), 2),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p90_ms": round(percentile(latencies, 90), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("url")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--token", help="JWT access token (Authorization: Bearer)")
+    parser.add_argument("--graphql", help="GraphQL query to POST instead of a GET")
+    args = parser.parse_args()
+
+    headers = {"Accept": "application/json"}
+    if args.token:
+        headers["Authorization"] = f"Bearer {args.token}"
+    data = None
+    if args.graphql:
+        headers["Content-Type"] = "application/json"
+        data = json.dumps({"query": args.graphql}).encode()
+
+    stats = run_load(args.url, args.requests, args.concurrency, headers, data)
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -46,7 +46,25 @@ INSTALLED_APPS = [
     "auth_app",
 ]
 
+# Process profile: "full" (default) or "api" for API-only workers, which boot
+# without the admin, its widgets, the API docs and GraphiQL (see blog/urls.py)
+PROCESS_PROFILE = os.getenv("PROCESS_PROFILE", "full")
+API_ONLY_EXCLUDED_APPS = [
+    "django.contrib.admin",
+    "import_export",
+    "tinymce",
+    "drf_yasg",
+    "graphene_django",  # Only GraphiQL's templates; graphene loads on first query
+]
+if PROCESS_PROFILE == "api":
+    INSTALLED_APPS = [
+        app for app in INSTALLED_APPS if app not in API_ONLY_EXCLUDED_APPS
+    ]
+GRAPHIQL = PROCESS_PROFILE != "api"
+
 MIDDLEWARE = [
+    # Server-Timing header and /metrics (first, to time the whole stack)
+    "blog_app.instrumentation.InstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     # Whitenoise para servir archivos estáticos en producción
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -69,8 +87,12 @@ STORAGES = {
 
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": (
-        "rest_framework.renderers.JSONRenderer",
-        "rest_framework.renderers.BrowsableAPIRenderer",  # interfaz web interactiva
+        "blog_app.renderers.ORJSONRenderer",  # JSON con orjson (más rápido)
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "blog_app.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ),
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticatedOrReadOnly"  # Ver contenido sin estar logueado. Crear/editar si se está autenticado
@@ -79,15 +101,96 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",  # JWT para API
         "rest_framework.authentication.SessionAuthentication",  # para dev/admin
     ],
+    # Proxies in front of the app (Railway: 1). Throttles key anonymous clients
+    # by the address that many hops back in X-Forwarded-For; 0 = REMOTE_ADDR,
+    # so a client-supplied header can never pick a fresh bucket
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", "0")),
+    # Token buckets in the default cache (auth_app.throttling)
+    "DEFAULT_THROTTLE_CLASSES": ["auth_app.throttling.TokenBucketThrottle"],
+    "DEFAULT_THROTTLE_RATES": {
+        "user": os.getenv("THROTTLE_RATE_USER", "600/min"),
+        "anon": os.getenv("THROTTLE_RATE_ANON", "120/min"),
+        "login": os.getenv("THROTTLE_RATE_LOGIN", "10/min"),  # /api/token/
+        "register": os.getenv("THROTTLE_RATE_REGISTER", "5/min"),
+        "graphql": os.getenv("THROTTLE_RATE_GRAPHQL", "3000/min"),  # cost points
+    },
 }
 
 GRAPHENE = {
     "SCHEMA": "blog_app.schema.schema",  # ruta al schema principal
     "MIDDLEWARE": [
         "graphql_jwt.middleware.JSONWebTokenMiddleware",  # Habilita autenticación JWT en GraphQL
+        "blog_app.instrumentation.ResolverTimingMiddleware",
     ],
 }
 
+# Shared cache: the throttle buckets, the replica pin, the tag index and feed
+# versions and the idempotency locks must be seen by every worker, so
+# production points CACHE_URL (or REDIS_URL) to Redis. Without it each process
+# gets its own local-memory cache, which is only fine for dev and tests.
+# Hits/misses are counted per request whatever the backend
+# (blog_app.instrumentation.InstrumentedCache)
+CACHE_URL = os.getenv("CACHE_URL") or os.getenv("REDIS_URL", "")
+CACHES = {
+    "default": {
+        "BACKEND": "blog_app.instrumentation.InstrumentedCache",
+        "LOCATION": CACHE_URL,
+        "OPTIONS": {
+            "BACKEND": (
+                "django.core.cache.backends.redis.RedisCache"
+                if CACHE_URL
+                else "django.core.cache.backends.locmem.LocMemCache"
+            ),
+        },
+    },
+}
+
+# Instrumentation: Server-Timing response header and Prometheus /metrics
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "False").lower() == "true"
+METRICS_TOKEN = os.getenv(
+    "METRICS_TOKEN", ""
+)  # Bearer token for /metrics (404 if unset)
+# N+1 detector: "off", "log" or "raise" when a request repeats a query shape
+QUERY_REPEAT_DETECTION = os.getenv("QUERY_REPEAT_DETECTION", "off")
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", "3"))
+
+# Public (anonymous) read API: cached by the CDN/shared caches
+PUBLIC_CACHE_MAX_AGE = int(os.getenv("PUBLIC_CACHE_MAX_AGE", "60"))  # browsers
+PUBLIC_CACHE_S_MAXAGE = int(os.getenv("PUBLIC_CACHE_S_MAXAGE", "300"))  # CDN
+PUBLIC_CACHE_STALE_WHILE_REVALIDATE = 600  # Serve stale while refetching
+PUBLIC_CACHE_STALE_IF_ERROR = 86400  # Serve stale if the origin is down
+# Purge by surrogate key (Fastly compatible API). Empty = purging disabled
+CDN_PURGE_URL = os.getenv("CDN_PURGE_URL", "")
+CDN_PURGE_TOKEN = os.getenv("CDN_PURGE_TOKEN", "")
+
+# Change feed (/api/changes/): entries younger than this are held back so that
+# transactions committing out of token order are not skipped by the clients
+CHANGE_FEED_SETTLE_SECONDS = float(os.getenv("CHANGE_FEED_SETTLE_SECONDS", "1"))
+
+# Read replica (blog_app.db_routing): REST reads and GraphQL queries use this
+# alias when DATABASES defines it; after writing, a user reads from the primary
+# for REPLICA_PIN_SECONDS so the replication lag never hides their own changes
+DATABASE_ROUTERS = ["blog_app.db_routing.ReplicaRouter"]
+REPLICA_DATABASE = "replica"
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", "5"))
+
+# Post view counters (blog_app.view_counts): each worker buffers the views and
+# writes them every VIEW_COUNT_FLUSH_INTERVAL seconds (0 = on every view)
+VIEW_COUNT_FLUSH_INTERVAL = float(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", "10"))
+
+# Related posts (blog_app.related): how many are precomputed per post
+RELATED_POSTS_LIMIT = int(os.getenv("RELATED_POSTS_LIMIT", "5"))
+
+# Idempotency-Key header / idempotencyKey argument: stored results live this long
+IDEMPOTENCY_KEY_TTL = int(os.getenv("IDEMPOTENCY_KEY_TTL", "86400"))  # seconds
+
+# OpenAPI document built by `manage.py generate_openapi` (blog_app.openapi);
+# generated on the first request instead when missing or out of date
+OPENAPI_SCHEMA_FILE = Path(os.getenv("OPENAPI_SCHEMA_FILE", BASE_DIR / "openapi.json"))
+SWAGGER_SETTINGS = {"SPEC_URL": "openapi-schema"}
+SWAGGER_USE_COMPAT_RENDERERS = False
+REDOC_SETTINGS = {"SPEC_URL": "openapi-schema"}
+
 ROOT_URLCONF = "blog.urls"
 
 TEMPLATES = [
@@ -8,6 +8,8 @@ from .base import BASE_DIR
 
 # DEBUG
 DEBUG = os.getenv("DJANGO_DEBUG", "True").lower() == "true"
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "True").lower() == "true"
+QUERY_REPEAT_DETECTION = os.getenv("QUERY_REPEAT_DETECTION", "log")
 
 
 # ALLOWED_HOSTS
@@ -19,6 +21,16 @@ else:
     ALLOWED_HOSTS = ["localhost", "127.0.0.1", "0.0.0.0"]
 
 
+# REST: interfaz web interactiva solo en desarrollo
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,  # noqa: F405
+    "DEFAULT_RENDERER_CLASSES": (
+        *REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"],  # noqa: F405
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+}
+
+
 # DATABASES
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{BASE_DIR / 'db.sqlite3'}")
 
@@ -31,3 +43,12 @@ if DATABASE_URL and DATABASE_URL.startswith("sqlite"):
     }
 else:  # Producción: PostgreSQL
     DATABASES = {"default": dj_database_url.parse(DATABASE_URL, conn_max_age=600)}
+
+# Réplica de lectura opcional (blog_app.db_routing). En local sirve otro SQLite
+# o la misma base de datos: REPLICA_DATABASE_URL=sqlite:///db.sqlite3
+REPLICA_DATABASE_URL = os.getenv("REPLICA_DATABASE_URL")
+if REPLICA_DATABASE_URL:
+    DATABASES["replica"] = {
+        **dj_database_url.parse(REPLICA_DATABASE_URL, conn_max_age=600),
+        "TEST": {"MIRROR": "default"},  # Los tests usan solo la principal
+    }
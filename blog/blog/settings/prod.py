@@ -26,6 +26,12 @@ CSRF_TRUSTED_ORIGINS = [
     "https://*.railway.app",  # *: Para incluir todos los subdominios de railway
 ]
 
+# Railway termina TLS en su proxy y añade la IP real al final de X-Forwarded-For
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,  # noqa: F405
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", "1")),
+}
+
 # SECRET_KEY
 SECRET_KEY = os.getenv("DJANGO_SECRET_KEY")
 if not SECRET_KEY:
@@ -44,6 +50,14 @@ else:
         }
     }
 
+# Réplica de lectura opcional (blog_app.db_routing)
+REPLICA_DATABASE_URL = os.getenv("REPLICA_DATABASE_URL")
+if REPLICA_DATABASE_URL:
+    DATABASES["replica"] = {
+        **dj_database_url.parse(REPLICA_DATABASE_URL, conn_max_age=600),
+        "TEST": {"MIRROR": "default"},  # Los tests usan solo la principal
+    }
+
 # Opcional: seguridad extra en producción
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
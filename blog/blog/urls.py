@@ -15,23 +15,69 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
-from auth_app.views_graphql import CustomGraphQLView
-from drf_yasg import openapi
-from drf_yasg.views import get_schema_view
-from rest_framework import permissions, routers
+import functools
+
+from auth_app.throttling import LoginRateThrottle
+from rest_framework import routers
 from rest_framework_simplejwt.views import (  # pyright: ignore[reportMissingImports]
     TokenObtainPairView,
     TokenRefreshView,
 )
 
-from blog.schema import schema
-from blog_app.api import BlogViewSet, PostViewSet, RegisterView, TagViewSet
+from blog_app.api import (
+    BlogViewSet,
+    ChangeFeedView,
+    PostViewSet,
+    RegisterView,
+    TagViewSet,
+)
+from blog_app.instrumentation import metrics_view
 
-from django.contrib import admin
+from django.conf import settings
 from django.urls import include, path
+from django.utils.module_loading import import_string
 from django.views.decorators.csrf import csrf_exempt
 
 
+def lazy_view(factory, is_async=False):
+    """The view returned by ``factory()`` (or a dotted path), built on first use.
+
+    Keeps the imports of rarely used stacks (GraphQL schema, API docs) out of
+    worker startup: they are paid by the first request that needs them.
+    """
+    if isinstance(factory, str):
+        factory = functools.partial(import_string, factory)
+    get_view = functools.cache(factory)
+
+    if is_async:
+
+        async def view(request, *args, **kwargs):
+            return await get_view()(request, *args, **kwargs)
+
+    else:
+
+        def view(request, *args, **kwargs):
+            return get_view()(request, *args, **kwargs)
+
+    return view
+
+
+def graphql_view():
+    from auth_app.views_graphql import CustomGraphQLView  # noqa: PLC0415
+
+    from blog.schema import schema  # noqa: PLC0415
+
+    return CustomGraphQLView.as_view(graphiql=settings.GRAPHIQL, schema=schema)
+
+
+def async_graphql_view():
+    from auth_app.views_graphql import AsyncGraphQLView  # noqa: PLC0415
+
+    from blog.schema import schema  # noqa: PLC0415
+
+    return AsyncGraphQLView.as_view(graphiql=settings.GRAPHIQL, schema=schema)
+
+
 # Crear router automáticamente
 router = routers.DefaultRouter()
 router.register(r"blogs", BlogViewSet, basename="blog")
@@ -40,39 +86,45 @@ router.register(r"tags", TagViewSet, basename="tag")
 
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
-    path("tinymce/", include("tinymce.urls")),
     path("api/", include(router.urls)),  # API REST
     path("api-auth/", include("rest_framework.urls")),  # Login for DRF
     path("api/register/", RegisterView.as_view(), name="register"),
+    path("api/changes/", ChangeFeedView.as_view(), name="change-feed"),  # Sync feed
+    path("metrics", metrics_view, name="metrics"),  # Prometheus
     path("", include("blog_app.urls")),  # Blog app urls
     # Endpoints JWT
-    path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
+    path(
+        "api/token/",
+        TokenObtainPairView.as_view(throttle_classes=[LoginRateThrottle]),
+        name="token_obtain_pair",
+    ),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     # GraphQL (does not use router)
+    path("graphql/", csrf_exempt(lazy_view(graphql_view))),
+    # GraphQL for ASGI workers: queries run off the event loop
     path(
-        "graphql/", csrf_exempt(CustomGraphQLView.as_view(graphiql=True, schema=schema))
+        "graphql/async/",
+        csrf_exempt(lazy_view(async_graphql_view, is_async=True)),
     ),
 ]
-# Generate the API documentation with Swagger
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Blog CMS API",
-        default_version="v1",
-        description="Documentación de la API del Blog CMS",
-        terms_of_service="https://www.google.com/policies/terms/",
-        contact=openapi.Contact(email="contacto@blogcms.com"),
-        license=openapi.License(name="MIT License"),
-    ),
-    public=True,
-    permission_classes=[permissions.AllowAny],
-)
 
-urlpatterns += [
-    path(
-        "swagger/",
-        schema_view.with_ui("swagger", cache_timeout=0),
-        name="schema-swagger-ui",
-    ),
-    path("redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
-]
+# Admin and API documentation: not served by API-only workers (PROCESS_PROFILE)
+if settings.PROCESS_PROFILE != "api":
+    from django.contrib import admin  # noqa: PLC0415
+
+    urlpatterns += [
+        path("admin/", admin.site.urls),
+        path("tinymce/", include("tinymce.urls")),
+        # The OpenAPI document is precomputed (blog_app.openapi)
+        path(
+            "openapi.json",
+            lazy_view("blog_app.openapi.openapi_view"),
+            name="openapi-schema",
+        ),
+        path(
+            "swagger/",
+            lazy_view("blog_app.openapi.swagger_view"),
+            name="schema-swagger-ui",
+        ),
+        path("redoc/", lazy_view("blog_app.openapi.redoc_view"), name="schema-redoc"),
+    ]
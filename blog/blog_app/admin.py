@@ -1,3 +1,5 @@
+import json
+
 from import_export import resources
 from import_export.admin import ImportExportModelAdmin
 from rest_framework.exceptions import PermissionDenied
@@ -9,21 +11,95 @@ from .models import Blog, Post, Tag
 
 from django.contrib import admin
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.core.paginator import Paginator
+from django.db import connections, models
+from django.utils.functional import cached_property
 
 
 User = get_user_model()
 
+# Above this many rows (planner estimate) the changelists show an estimated count
+ESTIMATED_COUNT_THRESHOLD = 10000
+
+
+def estimated_count(queryset):
+    """Row estimate of the PostgreSQL planner for ``queryset`` (None elsewhere)."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+class EstimatedCountPaginator(Paginator):
+    """Exact ``COUNT(*)`` for small results only: big tables use the estimate."""
+
+    @cached_property
+    def count(self):
+        estimate = estimated_count(self.object_list)
+        if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+            return estimate
+        return super().count
+
+
+class BlogListFilter(admin.RelatedFieldListFilter):
+    """Blog choices in one query (``Blog.__str__`` reads the user)."""
+
+    def field_choices(self, field, request, model_admin):  # noqa: PLR6301
+        blogs = Blog.objects.select_related("user").order_by("title")
+        if not request.user.is_superuser:
+            blogs = blogs.filter(user=request.user)
+        return [(blog.pk, str(blog)) for blog in blogs]
+
+
+class ChangeListMixin:
+    """Changelist settings shared by the blog, post and tag admins."""
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False  # No second, unfiltered COUNT(*) per page
+    date_hierarchy = "created_at"
+
+
+class SuperuserAutocompleteMixin:
+    """Search-as-you-type widgets for ``superuser_autocomplete_fields``.
+
+    Only for superusers: staff pick their own user/blog from a one-option
+    select. The choices come from the related admin's ``get_queryset``, so the
+    ownership filtering applies to the autocomplete results too.
+    """
+
+    superuser_autocomplete_fields = ()
+
+    def get_autocomplete_fields(self, request):
+        fields = super().get_autocomplete_fields(request)
+        if request.user.is_superuser:
+            return (*fields, *self.superuser_autocomplete_fields)
+        return fields
+
 
 # Define fields that can be exported or imported
 class PostResource(resources.ModelResource):
     class Meta:
         model = Post
-        fields = ("id", "title", "content", "created_at", "updated_at", "blog")
+        fields = (
+            "id",
+            "title",
+            "content",
+            "status",
+            "published_at",
+            "created_at",
+            "updated_at",
+            "blog",
+        )
 
 
 @admin.register(Blog)
-class BlogAdmin(admin.ModelAdmin):
+class BlogAdmin(SuperuserAutocompleteMixin, ChangeListMixin, admin.ModelAdmin):
     list_display = (
         "user",
         "title",
@@ -31,10 +107,14 @@ class BlogAdmin(admin.ModelAdmin):
         "created_at",
         "updated_at",
     )
+    list_select_related = ("user",)
+    search_fields = ("title", "user__username")  # Blog autocomplete
+    superuser_autocomplete_fields = ("user",)
 
     # Filter the blogs of the user (or all if superuser)
     def get_queryset(self, request):
-        queryset = super().get_queryset(request)
+        # Blog.__str__ reads the user (autocomplete results)
+        queryset = super().get_queryset(request).select_related("user")
         if request.user.is_superuser:
             return queryset
         return queryset.filter(user=request.user)
@@ -51,11 +131,21 @@ class BlogAdmin(admin.ModelAdmin):
 
 
 @admin.register(Post)
-class PostAdmin(ImportExportModelAdmin):
+class PostAdmin(SuperuserAutocompleteMixin, ChangeListMixin, ImportExportModelAdmin):
     # Link the import/export resource
     resource_class = PostResource
 
-    list_display = ("title", "blog", "created_at", "updated_at")
+    list_display = (
+        "title",
+        "blog",
+        "status",
+        "published_at",
+        "created_at",
+        "updated_at",
+    )
+    list_select_related = ("blog__user",)
+    list_filter = ("status", ("blog", BlogListFilter))
+    superuser_autocomplete_fields = ("blog",)
 
     search_fields = ("title", "content", "blog__title")
 
@@ -66,7 +156,8 @@ class PostAdmin(ImportExportModelAdmin):
 
     # Filter the posts of the user (or all if superuser)
     def get_queryset(self, request):
-        queryset = super().get_queryset(request)
+        # Post.__str__ reads the blog's user (autocomplete results)
+        queryset = super().get_queryset(request).select_related("blog__user")
         if request.user.is_superuser:
             return queryset
         return queryset.filter(blog__user=request.user)
@@ -103,8 +194,12 @@ class PostAdmin(ImportExportModelAdmin):
 
 # Admin tags
 @admin.register(Tag)
-class TagAdmin(admin.ModelAdmin):
+class TagAdmin(SuperuserAutocompleteMixin, ChangeListMixin, admin.ModelAdmin):
     list_display = ("name", "blog", "created_at", "updated_at")
+    list_select_related = ("blog__user",)
+    list_filter = (("blog", BlogListFilter),)
+    autocomplete_fields = ("posts",)  # Searched in PostAdmin, paginated
+    superuser_autocomplete_fields = ("blog",)
     search_fields = ("name", "blog__user__username")
 
     # Filter the tags of the user (or all if superuser)
@@ -134,9 +229,12 @@ class TagAdmin(admin.ModelAdmin):
 
     # Filter the posts visible in the form (ManyToMany)
     def formfield_for_manytomany(self, db_field, request, **kwargs):
-        if db_field.name == "posts" and not request.user.is_superuser:
-            kwargs["queryset"] = Post.objects.filter(
-                blog__user=request.user
-            )  # Filter the posts of the user
+        if db_field.name == "posts":
+            # The widget renders the selected posts only (with their blog's user)
+            kwargs["queryset"] = Post.objects.select_related("blog__user")
+            if not request.user.is_superuser:
+                kwargs["queryset"] = kwargs["queryset"].filter(
+                    blog__user=request.user
+                )  # Filter the posts of the user
 
         return super().formfield_for_manytomany(db_field, request, **kwargs)
@@ -1,16 +1,38 @@
-from auth_app.permissions import IsBlogOwnerOrAdmin, IsOwnerOrAdmin, is_superuser
+from auth_app.permissions import IsBlogOwnerOrAdmin, IsOwnerOrAdmin
+from auth_app.throttling import RegisterRateThrottle
 from rest_framework import generics, viewsets
+from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import AllowAny, IsAuthenticated
-
-from blog_app.utils.constants import ERROR_BLOG_USER_HAS_BLOG
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from blog_app.changes import get_changes, load_changed_objects
+from blog_app.db_routing import ReplicaReadsMixin
+from blog_app.deletion import soft_delete_blog
+from blog_app.idempotency import IdempotentCreateMixin
+from blog_app.read_serializers import (
+    BlogReadSerializer,
+    PostReadSerializer,
+    TagReadSerializer,
+    ValuesListMixin,
+)
+from blog_app.related import get_related_posts
+from blog_app.sparse import SparseFieldsetMixin
+from blog_app.tag_index import suggest_tags
 from blog_app.utils.helpers import (
+    BLOG_POSTS_PREFETCH,
+    POST_PKS,
+    POST_TAGS_PREFETCH,
+    get_blog_creation_error,
     get_or_create_tag,
     get_user_blog,
-    validate_posts_for_user,
+    get_visible_blogs,
+    get_visible_posts,
+    get_visible_tags,
 )
 
-from .models import Blog, Post, Tag
+from .models import Blog, Change, Post, Tag
 from .serializers import (
     BlogSerializer,
     PostSerializer,
@@ -19,74 +41,166 @@ from .serializers import (
 )
 
 from django.contrib.auth.models import User
+from django.db.models import Prefetch
 
 
-class BlogViewSet(viewsets.ModelViewSet):
+class BlogViewSet(
+    ReplicaReadsMixin,
+    IdempotentCreateMixin,
+    ValuesListMixin,
+    SparseFieldsetMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = BlogSerializer
+    read_serializer_class = BlogReadSerializer
     permission_classes = [IsOwnerOrAdmin]
+    sparse_prefetch_related = {"posts": [BLOG_POSTS_PREFETCH]}
 
     def get_queryset(self):
-        user = self.request.user
-        if user.is_superuser:
-            return Blog.objects.all()
-        return Blog.objects.filter(user=user)
+        if getattr(self, "swagger_fake_view", False):  # OpenAPI generation
+            return Blog.objects.none()
+        return get_visible_blogs(self.request.user)
 
     def perform_create(self, serializer):
         user = self.request.user
 
-        if Blog.objects.filter(user=user).exists():
-            raise PermissionDenied(ERROR_BLOG_USER_HAS_BLOG)
+        error = get_blog_creation_error(user)
+        if error:
+            raise PermissionDenied(error)
 
         serializer.save(user=user)
 
+    def perform_destroy(self, instance):  # noqa: PLR6301
+        # Soft delete: posts and tags are flagged, purge_deleted removes them
+        soft_delete_blog(instance)
 
-class PostViewSet(viewsets.ModelViewSet):
+
+class PostViewSet(
+    ReplicaReadsMixin,
+    IdempotentCreateMixin,
+    ValuesListMixin,
+    SparseFieldsetMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = PostSerializer
+    read_serializer_class = PostReadSerializer
     permission_classes = [IsBlogOwnerOrAdmin]
+    sparse_select_related = {"blog": ["blog__user"], "views": ["view_count"]}
+    sparse_prefetch_related = {"tags": POST_TAGS_PREFETCH}
+    excerpt_omit = ("content", "content_html")  # ?excerpt=true
 
     def get_queryset(self):
-        user = self.request.user
-        qs = Post.objects.all().select_related("blog")
-        if is_superuser(user):
-            return qs
-        return qs.filter(blog__user=user)
+        if getattr(self, "swagger_fake_view", False):  # OpenAPI generation
+            return Post.objects.none()
+        posts = get_visible_posts(self.request.user)
+        if self.request.query_params.get("live") in {"1", "true"}:
+            return posts.live()  # Only published posts (?live=true)
+        return posts
 
     def perform_create(self, serializer):
         blog = get_user_blog(self.request.user)
         serializer.save(blog=blog)
 
+    def perform_destroy(self, instance):  # noqa: PLR6301
+        instance.soft_delete()
 
-class TagViewSet(viewsets.ModelViewSet):
+    @action(detail=True)
+    def related(self, request, pk=None):
+        """Posts of the same blog with the most similar tags, best first."""
+        post = self.get_object()
+        serializer = self.read_serializer_class(**self.get_sparse_options())
+        return Response(serializer.serialize(get_related_posts(post.pk)))
+
+
+class TagViewSet(
+    ReplicaReadsMixin,
+    IdempotentCreateMixin,
+    ValuesListMixin,
+    SparseFieldsetMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = TagSerializer
+    read_serializer_class = TagReadSerializer
     permission_classes = [IsAuthenticated]
+    sparse_select_related = {"blog": ["blog__user"]}
+    sparse_prefetch_related = {"posts": [Prefetch("posts", queryset=POST_PKS)]}
 
     def get_queryset(self):
-        user = self.request.user
-        if user.is_superuser:
-            return Tag.objects.all()
-        return Tag.objects.filter(posts__blog__user=user).distinct()
+        if getattr(self, "swagger_fake_view", False):  # OpenAPI generation
+            return Tag.objects.none()
+        return get_visible_tags(self.request.user)
 
-    def perform_create(self, serializer):
-        user = self.request.user
+    def perform_create(self, serializer):  # noqa: PLR6301
+        # TagSerializer.validate checked the posts and found the user's blog
         data = serializer.validated_data
         posts = data.get("posts", [])
-        name = data.get("name")
+        tag = get_or_create_tag(data["blog"], data.get("name"))
 
-        blog = get_user_blog(user)
+        tag.posts.add(*posts)
 
-        post_ids = [post.id for post in posts]
-        posts_qs = Post.objects.filter(id__in=post_ids)
+        serializer.instance = tag
 
-        validate_posts_for_user(user, post_ids, posts_qs)
+    @action(detail=False)
+    def suggest(self, request):  # noqa: PLR6301
+        """Tag names of the user's blog starting with ``?q=`` (autocomplete)."""
+        return Response(suggest_tags(request.user, request.query_params.get("q", "")))
 
-        tag = get_or_create_tag(blog, name)
+    def perform_destroy(self, instance):  # noqa: PLR6301
+        instance.soft_delete()
 
-        tag.posts.add(*posts)
 
-        serializer.instance = tag
+class ChangeFeedView(APIView):
+    """Sync feed: ``GET /api/changes/?since=<token>&limit=<n>``.
+
+    Returns the created/updated objects (current state) and the tombstones
+    of the deleted ones since the token, plus the ``next`` token.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        limit = request.query_params.get("limit", "")
+        changes, next_token, has_more = get_changes(
+            user,
+            request.query_params.get("since"),
+            int(limit) if limit.isdigit() else None,
+        )
+        changes, rows = load_changed_objects(
+            changes,
+            {
+                # Posts of a blog are synced through their own changes
+                Change.Model.BLOG: lambda ids: BlogReadSerializer(
+                    omit=["posts"]
+                ).render(get_visible_blogs(user).filter(id__in=ids)),
+                Change.Model.POST: lambda ids: PostReadSerializer().render(
+                    get_visible_posts(user).filter(id__in=ids)
+                ),
+                Change.Model.TAG: lambda ids: TagReadSerializer().render(
+                    get_visible_tags(user).filter(id__in=ids)
+                ),
+            },
+        )
+        return Response(
+            {
+                "changes": [
+                    {
+                        "token": str(change.id),
+                        "model": change.model,
+                        "id": change.object_id,
+                        "action": change.action,
+                        "data": rows.get((change.model, change.object_id)),
+                    }
+                    for change in changes
+                ],
+                "next": next_token,
+                "has_more": has_more,
+            }
+        )
 
 
 class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = RegisterSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [RegisterRateThrottle]
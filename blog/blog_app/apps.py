@@ -1,8 +1,26 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 from django.apps import AppConfig
 from django.contrib.auth import get_user_model
+from django.core import checks
 from django.db import OperationalError, ProgrammingError
+from django.db.backends.signals import connection_created
+
+
+def create_default_superuser():
+    try:
+        user_model = get_user_model()
+        username = os.getenv("DJANGO_SUPERUSER_USERNAME", "admin")
+        email = os.getenv("DJANGO_SUPERUSER_EMAIL", "admin@example.com")
+        password = os.getenv("DJANGO_SUPERUSER_PASSWORD", "admin")
+
+        if not user_model.objects.filter(username=username).exists():
+            user_model.objects.create_superuser(username, email, password)
+            print(f"Superuser '{username}' creado automáticamente")
+    except (OperationalError, ProgrammingError):
+        print("Error al crear el superuser")
 
 
 class BlogAppConfig(AppConfig):
@@ -10,14 +28,20 @@ class BlogAppConfig(AppConfig):
     name = "blog_app"
 
     def ready(self):  # noqa: PLR6301
+        from . import signals  # noqa: F401, PLC0415
+        from .db_routing import check_shared_cache  # noqa: PLC0415
+        from .instrumentation import install_query_recorder  # noqa: PLC0415
+
+        connection_created.connect(install_query_recorder)
+        checks.register(check_shared_cache, checks.Tags.caches, checks.Tags.database)
+
         try:
-            user_model = get_user_model()
-            username = os.getenv("DJANGO_SUPERUSER_USERNAME", "admin")
-            email = os.getenv("DJANGO_SUPERUSER_EMAIL", "admin@example.com")
-            password = os.getenv("DJANGO_SUPERUSER_PASSWORD", "admin")
-
-            if not user_model.objects.filter(username=username).exists():
-                user_model.objects.create_superuser(username, email, password)
-                print(f"Superuser '{username}' creado automáticamente")
-        except (OperationalError, ProgrammingError):
-            print("Error al crear el superuser")
+            asyncio.get_running_loop()
+        except RuntimeError:
+            create_default_superuser()
+            return
+
+        # ASGI servers (uvicorn) import the app inside the event loop, where the
+        # ORM refuses to run: do the check from a worker thread instead
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(create_default_superuser).result()
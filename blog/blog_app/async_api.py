@@ -0,0 +1,127 @@
+from asgiref.sync import sync_to_async
+from rest_framework.exceptions import NotAuthenticated, NotFound, Throttled
+from rest_framework_simplejwt.authentication import (  # pyright: ignore[reportMissingImports]
+    JWTAuthentication,
+)
+from rest_framework_simplejwt.exceptions import (  # pyright: ignore[reportMissingImports]
+    AuthenticationFailed,
+    InvalidToken,
+)
+from rest_framework_simplejwt.settings import (  # pyright: ignore[reportMissingImports]
+    api_settings as jwt_settings,
+)
+
+from auth_app.throttling import TokenBucketThrottle
+from blog_app.models import Blog, Post, Tag
+from blog_app.utils.helpers import (
+    BLOG_POSTS_PREFETCH,
+    POST_PKS,
+    POST_TAGS_PREFETCH,
+    get_visible_blogs,
+    get_visible_posts,
+    get_visible_tags,
+)
+
+from .serializers import BlogSerializer, PostSerializer, TagSerializer
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Prefetch
+from django.http import JsonResponse
+from django.views import View
+
+
+User = get_user_model()
+
+
+async def aget_request_user(request):
+    # Same order as REST_FRAMEWORK["DEFAULT_AUTHENTICATION_CLASSES"]: JWT first
+    jwt_auth = JWTAuthentication()
+    header = jwt_auth.get_header(request)
+    raw_token = jwt_auth.get_raw_token(header) if header else None
+    if raw_token is not None:
+        token = jwt_auth.get_validated_token(raw_token)
+        user = await User.objects.filter(
+            **{jwt_settings.USER_ID_FIELD: token[jwt_settings.USER_ID_CLAIM]},
+            is_active=True,
+        ).afirst()
+        return user or AnonymousUser()
+    return await request.auser()
+
+
+class AsyncReadView(View):
+    """Read-only (list/retrieve) endpoint served with the async ORM.
+
+    Subclasses set ``queryset``, with everything the serializer touches
+    fetched up front so rendering never falls back to a lazy (synchronous)
+    query inside the event loop, and ``visible_rows``, the helper returning
+    the rows a user can see. Requests take from the same per-user token
+    bucket as the DRF endpoints.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    queryset = None
+    visible_rows = None  # get_visible_blogs/posts/tags
+    serializer_class = None
+
+    def get_queryset(self, user):
+        if self.queryset is None or self.visible_rows is None:
+            raise ImproperlyConfigured(
+                f"{type(self).__name__} needs the queryset and visible_rows attributes."
+            )
+        return self.queryset.filter(pk__in=self.visible_rows(user).values("pk"))
+
+    async def get(self, request, pk=None):
+        try:
+            user = await aget_request_user(request)
+        except (AuthenticationFailed, InvalidToken) as e:
+            return JsonResponse({"detail": str(e.detail)}, status=401)
+
+        if not user.is_authenticated:
+            return JsonResponse(
+                {"detail": str(NotAuthenticated.default_detail)}, status=401
+            )
+
+        request.user = user  # TokenBucketThrottle keys the bucket by user
+        throttle = TokenBucketThrottle()
+        if not await sync_to_async(throttle.allow_request)(request, self):
+            exc = Throttled(throttle.wait())
+            response = JsonResponse({"detail": str(exc.detail)}, status=exc.status_code)
+            response["Retry-After"] = str(exc.wait)
+            return response
+
+        queryset = self.get_queryset(user)
+
+        if pk is None:
+            instances = [obj async for obj in queryset]
+            return JsonResponse(
+                self.serializer_class(instances, many=True).data, safe=False
+            )
+
+        instance = await queryset.filter(pk=pk).afirst()
+        if instance is None:
+            return JsonResponse({"detail": str(NotFound.default_detail)}, status=404)
+        return JsonResponse(self.serializer_class(instance).data)
+
+
+class AsyncBlogView(AsyncReadView):
+    queryset = Blog.objects.prefetch_related(BLOG_POSTS_PREFETCH)
+    visible_rows = staticmethod(get_visible_blogs)
+    serializer_class = BlogSerializer
+
+
+class AsyncPostView(AsyncReadView):
+    queryset = Post.objects.select_related("blog__user", "view_count").prefetch_related(
+        *POST_TAGS_PREFETCH
+    )
+    visible_rows = staticmethod(get_visible_posts)
+    serializer_class = PostSerializer
+
+
+class AsyncTagView(AsyncReadView):
+    queryset = Tag.objects.select_related("blog__user").prefetch_related(
+        Prefetch("posts", queryset=POST_PKS)
+    )
+    visible_rows = staticmethod(get_visible_tags)
+    serializer_class = TagSerializer
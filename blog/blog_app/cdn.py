@@ -0,0 +1,74 @@
+import logging
+import threading
+import urllib.error
+import urllib.request
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.cache import patch_cache_control
+
+
+logger = logging.getLogger(__name__)
+
+PURGE_TIMEOUT = 5  # seconds
+
+
+# --- Surrogate keys ---
+# blog-<id>: every public response of the blog (purged on blog changes)
+# blog-<id>-posts: the post listings of the blog (purged when a post changes)
+# post-<id>: the post detail and the listings that contain it
+def blog_key(blog_id):
+    return f"blog-{blog_id}"
+
+
+def blog_posts_key(blog_id):
+    return f"blog-{blog_id}-posts"
+
+
+def post_key(post_id):
+    return f"post-{post_id}"
+
+
+def patch_public_cache_headers(response, keys):
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=settings.PUBLIC_CACHE_MAX_AGE,
+        s_maxage=settings.PUBLIC_CACHE_S_MAXAGE,
+        stale_while_revalidate=settings.PUBLIC_CACHE_STALE_WHILE_REVALIDATE,
+        stale_if_error=settings.PUBLIC_CACHE_STALE_IF_ERROR,
+    )
+    # Fastly reads Surrogate-Key, Cloudflare/Akamai read Cache-Tag
+    response["Surrogate-Key"] = " ".join(keys)
+    response["Cache-Tag"] = ",".join(keys)
+    return response
+
+
+# --- Purge ---
+def send_purge_request(keys):
+    request = urllib.request.Request(
+        settings.CDN_PURGE_URL,
+        method="POST",
+        headers={
+            "Surrogate-Key": " ".join(keys),
+            "Fastly-Key": settings.CDN_PURGE_TOKEN,
+            # Soft purge: mark as stale so stale-while-revalidate keeps serving
+            "Fastly-Soft-Purge": "1",
+        },
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=PURGE_TIMEOUT):  # noqa: S310
+            pass
+    except urllib.error.URLError:
+        logger.exception("CDN purge failed for keys %s", keys)
+
+
+def purge_surrogate_keys(*keys):
+    if not settings.CDN_PURGE_URL or not keys:
+        return
+
+    # Only purge once the change is visible, and never block the request on it
+    def purge():
+        threading.Thread(target=send_purge_request, args=(keys,), daemon=True).start()
+
+    transaction.on_commit(purge)
@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+from rest_framework.exceptions import ValidationError
+
+from blog_app.models import Blog, Change, Post
+from blog_app.utils.constants import (
+    CHANGE_FEED_MAX_PAGE_SIZE,
+    CHANGE_FEED_PAGE_SIZE,
+    ERROR_INVALID_CHANGE_TOKEN,
+)
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def record_change(model, object_id, blog_id, action=Change.Action.UPSERT):
+    Change.objects.create(
+        model=model, object_id=object_id, blog_id=blog_id, action=action
+    )
+
+
+def record_post_changes(post_ids):
+    # For bulk writes (update()/bulk_update()/m2m) that don't send post_save
+    Change.objects.bulk_create(
+        Change(model=Change.Model.POST, object_id=post_id, blog_id=blog_id)
+        for post_id, blog_id in Post.objects.filter(id__in=post_ids).values_list(
+            "id", "blog_id"
+        )
+    )
+
+
+def record_deletes(model, object_ids, blog_id):
+    # Tombstones for bulk soft deletes (update() sends no post_save)
+    Change.objects.bulk_create(
+        Change(
+            model=model,
+            object_id=object_id,
+            blog_id=blog_id,
+            action=Change.Action.DELETE,
+        )
+        for object_id in object_ids
+    )
+
+
+def parse_change_token(value):
+    if value in {None, ""}:
+        return 0
+    try:
+        token = int(value)
+    except (TypeError, ValueError):
+        token = -1
+    if token < 0:
+        raise ValidationError({"since": ERROR_INVALID_CHANGE_TOKEN})
+    return token
+
+
+def get_changes(user, since=None, limit=None):
+    """Page of the change log visible to ``user`` after the ``since`` token.
+
+    Several entries of the same object in the page collapse into the latest
+    one. Returns ``(changes, next_token, has_more)``; ``next_token`` is the
+    ``since`` of the following call.
+    """
+    since = parse_change_token(since)
+    limit = min(limit or CHANGE_FEED_PAGE_SIZE, CHANGE_FEED_MAX_PAGE_SIZE)
+
+    entries = Change.objects.filter(id__gt=since).order_by("id")
+    if not user.is_superuser:
+        # all_objects: the tombstones of a soft-deleted blog must still reach
+        # its owner (purge_deleted only removes rows past the grace period)
+        owned = Blog.all_objects.filter(user=user).values("id")
+        entries = entries.filter(blog_id__in=owned)
+    if settings.CHANGE_FEED_SETTLE_SECONDS:
+        settled = timezone.now() - timedelta(
+            seconds=settings.CHANGE_FEED_SETTLE_SECONDS
+        )
+        entries = entries.filter(created_at__lte=settled)
+
+    page = list(entries[: limit + 1])
+    has_more = len(page) > limit
+    page = page[:limit]
+    next_token = str(page[-1].id if page else since)
+
+    latest = {(entry.model, entry.object_id): entry for entry in page}
+    changes = sorted(latest.values(), key=lambda entry: entry.id)
+    return changes, next_token, has_more
+
+
+def load_changed_objects(changes, querysets):
+    """Current rows of the upserted objects: ``{(model, id): row}``.
+
+    ``querysets`` maps each Change.Model to a function(ids) returning the
+    ``(id, row)`` pairs still visible. Upserts whose row is gone are dropped
+    from ``changes`` (their tombstone comes later in the log).
+    """
+    ids = {}
+    for change in changes:
+        if change.action == Change.Action.UPSERT:
+            ids.setdefault(change.model, []).append(change.object_id)
+
+    rows = {}
+    for model, object_ids in ids.items():
+        for object_id, row in querysets[model](object_ids):
+            rows[model, object_id] = row
+
+    changes = [
+        change
+        for change in changes
+        if change.action == Change.Action.DELETE
+        or (change.model, change.object_id) in rows
+    ]
+    return changes, rows
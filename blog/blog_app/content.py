@@ -0,0 +1,74 @@
+from html.parser import HTMLParser
+import math
+import re
+
+import nh3  # pyright: ignore[reportMissingImports]
+
+from blog_app.utils.constants import EXCERPT_LENGTH, WORDS_PER_MINUTE
+
+
+# Tags after which the text of the next element starts a new word
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "ol", "p", "pre", "section", "table", "td", "th",
+    "tr", "ul",
+}  # fmt: skip
+
+WHITESPACE = re.compile(r"\s+")
+
+
+class TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+    def text(self):
+        return WHITESPACE.sub(" ", "".join(self.parts)).strip()
+
+
+def sanitize_html(html):
+    # Allowlist of formatting tags/attributes; drops scripts, styles, handlers
+    return nh3.clean(html or "")
+
+
+def html_to_text(html):
+    extractor = TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.text()
+
+
+def build_excerpt(text, length=EXCERPT_LENGTH):
+    if len(text) <= length:
+        return text
+    # Cut on a word boundary
+    cut = text[: length - 1].rsplit(" ", 1)[0].rstrip(" ,.;:")
+    return f"{cut}…"
+
+
+def reading_time(text):
+    words = len(text.split())
+    return max(1, math.ceil(words / WORDS_PER_MINUTE)) if words else 0
+
+
+def process_content(html):
+    """Derived columns of a post: sanitized HTML, plain text, excerpt, minutes."""
+    content_html = sanitize_html(html)
+    content_text = html_to_text(content_html)
+    return {
+        "content_html": content_html,
+        "content_text": content_text,
+        "excerpt": build_excerpt(content_text),
+        "reading_time": reading_time(content_text),
+    }
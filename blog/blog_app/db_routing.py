@@ -0,0 +1,116 @@
+"""
+Read replica routing with read-your-writes stickiness.
+
+Reads go to the primary unless a request opts in: the REST viewsets
+(ReplicaReadsMixin) for GET/HEAD/OPTIONS and the GraphQL views for queries.
+Reads inside a transaction always stay on the primary, and so does every
+write. A user who writes is pinned to the primary for REPLICA_PIN_SECONDS
+(a key in the default cache) so the replication lag never hides their own
+changes from them. Other workers only see the pin through a shared cache
+(CACHE_URL): ``check_shared_cache`` fails the system checks when a replica
+is configured over a per-process local-memory cache outside DEBUG.
+
+Nothing changes while DATABASES has no REPLICA_DATABASE alias.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from rest_framework.permissions import SAFE_METHODS
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+replica_reads = ContextVar("replica_reads", default=False)
+
+
+def replica_alias():
+    alias = settings.REPLICA_DATABASE
+    return alias if alias in settings.DATABASES else None
+
+
+def pin_key(user_id):
+    return f"replica-pin:{user_id}"
+
+
+def pin_to_primary(user):
+    if replica_alias() and user.is_authenticated:
+        cache.set(pin_key(user.pk), True, settings.REPLICA_PIN_SECONDS)
+
+
+def is_pinned(user):
+    return user.is_authenticated and cache.get(pin_key(user.pk)) is not None
+
+
+def check_shared_cache(**kwargs):
+    backend = getattr(cache, "cache", cache)  # Unwrap InstrumentedCache
+    if replica_alias() is None or not isinstance(backend, LocMemCache):
+        return []
+    message = (
+        "The read replica pins users to the primary through the default "
+        "cache, but it is a per-process local-memory cache."
+    )
+    hint = "Set CACHE_URL (or REDIS_URL) to a cache shared by the workers."
+    if settings.DEBUG:
+        return [checks.Warning(message, hint=hint, id="blog_app.W001")]
+    return [checks.Error(message, hint=hint, id="blog_app.E001")]
+
+
+def start_replica_reads(user):
+    """Route the reads to the replica; returns the token to stop, or None."""
+    if replica_alias() is None or is_pinned(user):
+        return None
+    return replica_reads.set(True)
+
+
+def stop_replica_reads(token):
+    if token is not None:
+        replica_reads.reset(token)
+
+
+@contextmanager
+def read_from_replica(user):
+    token = start_replica_reads(user)
+    try:
+        yield
+    finally:
+        stop_replica_reads(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):  # noqa: PLR6301
+        if not replica_reads.get():
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None  # Read-modify-write: the replica may not have it yet
+        return replica_alias()
+
+    def db_for_write(self, model, **hints):  # noqa: PLR6301
+        # Explicit: otherwise Django saves instances where they were read from
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):  # noqa: PLR6301
+        return True  # Both aliases hold the same data
+
+    def allow_migrate(self, db, app_label, **hints):  # noqa: PLR6301
+        return db != settings.REPLICA_DATABASE  # It replicates the schema too
+
+
+class ReplicaReadsMixin:
+    """Safe-method requests of a DRF view read from the replica; other
+    methods pin the user to the primary."""
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS:
+            self._replica_token = start_replica_reads(request.user)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        stop_replica_reads(getattr(self, "_replica_token", None))
+        if request.method not in SAFE_METHODS:
+            pin_to_primary(request.user)
+        return super().finalize_response(request, response, *args, **kwargs)
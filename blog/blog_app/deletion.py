@@ -0,0 +1,58 @@
+from blog_app.cdn import blog_posts_key, post_key, purge_surrogate_keys
+from blog_app.changes import record_deletes
+from blog_app.models import Blog, Change, Post, Tag
+from blog_app.tag_index import invalidate_tag_index
+
+from django.db import transaction
+from django.utils import timezone
+
+
+# Purge order: children first, so deleting a blog no longer cascades
+PURGE_ORDER = (Tag, Post, Blog)
+
+
+def soft_delete_blog(blog):
+    """Flag the blog, its posts and its tags (a few UPDATEs, no cascade)."""
+    with transaction.atomic():
+        post_ids = list(blog.posts.values_list("id", flat=True))
+        tag_ids = list(blog.tags.values_list("id", flat=True))
+        Post.objects.filter(id__in=post_ids).soft_delete()
+        Tag.objects.filter(id__in=tag_ids).soft_delete()
+        record_deletes(Change.Model.POST, post_ids, blog.pk)
+        record_deletes(Change.Model.TAG, tag_ids, blog.pk)
+        invalidate_tag_index(blog.user_id)  # update() sends no post_save
+        blog.soft_delete()  # post_save: blog tombstone and CDN purge
+
+    purge_surrogate_keys(
+        blog_posts_key(blog.pk), *(post_key(post_id) for post_id in post_ids)
+    )
+
+
+def purge_batch(model, batch_size, before=None):
+    """Hard-delete up to ``batch_size`` soft-deleted rows; returns the count.
+
+    One short transaction per batch: the locks and the cascade (M2M rows)
+    stay bounded however many rows are waiting.
+    """
+    with transaction.atomic():
+        ids = list(
+            model.all_objects.filter(
+                deleted_at__isnull=False, deleted_at__lte=before or timezone.now()
+            )
+            .order_by("deleted_at")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if ids:
+            model.all_objects.filter(id__in=ids).delete()
+    return len(ids)
+
+
+def purge_deleted(batch_size, before=None):
+    """Purge every soft-deleted row in batches; returns ``{model name: count}``."""
+    purged = {}
+    for model in PURGE_ORDER:
+        total = 0
+        while count := purge_batch(model, batch_size, before):
+            total += count
+        purged[model._meta.model_name] = total
+    return purged
@@ -0,0 +1,250 @@
+"""
+Public RSS/Atom feeds of each blog and sitemaps of every live post.
+
+Crawlers and aggregators read these instead of the authenticated API. Each
+document is cached under a version of its blog (the sitemap index under a
+global one), dropped when posts are saved, published or re-rendered, and
+expiring after FEED_CACHE_TIMEOUT. The version is also the ETag, so a
+conditional GET is answered from the cache without touching the database.
+It is derived from the data (live post count and latest updates), not
+random: every worker, and a cache that lost the key, gets the same ETag for
+the same posts.
+Sitemaps are streamed from the database in chunks and cached as they are
+sent; feeds only render the latest FEED_ITEMS posts.
+"""
+
+import hashlib
+from math import ceil
+from xml.sax.saxutils import escape
+
+from blog_app.models import Blog, Post
+from blog_app.utils.constants import (
+    FEED_CACHE_TIMEOUT,
+    FEED_ITEMS,
+    SITEMAP_CHUNK_SIZE,
+    SITEMAP_MAX_URLS,
+)
+from blog_app.utils.helpers import drop_cache_versions
+
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.feedgenerator import Atom1Feed, Rss201rev2Feed
+from django.views.decorators.http import condition, require_GET
+
+
+FEED_CLASSES = {"rss": Rss201rev2Feed, "atom": Atom1Feed}
+SITEMAP_CONTENT_TYPE = "application/xml; charset=utf-8"
+SITEMAP_NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
+INDEX_VERSION_KEY = "feeds:index"
+
+
+def version_key(slug):
+    return f"feeds:{slug}"
+
+
+def invalidate_feeds(blog_ids):
+    slugs = Blog.all_objects.filter(id__in=blog_ids).values_list("slug", flat=True)
+    drop_cache_versions(INDEX_VERSION_KEY, *map(version_key, slugs))
+
+
+def data_version(slug=None):
+    """Hash of the live post count and latest post/blog update of the blog."""
+    blogs = Blog.objects.all() if slug is None else Blog.objects.filter(slug=slug)
+    live = live_posts_filter(timezone.now())
+    stats = blogs.aggregate(
+        blog_count=Count("id", distinct=True),
+        blog_updated=Max("updated_at"),
+        post_count=Count("posts", filter=live),
+        post_updated=Max("posts__updated_at", filter=live),
+    )
+    data = "|".join(str(stats[name]) for name in sorted(stats))
+    return hashlib.sha256(data.encode()).hexdigest()[:32]
+
+
+def document_version(slug=None):
+    key = INDEX_VERSION_KEY if slug is None else version_key(slug)
+    version = cache.get(key)
+    if version is None:
+        version = data_version(slug)
+        if not cache.add(key, version, timeout=FEED_CACHE_TIMEOUT):
+            version = cache.get(key) or version
+    return version
+
+
+def sitemap_page(request):
+    page = request.GET.get("p", "1")
+    if not page.isdigit() or int(page) < 1:
+        raise Http404
+    return int(page)
+
+
+def cache_while_streaming(key, chunks):
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    # Only complete documents: a client that disconnects stops the generator
+    cache.set(key, "".join(parts).encode(), FEED_CACHE_TIMEOUT)
+
+
+def document_response(key, content_type, render):
+    """The cached document at ``key``, or ``render()``'s chunks (then cached)."""
+    body = cache.get(key)
+    if body is not None:
+        response = HttpResponse(body, content_type=content_type)
+    else:
+        response = StreamingHttpResponse(
+            cache_while_streaming(key, render()), content_type=content_type
+        )
+    # Revalidated with If-None-Match: the ETag changes with the posts
+    patch_cache_control(response, public=True, max_age=0, must_revalidate=True)
+    return response
+
+
+# --- Feeds ---
+def render_feed(blog, kind, base_url):
+    blog_url = base_url + reverse("public-blog-detail", args=[blog.slug])
+    feed = FEED_CLASSES[kind](
+        title=blog.title,
+        link=blog_url,
+        description=blog.description or blog.title,
+        language="es",
+        feed_url=base_url + reverse(f"blog-feed-{kind}", args=[blog.slug]),
+    )
+    posts = (
+        Post.objects.live()
+        .filter(blog=blog)
+        .values("id", "title", "excerpt", "published_at", "updated_at")
+    )
+    for post in posts[:FEED_ITEMS]:
+        link = base_url + reverse("public-post-detail", args=[blog.slug, post["id"]])
+        feed.add_item(
+            title=post["title"],
+            link=link,
+            description=post["excerpt"],
+            unique_id=link,
+            pubdate=post["published_at"],
+            updateddate=post["updated_at"],
+        )
+    yield feed.writeString("utf-8")
+
+
+def feed_view(kind):
+    @require_GET
+    @condition(etag_func=lambda request, slug: f"{kind}-{document_version(slug)}")
+    def view(request, slug):
+        base_url = request.build_absolute_uri("/").rstrip("/")
+        key = f"feeds:{kind}:{slug}:{document_version(slug)}:{base_url}"
+
+        def render():
+            blog = get_object_or_404(Blog, slug=slug)
+            return render_feed(blog, kind, base_url)
+
+        return document_response(key, FEED_CLASSES[kind].content_type, render)
+
+    return view
+
+
+rss_feed_view = feed_view("rss")
+atom_feed_view = feed_view("atom")
+
+
+# --- Sitemaps ---
+def live_posts_filter(now):
+    # PostQuerySet.live() across the blog -> posts relation
+    return Q(
+        posts__status=Post.Status.PUBLISHED,
+        posts__published_at__lte=now,
+        posts__deleted_at__isnull=True,
+    )
+
+
+def render_sitemap(blog, page, base_url):
+    yield (
+        f'<?xml version="1.0" encoding="utf-8"?>\n'
+        f'<urlset xmlns="{SITEMAP_NAMESPACE}">\n'
+    )
+    posts = (
+        Post.objects.live()
+        .filter(blog=blog)
+        .order_by("-published_at", "-id")
+        .values_list("id", "updated_at")[
+            (page - 1) * SITEMAP_MAX_URLS : page * SITEMAP_MAX_URLS
+        ]
+    )
+    lines = []
+    for post_id, updated_at in posts.iterator(chunk_size=SITEMAP_CHUNK_SIZE):
+        loc = base_url + reverse("public-post-detail", args=[blog.slug, post_id])
+        lines.append(
+            f"<url><loc>{escape(loc)}</loc>"
+            f"<lastmod>{updated_at.isoformat()}</lastmod></url>\n"
+        )
+        if len(lines) == SITEMAP_CHUNK_SIZE:
+            yield "".join(lines)
+            lines = []
+    yield "".join(lines) + "</urlset>\n"
+
+
+def render_sitemap_index(base_url):
+    yield (
+        f'<?xml version="1.0" encoding="utf-8"?>\n'
+        f'<sitemapindex xmlns="{SITEMAP_NAMESPACE}">\n'
+    )
+    live = live_posts_filter(timezone.now())
+    blogs = (
+        Blog.objects.annotate(
+            live_posts=Count("posts", filter=live),
+            last_modified=Max("posts__updated_at", filter=live),
+        )
+        .filter(live_posts__gt=0)
+        .order_by("id")
+        .values_list("slug", "live_posts", "last_modified")
+    )
+    lines = []
+    for slug, live_posts, last_modified in blogs.iterator(
+        chunk_size=SITEMAP_CHUNK_SIZE
+    ):
+        loc = base_url + reverse("blog-sitemap", args=[slug])
+        for page in range(1, ceil(live_posts / SITEMAP_MAX_URLS) + 1):
+            page_loc = loc if page == 1 else f"{loc}?p={page}"
+            lines.append(
+                f"<sitemap><loc>{escape(page_loc)}</loc>"
+                f"<lastmod>{last_modified.isoformat()}</lastmod></sitemap>\n"
+            )
+        if len(lines) >= SITEMAP_CHUNK_SIZE:
+            yield "".join(lines)
+            lines = []
+    yield "".join(lines) + "</sitemapindex>\n"
+
+
+@require_GET
+@condition(
+    etag_func=lambda request, slug: (
+        f"sitemap-{sitemap_page(request)}-{document_version(slug)}"
+    )
+)
+def sitemap_view(request, slug):
+    page = sitemap_page(request)
+    base_url = request.build_absolute_uri("/").rstrip("/")
+    key = f"feeds:sitemap:{slug}:{page}:{document_version(slug)}:{base_url}"
+
+    def render():
+        blog = get_object_or_404(Blog, slug=slug)
+        return render_sitemap(blog, page, base_url)
+
+    return document_response(key, SITEMAP_CONTENT_TYPE, render)
+
+
+@require_GET
+@condition(etag_func=lambda request: f"sitemap-index-{document_version()}")
+def sitemap_index_view(request):
+    base_url = request.build_absolute_uri("/").rstrip("/")
+    key = f"feeds:sitemap-index:{document_version()}:{base_url}"
+    return document_response(
+        key, SITEMAP_CONTENT_TYPE, lambda: render_sitemap_index(base_url)
+    )
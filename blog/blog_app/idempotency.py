@@ -0,0 +1,155 @@
+import functools
+import hashlib
+import json
+from datetime import timedelta
+
+from auth_app.utils.helpers import check_user_authenticated
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.response import Response
+
+from blog_app.models import IdempotencyKey
+from blog_app.utils.constants import (
+    ERROR_IDEMPOTENCY_KEY_REUSED,
+    ERROR_IDEMPOTENCY_KEY_TOO_LONG,
+)
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyKeyReused(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = ERROR_IDEMPOTENCY_KEY_REUSED
+    default_code = "idempotency_key_reused"
+
+
+def request_fingerprint(payload):
+    if hasattr(payload, "lists"):  # QueryDict (form/multipart)
+        payload = dict(payload.lists())
+    body = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+def run_idempotent(user, scope, key, payload, execute, to_store=None):
+    """Run ``execute`` once per ``(user, scope, key)``.
+
+    ``execute()`` returns ``(status_code, result)``. A successful result is
+    stored (``to_store(result)`` if given) in the same transaction as the
+    write, and retries get ``(status_code, stored, True)`` back instead of
+    running it again. Failures roll the key back so the client can retry.
+
+    A concurrent retry blocks on the key's unique index until the first
+    request commits, then replays its result.
+    """
+    fingerprint = request_fingerprint(payload)
+    expired = timezone.now() - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                IdempotencyKey.objects.filter(
+                    user=user, scope=scope, key=key, created_at__lt=expired
+                ).delete()
+                record = IdempotencyKey.objects.create(
+                    user=user, scope=scope, key=key, fingerprint=fingerprint
+                )
+        except IntegrityError:
+            record = IdempotencyKey.objects.get(user=user, scope=scope, key=key)
+            if record.fingerprint != fingerprint:
+                raise IdempotencyKeyReused from None
+            return record.status_code, record.response, True
+
+        status_code, result = execute()
+        if not status.is_success(status_code):
+            transaction.set_rollback(True)
+            return status_code, result, False
+
+        record.status_code = status_code
+        record.response = to_store(result) if to_store else result
+        record.save(update_fields=["status_code", "response"])
+        return status_code, result, False
+
+
+def get_idempotency_key(value):
+    if value and len(value) > MAX_KEY_LENGTH:
+        raise ValidationError({"idempotency_key": ERROR_IDEMPOTENCY_KEY_TOO_LONG})
+    return value
+
+
+class IdempotentCreateMixin:
+    """``Idempotency-Key`` header for the create action of a viewset."""
+
+    def create(self, request, *args, **kwargs):
+        key = get_idempotency_key(request.headers.get(IDEMPOTENCY_HEADER))
+        if not key:
+            return super().create(request, *args, **kwargs)
+
+        def execute():
+            response = super(IdempotentCreateMixin, self).create(
+                request, *args, **kwargs
+            )
+            return response.status_code, response.data
+
+        status_code, data, replayed = run_idempotent(
+            request.user, f"rest:{self.basename}", key, request.data, execute
+        )
+        headers = {"Idempotent-Replayed": "true"} if replayed else None
+        return Response(data, status=status_code, headers=headers)
+
+
+def idempotent_mutation(field):
+    """``idempotencyKey`` argument for a create mutation returning ``field``.
+
+    Retries get the object created by the first call (re-read from the DB).
+    """
+
+    def decorator(mutate):
+        @functools.wraps(mutate)
+        def wrapper(root, info, idempotency_key=None, **arguments):
+            if not idempotency_key:
+                return mutate(root, info, **arguments)
+
+            payload_class = info.return_type.graphene_type
+            if len(idempotency_key) > MAX_KEY_LENGTH:
+                return payload_class(errors=[ERROR_IDEMPOTENCY_KEY_TOO_LONG])
+            user = check_user_authenticated(info)
+
+            def execute():
+                payload = mutate(root, info, **arguments)
+                created = getattr(payload, field) is not None
+                if created:
+                    return status.HTTP_201_CREATED, payload
+                return status.HTTP_400_BAD_REQUEST, payload
+
+            try:
+                _, result, replayed = run_idempotent(
+                    user,
+                    f"graphql:{payload_class.__name__}",
+                    idempotency_key,
+                    arguments,
+                    execute,
+                    to_store=lambda payload: {
+                        "id": getattr(payload, field).pk,
+                        "message": payload.message,
+                    },
+                )
+            except IdempotencyKeyReused:
+                return payload_class(errors=[ERROR_IDEMPOTENCY_KEY_REUSED])
+            if not replayed:
+                return result
+
+            model = payload_class._meta.fields[field].type._meta.model
+            instance = model.objects.filter(pk=result["id"]).first()
+            return payload_class(
+                **{field: instance}, errors=[], message=result["message"]
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,404 @@
+"""
+Per-request performance instrumentation.
+
+``InstrumentationMiddleware`` measures wall time, DB queries (count and
+time), cache hits/misses, serializer time and GraphQL resolver time of each
+request. They are sent back in a ``Server-Timing`` header (when
+``SERVER_TIMING_HEADER`` is on) and accumulated in process-local metrics
+served in Prometheus text format by ``metrics_view`` (``/metrics``).
+
+With ``QUERY_REPEAT_DETECTION`` on it also flags N+1 queries: the same SELECT
+shape (SQL without its values) run ``QUERY_REPEAT_THRESHOLD`` times or more
+in one request is logged ("log", dev) or raises ``RepeatedQueriesError``
+("raise", tests).
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import logging
+import re
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.db import connections
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+current_metrics = ContextVar("request_metrics", default=None)
+
+SQL_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+SQL_IN_LISTS = re.compile(r"IN \((?:%s, )*%s\)")
+
+
+class RepeatedQueriesError(Exception):
+    pass
+
+
+def query_shape(sql):
+    """``sql`` without literal values, ``IN (%s, %s, ...)`` -> ``IN (...)``."""
+    return SQL_IN_LISTS.sub("IN (...)", SQL_LITERALS.sub("%s", sql))
+
+
+@dataclass
+class RequestMetrics:
+    started_at: float = field(default_factory=time.perf_counter)
+    db_queries: int = 0
+    db_time: float = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    serializer_time: float = 0
+    serializer_depth: int = 0
+    resolvers: dict = field(default_factory=dict)  # "Type.field" -> [calls, time]
+    query_shapes: Counter = None  # Only when QUERY_REPEAT_DETECTION is on
+
+    @property
+    def resolver_time(self):
+        return sum(elapsed for _, elapsed in self.resolvers.values())
+
+
+# --- Process-local metrics (one registry per worker) ---
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {}  # (name, labels) -> value
+        self.histograms = {}  # (name, labels) -> [bucket counts, sum, count]
+        self.help = {}
+
+    def inc(self, name, labels=(), value=1, help_text=""):
+        with self.lock:
+            self.help.setdefault(name, ("counter", help_text))
+            key = (name, labels)
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, labels, value, help_text=""):
+        with self.lock:
+            self.help.setdefault(name, ("histogram", help_text))
+            buckets, total, count = self.histograms.get(
+                (name, labels), ([0] * len(DURATION_BUCKETS), 0, 0)
+            )
+            for i, bound in enumerate(DURATION_BUCKETS):
+                if value <= bound:
+                    buckets[i] += 1
+            self.histograms[name, labels] = (buckets, total + value, count + 1)
+
+    def render(self):
+        lines = []
+        with self.lock:
+            for name, (kind, help_text) in sorted(self.help.items()):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+                for (metric, labels), value in sorted(self.counters.items()):
+                    if metric == name:
+                        lines.append(f"{name}{format_labels(labels)} {value:g}")
+                for (metric, labels), hist in sorted(self.histograms.items()):
+                    if metric == name:
+                        lines += render_histogram(name, labels, *hist)
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+def render_histogram(name, labels, buckets, total, count):
+    lines = [
+        f"{name}_bucket{format_labels((*labels, ('le', bound)))} {buckets[i]}"
+        for i, bound in enumerate(DURATION_BUCKETS)
+    ]
+    lines += [
+        f"{name}_bucket{format_labels((*labels, ('le', '+Inf')))} {count}",
+        f"{name}_sum{format_labels(labels)} {total:g}",
+        f"{name}_count{format_labels(labels)} {count}",
+    ]
+    return lines
+
+
+registry = Registry()
+
+
+# --- Collectors ---
+def record_query(execute, sql, params, many, context):
+    # Installed on every DB connection (see install_query_recorder)
+    metrics = current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_queries += 1
+        metrics.db_time += time.perf_counter() - start
+        # Reads only: lazy loads are where N+1s hide, writes follow the payload
+        if metrics.query_shapes is not None and sql.startswith("SELECT"):
+            metrics.query_shapes[query_shape(sql)] += 1
+
+
+def install_query_recorder(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def check_repeated_queries(request, metrics):
+    threshold = settings.QUERY_REPEAT_THRESHOLD
+    repeated = [
+        f"  {count}x {shape}"
+        for shape, count in metrics.query_shapes.items()
+        if count >= threshold
+    ]
+    if not repeated:
+        return
+    message = "\n".join(
+        [f"Repeated queries (N+1?) in {request.method} {request.path}:", *repeated]
+    )
+    if settings.QUERY_REPEAT_DETECTION == "raise":
+        raise RepeatedQueriesError(message)
+    logger.warning(message)
+
+
+@contextmanager
+def track_serializer():
+    """Time spent rendering serializers (the outermost call only)."""
+    metrics = current_metrics.get()
+    if metrics is None or metrics.serializer_depth:
+        yield
+        return
+    metrics.serializer_depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.serializer_time += time.perf_counter() - start
+        metrics.serializer_depth -= 1
+
+
+class TimedSerializerMixin:
+    def to_representation(self, instance):
+        with track_serializer():
+            return super().to_representation(instance)
+
+
+def count_cache_lookups(hits, misses):
+    metrics = current_metrics.get()
+    if metrics is not None:
+        metrics.cache_hits += hits
+        metrics.cache_misses += misses
+
+
+class InstrumentedCache(BaseCache):
+    """
+    Cache backend that wraps the one named in ``OPTIONS["BACKEND"]`` (Redis in
+    production, local memory in dev/tests) and counts the hits/misses of
+    ``get()`` and ``get_many()`` for the current request.
+    """
+
+    def __init__(self, location, params):
+        options = dict(params.get("OPTIONS", {}))
+        backend = import_string(
+            options.pop("BACKEND", "django.core.cache.backends.locmem.LocMemCache")
+        )
+        params = {**params, "OPTIONS": options}
+        super().__init__(params)
+        self.cache = backend(location, params)
+
+    def get(self, key, default=None, version=None):
+        missing = object()
+        value = self.cache.get(key, missing, version)
+        count_cache_lookups(int(value is not missing), int(value is missing))
+        return default if value is missing else value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        values = self.cache.get_many(keys, version)
+        count_cache_lookups(len(values), len(keys) - len(values))
+        return values
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.cache.add(key, value, timeout, version)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.cache.set(key, value, timeout, version)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.cache.touch(key, timeout, version)
+
+    def delete(self, key, version=None):
+        return self.cache.delete(key, version)
+
+    def has_key(self, key, version=None):
+        return self.cache.has_key(key, version)
+
+    def incr(self, key, delta=1, version=None):
+        return self.cache.incr(key, delta, version)
+
+    def decr(self, key, delta=1, version=None):
+        return self.cache.decr(key, delta, version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.cache.set_many(data, timeout, version)
+
+    def delete_many(self, keys, version=None):
+        return self.cache.delete_many(keys, version)
+
+    def clear(self):
+        return self.cache.clear()
+
+    def close(self, **kwargs):
+        return self.cache.close(**kwargs)
+
+
+class ResolverTimingMiddleware:
+    """Graphene middleware: time of each resolver, grouped by ``Type.field``."""
+
+    def resolve(self, next, root, info, **kwargs):  # noqa: PLR6301
+        metrics = current_metrics.get()
+        if metrics is None:
+            return next(root, info, **kwargs)
+        start = time.perf_counter()
+        try:
+            return next(root, info, **kwargs)
+        finally:
+            key = f"{info.parent_type.name}.{info.field_name}"
+            calls, elapsed = metrics.resolvers.get(key, (0, 0))
+            metrics.resolvers[key] = (calls + 1, elapsed + time.perf_counter() - start)
+
+
+# --- Middleware ---
+class InstrumentationMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        for connection in connections.all():
+            install_query_recorder(connection)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = self.start()
+        token = current_metrics.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = self.start()
+        token = current_metrics.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    @staticmethod
+    def start():
+        metrics = RequestMetrics()
+        if settings.QUERY_REPEAT_DETECTION != "off":
+            metrics.query_shapes = Counter()
+        return metrics
+
+    @staticmethod
+    def finish(request, response, metrics):
+        total = time.perf_counter() - metrics.started_at
+        if metrics.query_shapes:
+            check_repeated_queries(request, metrics)
+        match = getattr(request, "resolver_match", None)
+        route = match.route if match else "unmatched"
+        export_metrics(request.method, route, response.status_code, total, metrics)
+        if settings.SERVER_TIMING_HEADER:
+            response["Server-Timing"] = server_timing(total, metrics)
+        return response
+
+
+def server_timing(total, metrics):
+    entries = [
+        f"total;dur={total * 1000:.1f}",
+        f'db;dur={metrics.db_time * 1000:.1f};desc="{metrics.db_queries} queries"',
+        f'cache;desc="{metrics.cache_hits} hits / {metrics.cache_misses} misses"',
+    ]
+    if metrics.serializer_time:
+        entries.append(f"serializer;dur={metrics.serializer_time * 1000:.1f}")
+    if metrics.resolvers:
+        entries.append(f"graphql;dur={metrics.resolver_time * 1000:.1f}")
+    return ", ".join(entries)
+
+
+def export_metrics(method, route, status, total, metrics):
+    labels = (("method", method), ("route", route))
+    registry.inc(
+        "http_requests_total",
+        (*labels, ("status", status)),
+        help_text="HTTP requests.",
+    )
+    registry.observe(
+        "http_request_duration_seconds",
+        labels,
+        total,
+        help_text="Wall time per request.",
+    )
+    registry.inc(
+        "db_queries_total",
+        labels,
+        metrics.db_queries,
+        help_text="DB queries run by requests.",
+    )
+    registry.inc(
+        "db_query_duration_seconds_total",
+        labels,
+        metrics.db_time,
+        help_text="Time spent in DB queries.",
+    )
+    registry.inc(
+        "serializer_duration_seconds_total",
+        labels,
+        metrics.serializer_time,
+        help_text="Time spent in serializers.",
+    )
+    registry.inc("cache_hits_total", value=metrics.cache_hits, help_text="Cache hits.")
+    registry.inc(
+        "cache_misses_total", value=metrics.cache_misses, help_text="Cache misses."
+    )
+    for resolver, (calls, elapsed) in metrics.resolvers.items():
+        registry.inc(
+            "graphql_resolver_calls_total",
+            (("field", resolver),),
+            calls,
+            help_text="GraphQL resolver calls.",
+        )
+        registry.inc(
+            "graphql_resolver_duration_seconds_total",
+            (("field", resolver),),
+            elapsed,
+            help_text="Time spent in GraphQL resolvers (excluding children).",
+        )
+
+
+def metrics_view(request):
+    token = settings.METRICS_TOKEN
+    if not token and not settings.DEBUG:
+        raise Http404  # Outside development /metrics needs METRICS_TOKEN
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        return HttpResponseForbidden()
+    return HttpResponse(
+        registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -0,0 +1,17 @@
+from blog_app.openapi import write_schema
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera el documento OpenAPI (Swagger/ReDoc) una sola vez, en el build, "
+        "para no introspeccionar la API en cada petición."
+    )
+
+    def handle(self, *args, **options):
+        content = write_schema()
+        self.stdout.write(
+            f"{settings.OPENAPI_SCHEMA_FILE} generado ({len(content)} bytes)."
+        )
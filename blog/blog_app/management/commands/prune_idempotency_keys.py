@@ -0,0 +1,45 @@
+import time
+from datetime import timedelta
+
+from blog_app.models import IdempotencyKey
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = "Elimina las claves de idempotencia caducadas (IDEMPOTENCY_KEY_TTL)."
+
+    def add_arguments(self, parser):  # noqa: PLR6301
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Claves eliminadas por consulta (default: 1000).",
+        )
+        parser.add_argument(
+            "--loop",
+            type=int,
+            default=0,
+            metavar="SECONDS",
+            help="Repetir cada N segundos en lugar de ejecutar una sola vez.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            total = self.prune_expired_keys(options["batch_size"])
+            self.stdout.write(f"{total} claves de idempotencia eliminadas.")
+            if not options["loop"]:
+                return
+            time.sleep(options["loop"])
+
+    @staticmethod
+    def prune_expired_keys(batch_size):
+        expired = timezone.now() - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+        keys = IdempotencyKey.objects.filter(created_at__lt=expired)
+
+        total = 0
+        while ids := list(keys.values_list("id", flat=True)[:batch_size]):
+            total += IdempotencyKey.objects.filter(id__in=ids).delete()[0]
+        return total
@@ -0,0 +1,48 @@
+import time
+from datetime import timedelta
+
+from blog_app.deletion import purge_deleted
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = (
+        "Elimina definitivamente, por lotes, los blogs, posts y tags borrados "
+        "(soft delete)."
+    )
+
+    def add_arguments(self, parser):  # noqa: PLR6301
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Filas eliminadas por transacción (default: 500).",
+        )
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=0,
+            metavar="SECONDS",
+            help="Solo filas borradas hace más de N segundos (default: 0).",
+        )
+        parser.add_argument(
+            "--loop",
+            type=int,
+            default=0,
+            metavar="SECONDS",
+            help="Repetir cada N segundos en lugar de ejecutar una sola vez.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            before = timezone.now() - timedelta(seconds=options["older_than"])
+            purged = purge_deleted(options["batch_size"], before)
+            self.stdout.write(
+                ", ".join(f"{count} {model}" for model, count in purged.items())
+                + " eliminados."
+            )
+            if not options["loop"]:
+                return
+            time.sleep(options["loop"])
@@ -0,0 +1,29 @@
+from blog_app.models import Blog
+from blog_app.related import rebuild_related_posts
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula los posts relacionados (por etiquetas en común) de todos los "
+        "blogs, o solo de los indicados con --blog."
+    )
+
+    def add_arguments(self, parser):  # noqa: PLR6301
+        parser.add_argument(
+            "--blog",
+            type=int,
+            action="append",
+            dest="blog_ids",
+            metavar="ID",
+            help="Blog a recalcular (se puede repetir).",
+        )
+
+    def handle(self, *args, **options):
+        blog_ids = options["blog_ids"] or Blog.objects.order_by("id").values_list(
+            "id", flat=True
+        )
+        # One blog at a time: its links are loaded in memory to score the posts
+        total = sum(rebuild_related_posts(blog_id) for blog_id in blog_ids)
+        self.stdout.write(f"{total} posts recalculados.")
@@ -0,0 +1,59 @@
+from blog_app.cdn import blog_key, purge_surrogate_keys
+from blog_app.changes import record_post_changes
+from blog_app.content import process_content
+from blog_app.feeds import invalidate_feeds
+from blog_app.models import Post
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+DERIVED_FIELDS = ["content_html", "content_text", "excerpt", "reading_time"]
+# bulk_update doesn't apply auto_now; the feed and sitemap ETags derive from it
+UPDATED_FIELDS = [*DERIVED_FIELDS, "updated_at"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Regenera el HTML saneado, el texto plano, el extracto y el tiempo de "
+        "lectura de los posts (p. ej. tras cambiar las reglas de saneado)."
+    )
+
+    def add_arguments(self, parser):  # noqa: PLR6301
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Posts procesados por lote (default: 500).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        posts = Post.objects.only("id", "blog_id", "content").order_by("id")
+
+        total = 0
+        batch = []
+        now = timezone.now()
+        for post in posts.iterator(chunk_size=batch_size):
+            for field, value in process_content(post.content).items():
+                setattr(post, field, value)
+            post.updated_at = now
+            batch.append(post)
+            if len(batch) == batch_size:
+                total += self.save_batch(batch)
+                batch = []
+        total += self.save_batch(batch)
+
+        self.stdout.write(f"{total} posts procesados.")
+
+    @staticmethod
+    def save_batch(batch):
+        if not batch:
+            return 0
+        Post.objects.bulk_update(batch, UPDATED_FIELDS)
+        # bulk_update skips post_save: purge and log the changes explicitly
+        blog_ids = {post.blog_id for post in batch}
+        purge_surrogate_keys(*(blog_key(blog_id) for blog_id in blog_ids))
+        invalidate_feeds(blog_ids)
+        record_post_changes([post.id for post in batch])
+        return len(batch)
@@ -0,0 +1,67 @@
+import time
+
+from blog_app.seeding import DISTRIBUTIONS, seed_data, username_prefix
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera usuarios, blogs, posts y tags de prueba con bulk_create "
+        "(benchmarks y staging)."
+    )
+
+    def add_arguments(self, parser):  # noqa: PLR6301
+        parser.add_argument(
+            "--blogs", type=int, default=100, help="Un usuario por blog."
+        )
+        parser.add_argument(
+            "--posts-per-blog", type=int, default=50, help="Media (default: 50)."
+        )
+        parser.add_argument("--tags-per-blog", type=int, default=20)
+        parser.add_argument(
+            "--tags-per-post", type=int, default=3, help="Media (default: 3)."
+        )
+        parser.add_argument(
+            "--distribution",
+            choices=DISTRIBUTIONS,
+            default="fixed",
+            help="Reparto de posts por blog y tags por post: fijo, uniforme "
+            "(0..2x la media) o pareto (cola larga). Default: fixed.",
+        )
+        parser.add_argument(
+            "--draft-ratio", type=float, default=0.0, help="Fracción de borradores."
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Semilla: los mismos argumentos generan los mismos datos.",
+        )
+        parser.add_argument(
+            "--password", default="seed1234", help="Contraseña de todos los usuarios."
+        )
+
+    def handle(self, *args, **options):
+        prefix = username_prefix(options["seed"])
+        if User.objects.filter(username__startswith=prefix).exists():
+            raise CommandError(
+                f"Ya hay usuarios '{prefix}*': usa otra --seed o bórralos antes."
+            )
+
+        start = time.perf_counter()
+        counts = seed_data(
+            options["blogs"],
+            options["posts_per_blog"],
+            options["tags_per_blog"],
+            options["tags_per_post"],
+            distribution=options["distribution"],
+            draft_ratio=options["draft_ratio"],
+            password=options["password"],
+            seed=options["seed"],
+        )
+        self.stdout.write(
+            ", ".join(f"{count} {name}" for name, count in counts.items())
+            + f" creados en {time.perf_counter() - start:.1f} s."
+        )
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-19 09:00
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def populate_slugs(apps, schema_editor):
+    Blog = apps.get_model("blog_app", "Blog")
+    used = set()
+    for blog in Blog.objects.order_by("id"):
+        base = slugify(blog.title)[:100] or "blog"
+        slug, suffix = base, 1
+        while slug in used:
+            suffix += 1
+            slug = f"{base}-{suffix}"
+        used.add(slug)
+        blog.slug = slug
+        blog.save(update_fields=["slug"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog_app", "0007_blog_created_at_blog_updated_at_tag_created_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blog",
+            name="slug",
+            field=models.SlugField(blank=True, max_length=120, default=""),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="blog",
+            name="slug",
+            field=models.SlugField(blank=True, max_length=120, unique=True),
+        ),
+    ]
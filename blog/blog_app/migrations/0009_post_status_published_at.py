@@ -0,0 +1,56 @@
+# Generated by Django 5.2.7 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+def publish_existing_posts(apps, schema_editor):
+    # Posts created before this migration were already visible
+    Post = apps.get_model("blog_app", "Post")
+    Post.objects.filter(published_at__isnull=True).update(
+        published_at=models.F("created_at")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog_app", "0008_blog_slug"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="published_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("draft", "Borrador"),
+                    ("scheduled", "Programado"),
+                    ("published", "Publicado"),
+                ],
+                default="published",
+                max_length=10,
+            ),
+        ),
+        migrations.RunPython(publish_existing_posts, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["blog", "-published_at"],
+                name="post_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("status", "scheduled")),
+                fields=["published_at"],
+                name="post_scheduled_idx",
+            ),
+        ),
+    ]
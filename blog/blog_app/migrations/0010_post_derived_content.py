@@ -0,0 +1,105 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:00
+
+from html.parser import HTMLParser
+import math
+import re
+
+import nh3  # pyright: ignore[reportMissingImports]
+
+from django.db import migrations, models
+
+
+# The transformation is frozen here as it was when the columns were added, so
+# later changes to blog_app.content don't alter what this migration does.
+# `manage.py render_post_content` re-renders the posts with the current rules.
+BATCH_SIZE = 500
+DERIVED_FIELDS = ["content_html", "content_text", "excerpt", "reading_time"]
+EXCERPT_LENGTH = 280
+WORDS_PER_MINUTE = 200
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "ol", "p", "pre", "section", "table", "td", "th",
+    "tr", "ul",
+}  # fmt: skip
+WHITESPACE = re.compile(r"\s+")
+
+
+class TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+
+def process_content(html):
+    content_html = nh3.clean(html or "")
+    extractor = TextExtractor()
+    extractor.feed(content_html)
+    extractor.close()
+    text = WHITESPACE.sub(" ", "".join(extractor.parts)).strip()
+
+    excerpt = text
+    if len(text) > EXCERPT_LENGTH:
+        cut = text[: EXCERPT_LENGTH - 1].rsplit(" ", 1)[0].rstrip(" ,.;:")
+        excerpt = f"{cut}…"
+    words = len(text.split())
+    return {
+        "content_html": content_html,
+        "content_text": text,
+        "excerpt": excerpt,
+        "reading_time": max(1, math.ceil(words / WORDS_PER_MINUTE)) if words else 0,
+    }
+
+
+def render_existing_posts(apps, schema_editor):
+    Post = apps.get_model("blog_app", "Post")
+    batch = []
+    for post in Post.objects.only("id", "content").iterator(chunk_size=BATCH_SIZE):
+        for field, value in process_content(post.content).items():
+            setattr(post, field, value)
+        batch.append(post)
+        if len(batch) == BATCH_SIZE:
+            Post.objects.bulk_update(batch, DERIVED_FIELDS)
+            batch = []
+    Post.objects.bulk_update(batch, DERIVED_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog_app", "0009_post_status_published_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="content_html",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="content_text",
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="excerpt",
+            field=models.CharField(blank=True, editable=False, max_length=300),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="reading_time",
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(render_existing_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-19 12:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog_app", "0010_post_derived_content"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Change",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "model",
+                    models.CharField(
+                        choices=[("blog", "Blog"), ("post", "Post"), ("tag", "Tag")],
+                        max_length=10,
+                    ),
+                ),
+                ("object_id", models.PositiveIntegerField()),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[
+                            ("upsert", "Creado/actualizado"),
+                            ("delete", "Eliminado"),
+                        ],
+                        default="upsert",
+                        max_length=10,
+                    ),
+                ),
+                ("blog_id", models.PositiveIntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["blog_id", "id"], name="change_blog_idx")
+                ],
+            },
+        ),
+    ]
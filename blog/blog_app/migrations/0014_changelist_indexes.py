@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-19 12:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog_app", "0013_idempotency_key"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="blog",
+            index=models.Index(fields=["created_at"], name="blog_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(fields=["created_at"], name="post_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["blog", "-created_at"], name="post_blog_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tag",
+            index=models.Index(fields=["created_at"], name="tag_created_idx"),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-19 13:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog_app", "0014_changelist_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PostViewCount",
+            fields=[
+                (
+                    "post",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="view_count",
+                        serialize=False,
+                        to="blog_app.post",
+                    ),
+                ),
+                ("count", models.PositiveBigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
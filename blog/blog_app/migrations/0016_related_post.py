@@ -0,0 +1,56 @@
+# Generated by Django 5.2.7 on 2026-10-19 13:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog_app", "0015_post_view_count"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RelatedPost",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("score", models.FloatField()),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_links",
+                        to="blog_app.post",
+                    ),
+                ),
+                (
+                    "related",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_to",
+                        to="blog_app.post",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-score", "-related_id"],
+                "indexes": [
+                    models.Index(fields=["post", "-score"], name="related_post_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("post", "related"), name="unique_related_post"
+                    )
+                ],
+            },
+        ),
+    ]
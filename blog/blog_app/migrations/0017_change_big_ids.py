@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-19 13:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog_app", "0016_related_post"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="change",
+            name="blog_id",
+            field=models.PositiveBigIntegerField(),
+        ),
+        migrations.AlterField(
+            model_name="change",
+            name="object_id",
+            field=models.PositiveBigIntegerField(),
+        ),
+    ]
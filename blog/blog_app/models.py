@@ -1,34 +1,229 @@
+from blog_app.content import process_content
+
 from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.utils import timezone
+from django.utils.text import slugify
+
+
+def blog_display_name(title, username):
+    return f"{title} (Blog de {username})"
+
+
+def build_unique_slug(model, title, pk=None):
+    base = slugify(title)[:100] or "blog"
+    slug, suffix = base, 1
+    # Soft-deleted blogs keep their slug until they are purged
+    while model.all_objects.filter(slug=slug).exclude(pk=pk).exists():
+        suffix += 1
+        slug = f"{base}-{suffix}"
+    return slug
+
+
+class SoftDeleteQuerySet(models.QuerySet):
+    def soft_delete(self):
+        # Bulk flag: no signals (callers log/purge the changes themselves)
+        return self.update(deleted_at=timezone.now())
+
+
+class SoftDeleteManager(models.Manager):
+    """Default manager: hides the soft-deleted rows (``all_objects`` doesn't)."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
 
 
-class Blog(models.Model):
-    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="blog")
+class SoftDeleteModel(models.Model):
+    """Rows are flagged on delete and removed later by ``purge_deleted``."""
+
+    deleted_at = models.DateTimeField(blank=True, null=True, editable=False)
+
+    objects = SoftDeleteManager.from_queryset(SoftDeleteQuerySet)()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    def soft_delete(self):
+        self.deleted_at = timezone.now()
+        self.save(update_fields=["deleted_at"])
+
+
+class Blog(SoftDeleteModel):
+    # One live blog per user (unique_live_blog): a soft-deleted blog waiting
+    # for purge_deleted doesn't keep its owner from creating a new one
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="blogs")
     title = models.CharField(max_length=100)
+    slug = models.SlugField(
+        max_length=120, unique=True, blank=True
+    )  # Public URL of the blog (/api/public/blogs/<slug>/)
     description = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="unique_live_blog",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="blog_deleted_idx",
+            ),
+            # Admin changelists: date hierarchy (MIN/MAX) and default ordering
+            models.Index(fields=["created_at"], name="blog_created_idx"),
+        ]
+
     def __str__(self):
-        return f"{self.title} (Blog de {self.user.username})"
+        return blog_display_name(self.title, self.user.username)
+
+    def save(self, *args, **kwargs):
+        if not self.slug:
+            self.slug = build_unique_slug(Blog, self.title, self.pk)
+        super().save(*args, **kwargs)
+
 
+class PostQuerySet(SoftDeleteQuerySet):
+    def live(self):
+        # Matches the partial index "post_live_idx": drafts are never scanned
+        return self.filter(
+            status=Post.Status.PUBLISHED, published_at__lte=timezone.now()
+        ).order_by("-published_at")
+
+    def due_for_publishing(self, now=None):
+        return self.filter(
+            status=Post.Status.SCHEDULED, published_at__lte=now or timezone.now()
+        )
+
+
+class Post(SoftDeleteModel):
+    class Status(models.TextChoices):
+        DRAFT = "draft", "Borrador"
+        SCHEDULED = "scheduled", "Programado"
+        PUBLISHED = "published", "Publicado"
 
-class Post(models.Model):
     blog = models.ForeignKey(Blog, on_delete=models.CASCADE, related_name="posts")
     title = models.CharField(max_length=150)
     content = models.TextField()
     image = models.ImageField(upload_to="posts/", blank=True, null=True)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PUBLISHED
+    )
+    published_at = models.DateTimeField(
+        blank=True, null=True
+    )  # Publication date (future date + "scheduled" = scheduled publishing)
+    # Derived from "content" on save (see blog_app.content.process_content)
+    content_html = models.TextField(blank=True, editable=False)
+    content_text = models.TextField(blank=True, editable=False)
+    excerpt = models.CharField(max_length=300, blank=True, editable=False)
+    reading_time = models.PositiveSmallIntegerField(
+        default=0, editable=False
+    )  # minutes
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SoftDeleteManager.from_queryset(PostQuerySet)()
+    all_objects = PostQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["blog", "-published_at"],
+                condition=models.Q(status="published"),
+                name="post_live_idx",
+            ),
+            models.Index(
+                fields=["published_at"],
+                condition=models.Q(status="scheduled"),
+                name="post_scheduled_idx",
+            ),
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="post_deleted_idx",
+            ),
+            # Admin changelists: date hierarchy (MIN/MAX) and default ordering
+            models.Index(fields=["created_at"], name="post_created_idx"),
+            # Admin/API lists of one blog, newest first
+            models.Index(fields=["blog", "-created_at"], name="post_blog_created_idx"),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.blog.user.username})"
 
+    def save(self, *args, **kwargs):
+        if self.status == Post.Status.PUBLISHED and self.published_at is None:
+            self.published_at = timezone.now()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            derived = process_content(self.content)
+            for field, value in derived.items():
+                setattr(self, field, value)
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *derived}
+        super().save(*args, **kwargs)
+
+    @property
+    def views(self):
+        try:
+            return self.view_count.count
+        except PostViewCount.DoesNotExist:
+            return 0  # Not viewed yet (or its views are not flushed yet)
+
+
+class PostViewCount(models.Model):
+    """Views of a post, kept off the Post row so counting never locks it.
+
+    Written in batches by blog_app.view_counts (see ``record_view``).
+    """
+
+    post = models.OneToOneField(
+        Post, on_delete=models.CASCADE, primary_key=True, related_name="view_count"
+    )
+    count = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.post_id}: {self.count}"
+
+
+class RelatedPost(models.Model):
+    """A post of the same blog that shares tags with ``post``.
+
+    Only the RELATED_POSTS_LIMIT best ``score`` (Jaccard index of the tag
+    sets) are kept per post, recomputed by blog_app.related when tags change.
+    """
 
-class Tag(models.Model):
+    post = models.ForeignKey(
+        Post, on_delete=models.CASCADE, related_name="related_links"
+    )
+    related = models.ForeignKey(
+        Post, on_delete=models.CASCADE, related_name="related_to"
+    )
+    score = models.FloatField()
+
+    class Meta:
+        ordering = ["-score", "-related_id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["post", "related"], name="unique_related_post"
+            )
+        ]
+        indexes = [models.Index(fields=["post", "-score"], name="related_post_idx")]
+
+    def __str__(self):
+        return f"{self.post_id} -> {self.related_id} ({self.score:.2f})"
+
+
+class Tag(SoftDeleteModel):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     blog = models.ForeignKey(
@@ -43,8 +238,80 @@ class Tag(models.Model):
 
     class Meta:
         constraints = [
-            models.UniqueConstraint(fields=["blog", "name"], name="unique_tag_per_blog")
+            # A soft-deleted tag doesn't block re-creating the name
+            models.UniqueConstraint(
+                fields=["blog", "name"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="unique_tag_per_blog",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="tag_deleted_idx",
+            ),
+            # Admin changelists: date hierarchy (MIN/MAX) and default ordering
+            models.Index(fields=["created_at"], name="tag_created_idx"),
         ]
 
     def __str__(self):
         return self.name
+
+
+class Change(models.Model):
+    """Append-only log of Blog/Post/Tag changes behind the sync feed.
+
+    The pk is the feed token. ``blog_id`` is a plain integer (not a FK) so
+    that tombstones outlive the deleted rows.
+    """
+
+    class Model(models.TextChoices):
+        BLOG = "blog", "Blog"
+        POST = "post", "Post"
+        TAG = "tag", "Tag"
+
+    class Action(models.TextChoices):
+        UPSERT = "upsert", "Creado/actualizado"
+        DELETE = "delete", "Eliminado"
+
+    id = models.BigAutoField(primary_key=True)
+    model = models.CharField(max_length=10, choices=Model.choices)
+    object_id = models.PositiveBigIntegerField()  # Blog/Post/Tag ids are BigAutoField
+    action = models.CharField(
+        max_length=10, choices=Action.choices, default=Action.UPSERT
+    )
+    blog_id = models.PositiveBigIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["blog_id", "id"], name="change_blog_idx")]
+
+    def __str__(self):
+        return f"{self.id}: {self.action} {self.model} {self.object_id}"
+
+
+class IdempotencyKey(models.Model):
+    """Result of a create request, replayed to retries with the same key.
+
+    Rows older than ``IDEMPOTENCY_KEY_TTL`` are removed by
+    ``prune_idempotency_keys``.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    scope = models.CharField(max_length=50)  # e.g. "rest:post", "graphql:CreatePost"
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)  # sha256 of the request payload
+    status_code = models.PositiveSmallIntegerField(null=True)
+    response = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "scope", "key"], name="unique_idempotency_key"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.scope}: {self.key}"
@@ -0,0 +1,145 @@
+"""
+OpenAPI document served as a precomputed static asset.
+
+drf-yasg introspects every viewset and serializer to build the schema, so it
+is generated once: at build time with ``manage.py generate_openapi`` (written
+to ``OPENAPI_SCHEMA_FILE``) or, when that file is missing or was generated
+from other sources, on the first request of each process. The document is
+keyed on a hash of the project sources, so a deploy never serves a stale one.
+Swagger UI and ReDoc fetch it from ``/openapi.json`` instead of asking drf-yasg
+for it on every page load.
+"""
+
+from dataclasses import dataclass
+import functools
+import gzip
+import hashlib
+import json
+
+import drf_yasg
+from drf_yasg import openapi
+from drf_yasg.codecs import OpenAPICodecJson
+from drf_yasg.generators import OpenAPISchemaGenerator
+from drf_yasg.views import get_schema_view
+from rest_framework import permissions
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.views.decorators.http import condition, require_GET
+
+
+SOURCE_PACKAGES = ("blog", "blog_app", "auth_app")  # Whatever shapes the API
+VERSION_KEY = "x-code-version"
+UI_CACHE_TIMEOUT = 3600  # The UI pages no longer embed the schema
+
+INFO = openapi.Info(
+    title="Blog CMS API",
+    default_version="v1",
+    description="Documentación de la API del Blog CMS",
+    terms_of_service="https://www.google.com/policies/terms/",
+    contact=openapi.Contact(email="contacto@blogcms.com"),
+    license=openapi.License(name="MIT License"),
+)
+
+
+@dataclass(frozen=True)
+class SchemaDocument:
+    content: bytes
+    gzipped: bytes
+    etag: str
+
+
+@functools.cache
+def code_version():
+    """Hash of the sources the schema is generated from (and of drf-yasg)."""
+    digest = hashlib.sha256(drf_yasg.__version__.encode())
+    for package in SOURCE_PACKAGES:
+        for path in sorted((settings.BASE_DIR / package).rglob("*.py")):
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def render_schema():
+    """Run drf-yasg over every endpoint, as an anonymous GET would."""
+    request = Request(APIRequestFactory().get("/openapi.json"))
+    request.user = AnonymousUser()
+    generator = OpenAPISchemaGenerator(INFO, url="http://localhost")
+    schema = generator.get_schema(request, public=True)
+    # Relative to whichever host serves it, not to the fake request's
+    schema.pop("host", None)
+    schema.pop("schemes", None)
+    schema[VERSION_KEY] = code_version()
+    return OpenAPICodecJson(validators=[]).encode(schema)
+
+
+def write_schema(path=None):
+    path = path or settings.OPENAPI_SCHEMA_FILE
+    content = render_schema()
+    path.write_bytes(content)
+    return content
+
+
+def read_schema(path):
+    """The schema built at ``path``, or None if absent or from other sources."""
+    try:
+        content = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    if json.loads(content).get(VERSION_KEY) != code_version():
+        return None
+    return content
+
+
+@functools.cache
+def schema_document():
+    content = read_schema(settings.OPENAPI_SCHEMA_FILE) or render_schema()
+    return SchemaDocument(
+        content=content,
+        gzipped=gzip.compress(content, mtime=0),
+        etag=hashlib.sha256(content).hexdigest()[:32],
+    )
+
+
+def accepts_gzip(request):
+    return "gzip" in request.headers.get("Accept-Encoding", "")
+
+
+def schema_etag(request):
+    # One strong ETag per representation: the gzipped bytes are not the same
+    etag = schema_document().etag
+    return f"{etag}-gzip" if accepts_gzip(request) else etag
+
+
+@require_GET
+@condition(etag_func=schema_etag)
+def openapi_view(request):
+    document = schema_document()
+    if accepts_gzip(request):
+        response = HttpResponse(document.gzipped, content_type="application/json")
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(document.content, content_type="application/json")
+    response["Vary"] = "Accept-Encoding"
+    # Revalidated with If-None-Match: the ETag changes with every deploy
+    response["Cache-Control"] = "public, max-age=0, must-revalidate"
+    return response
+
+
+@functools.cache
+def ui_view(renderer):
+    # Built on first use, not when the URLconf is imported
+    schema_view = get_schema_view(
+        INFO, public=True, permission_classes=[permissions.AllowAny]
+    )
+    return schema_view.with_ui(renderer, cache_timeout=UI_CACHE_TIMEOUT)
+
+
+def swagger_view(request):
+    return ui_view("swagger")(request)
+
+
+def redoc_view(request):
+    return ui_view("redoc")(request)
@@ -0,0 +1,109 @@
+from rest_framework import generics
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.status import HTTP_200_OK, HTTP_204_NO_CONTENT
+from rest_framework.views import APIView
+
+from blog_app.cdn import (
+    blog_key,
+    blog_posts_key,
+    patch_public_cache_headers,
+    post_key,
+)
+from blog_app.view_counts import record_view
+
+from .models import Blog, Post
+from .renderers import ORJSONRenderer
+from .serializers import (
+    PublicBlogSerializer,
+    PublicPostSerializer,
+    PublicPostSummarySerializer,
+)
+
+from django.shortcuts import get_object_or_404
+
+
+class PublicPostPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class PublicCacheMixin:
+    """Anonymous, shared-cacheable responses tagged with surrogate keys."""
+
+    # No authentication: responses must not depend on (or vary by) the reader
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    renderer_classes = [ORJSONRenderer]
+
+    def get_blog(self):
+        if not hasattr(self, "_blog"):
+            self._blog = get_object_or_404(Blog, slug=self.kwargs["slug"])
+        return self._blog
+
+    def get_surrogate_keys(self, response):  # noqa: PLR6301
+        return []
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if request.method in {"GET", "HEAD"} and response.status_code == HTTP_200_OK:
+            patch_public_cache_headers(response, self.get_surrogate_keys(response))
+        return response
+
+
+class PublicBlogView(PublicCacheMixin, generics.RetrieveAPIView):
+    serializer_class = PublicBlogSerializer
+
+    def get_object(self):
+        return self.get_blog()
+
+    def get_surrogate_keys(self, response):
+        return [blog_key(self.get_blog().pk)]
+
+
+class PublicPostListView(PublicCacheMixin, generics.ListAPIView):
+    serializer_class = PublicPostSummarySerializer
+    pagination_class = PublicPostPagination
+
+    def get_queryset(self):
+        # Listings ship the excerpt only: the bodies are never read from the DB
+        return (
+            Post.objects.live()
+            .filter(blog=self.get_blog())
+            .defer("content", "content_html", "content_text")
+            .prefetch_related("tags")
+        )
+
+    def get_surrogate_keys(self, response):
+        blog_id = self.get_blog().pk
+        post_keys = [post_key(post["id"]) for post in response.data["results"]]
+        return [blog_key(blog_id), blog_posts_key(blog_id), *post_keys]
+
+
+class PublicPostDetailView(PublicCacheMixin, generics.RetrieveAPIView):
+    serializer_class = PublicPostSerializer
+
+    def get_queryset(self):
+        if getattr(self, "swagger_fake_view", False):  # OpenAPI generation
+            return Post.objects.none()
+        return Post.objects.live().filter(blog=self.get_blog()).prefetch_related("tags")
+
+    def get_surrogate_keys(self, response):
+        return [blog_key(self.get_blog().pk), post_key(self.kwargs["pk"])]
+
+
+class PublicPostViewCountView(PublicCacheMixin, APIView):
+    """``POST``: counts a view of the post.
+
+    Sent by the frontend on every page view, since the post detail is
+    served by the CDN without reaching the app.
+    """
+
+    def post(self, request, slug, pk):  # noqa: PLR6301
+        if not Post.objects.live().filter(blog__slug=slug, pk=pk).exists():
+            raise NotFound
+        record_view(pk)
+        return Response(status=HTTP_204_NO_CONTENT)
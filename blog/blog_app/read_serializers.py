@@ -0,0 +1,173 @@
+from collections import defaultdict
+from operator import itemgetter
+
+from rest_framework import serializers
+from rest_framework.response import Response
+
+from blog_app.instrumentation import track_serializer
+from blog_app.models import Post, Tag, blog_display_name
+
+from .serializers import BlogSerializer, PostSerializer, TagSerializer
+
+
+BLOG_NAME_COLUMNS = ("blog__title", "blog__user__username")
+
+to_datetime = serializers.DateTimeField().to_representation
+
+
+def blog_name(row):
+    # Same text as StringRelatedField -> str(blog)
+    return blog_display_name(row["blog__title"], row["blog__user__username"])
+
+
+def post_views(row):
+    # Same value as Post.views: 0 until the first views are flushed
+    return row["view_count__count"] or 0
+
+
+def group_links(links):
+    grouped = defaultdict(list)
+    for key, value in links:
+        grouped[key].append(value)
+    return grouped
+
+
+class ValuesReadSerializer:
+    """Read-only rendering of ``serializer_class`` from ``.values()`` rows.
+
+    The output is the same as the ModelSerializer's, but the field plan
+    (column + formatter per field) is compiled once per call: no model
+    instances, field binding or attribute lookups per row. Each rendered
+    relation costs one extra query for the whole list.
+    """
+
+    serializer_class = None
+    datetime_fields = ()
+    computed_fields = {}  # field -> (columns, function(row))
+    relation_fields = {}  # field -> method(ids) -> {id: rendered value}
+
+    def __init__(self, fields=None, expand=(), omit=()):
+        # Same selection rules as SparseFieldsSerializerMixin
+        names = self.serializer_class.Meta.fields
+        if fields is not None:
+            keep = {*fields, *expand}
+            names = [name for name in names if name in keep]
+        self.fields = [name for name in names if name not in omit]
+
+    def serialize(self, queryset):
+        return [item for _, item in self.render(queryset)]
+
+    def serialize_grouped(self, queryset, key):
+        grouped = defaultdict(list)
+        for group, item in self.render(queryset, key):
+            grouped[group].append(item)
+        return grouped
+
+    def render(self, queryset, key="id"):
+        with track_serializer():
+            return self.render_rows(queryset, key)
+
+    def render_rows(self, queryset, key):
+        columns = {"id", key}
+        for name in self.fields:
+            if name in self.computed_fields:
+                columns.update(self.computed_fields[name][0])
+            elif name not in self.relation_fields:
+                columns.add(name)
+        rows = list(queryset.values(*columns))
+
+        ids = [row["id"] for row in rows]
+        plan = []
+        for name in self.fields:
+            if name in self.relation_fields:
+                related = getattr(self, self.relation_fields[name])(ids)
+                plan.append((name, self.relation_getter(related)))
+            elif name in self.computed_fields:
+                plan.append((name, self.computed_fields[name][1]))
+            elif name in self.datetime_fields:
+                plan.append((name, self.datetime_getter(name)))
+            else:
+                plan.append((name, itemgetter(name)))
+
+        get_key = itemgetter(key)
+        return [
+            (get_key(row), {name: getter(row) for name, getter in plan}) for row in rows
+        ]
+
+    @staticmethod
+    def relation_getter(related):
+        return lambda row: related.get(row["id"], [])
+
+    @staticmethod
+    def datetime_getter(name):
+        return lambda row: to_datetime(row[name])
+
+
+class TagReadSerializer(ValuesReadSerializer):
+    serializer_class = TagSerializer
+    computed_fields = {"blog": (BLOG_NAME_COLUMNS, blog_name)}
+    relation_fields = {"posts": "get_posts"}
+
+    def get_posts(self, tag_ids):  # noqa: PLR6301
+        # Same order as the POST_PKS prefetch
+        links = (
+            Tag.posts.through.objects.filter(
+                tag_id__in=tag_ids, post__deleted_at__isnull=True
+            )
+            .order_by("-post__created_at", "-post_id")
+            .values_list("tag_id", "post_id")
+        )
+        return group_links(links)
+
+
+class PostReadSerializer(ValuesReadSerializer):
+    serializer_class = PostSerializer
+    datetime_fields = ("published_at", "created_at", "updated_at")
+    computed_fields = {
+        "blog": (BLOG_NAME_COLUMNS, blog_name),
+        "views": (("view_count__count",), post_views),
+    }
+    relation_fields = {"tags": "get_tags"}
+
+    def get_tags(self, post_ids):  # noqa: PLR6301
+        # Same order as the POST_TAGS_PREFETCH
+        links = list(
+            Tag.posts.through.objects.filter(
+                post_id__in=post_ids, tag__deleted_at__isnull=True
+            )
+            .order_by("tag_id")
+            .values_list("post_id", "tag_id")
+        )
+        tags = TagReadSerializer().render(
+            Tag.objects.filter(id__in={tag_id for _, tag_id in links})
+        )
+        rendered = dict(tags)
+        return group_links((post_id, rendered[tag_id]) for post_id, tag_id in links)
+
+
+class BlogReadSerializer(ValuesReadSerializer):
+    serializer_class = BlogSerializer
+    relation_fields = {"posts": "get_posts"}
+
+    def get_posts(self, blog_ids):  # noqa: PLR6301
+        # Same order as the BLOG_POSTS_PREFETCH
+        posts = Post.objects.filter(blog_id__in=blog_ids).order_by("-created_at", "-id")
+        return PostReadSerializer().serialize_grouped(posts, "blog_id")
+
+
+class ValuesListMixin:
+    """List action rendered with ``read_serializer_class`` (no ModelSerializer).
+
+    Honours the ``?fields=``/``?expand=``/``?excerpt=`` options of
+    SparseFieldsetMixin; paginated viewsets keep the regular list.
+    """
+
+    read_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        if self.read_serializer_class is None or self.paginator is not None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None)
+        serializer = self.read_serializer_class(**self.get_sparse_options())
+        return Response(serializer.serialize(queryset))
@@ -0,0 +1,86 @@
+"""
+Related posts: the posts of the same blog with the most similar tags.
+
+The similarity of two posts is the Jaccard index of their tag sets
+(shared tags / tags of either). The RELATED_POSTS_LIMIT best of each post are
+stored in RelatedPost, so reading them is an indexed lookup instead of a
+self-join of the post-tag table. When the tags of some posts change, only
+the lists that can change are recomputed: those of the changed posts, of the
+posts sharing a tag with them and of the posts that listed them.
+"""
+
+from collections import defaultdict
+import heapq
+
+from blog_app.models import Post, RelatedPost, Tag
+
+from django.conf import settings
+from django.db import transaction
+
+
+def blog_tag_sets(blog_id):
+    """``{post_id: {tag_id, ...}}`` of the live posts and tags of the blog."""
+    links = Tag.posts.through.objects.filter(
+        tag__blog_id=blog_id,
+        tag__deleted_at__isnull=True,
+        post__deleted_at__isnull=True,
+    ).values_list("post_id", "tag_id")
+    tag_sets = defaultdict(set)
+    for post_id, tag_id in links:
+        tag_sets[post_id].add(tag_id)
+    return tag_sets
+
+
+def top_related(post_id, tag_sets, posts_by_tag, limit):
+    tags = tag_sets.get(post_id, set())
+    candidates = {other for tag in tags for other in posts_by_tag[tag]} - {post_id}
+    scored = (
+        (len(tags & tag_sets[other]) / len(tags | tag_sets[other]), other)
+        for other in candidates
+    )
+    # Ties: the newest post (highest id) first, as the read query orders them
+    return heapq.nlargest(limit, scored)
+
+
+def refresh_related_posts(blog_id, post_ids, tags_removed=True):
+    """Recompute the related posts after the tags of ``post_ids`` changed."""
+    tag_sets = blog_tag_sets(blog_id)
+    posts_by_tag = defaultdict(set)
+    for post_id, tags in tag_sets.items():
+        for tag in tags:
+            posts_by_tag[tag].add(post_id)
+
+    affected = set(post_ids)
+    for post_id in post_ids:
+        for tag in tag_sets.get(post_id, ()):
+            affected |= posts_by_tag[tag]
+    if tags_removed:
+        # Posts that no longer share a tag with them but still list them (when
+        # tags are only added, every post that listed them still shares one)
+        affected.update(
+            RelatedPost.objects.filter(related_id__in=post_ids).values_list(
+                "post_id", flat=True
+            )
+        )
+
+    limit = settings.RELATED_POSTS_LIMIT
+    # Part of the caller's transaction when there is one (m2m add/remove)
+    with transaction.atomic(savepoint=False):
+        RelatedPost.objects.filter(post_id__in=affected).delete()
+        RelatedPost.objects.bulk_create(
+            RelatedPost(post_id=post_id, related_id=related_id, score=score)
+            for post_id in sorted(affected)
+            for score, related_id in top_related(post_id, tag_sets, posts_by_tag, limit)
+        )
+    return len(affected)
+
+
+def rebuild_related_posts(blog_id):
+    post_ids = Post.all_objects.filter(blog_id=blog_id).values_list("id", flat=True)
+    return refresh_related_posts(blog_id, list(post_ids))
+
+
+def get_related_posts(post_id):
+    return Post.objects.filter(related_to__post_id=post_id).order_by(
+        "-related_to__score", "-id"
+    )
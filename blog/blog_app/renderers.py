@@ -0,0 +1,42 @@
+import orjson  # pyright: ignore[reportMissingImports]
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+# Types orjson doesn't know (Decimal, lazy strings, QuerySets...) and
+# datetimes (passed through so they keep DRF's "Z" format) use DRF's encoder
+drf_default = JSONEncoder().default
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+    format = "json"
+    charset = None  # orjson always returns UTF-8 bytes
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=drf_default, option=option)
+
+    @staticmethod
+    def get_indent(accepted_media_type, renderer_context):
+        # Same switches as DRF's JSONRenderer: "; indent=N" or the context
+        if accepted_media_type and "indent=" in accepted_media_type:
+            return True
+        return bool(renderer_context.get("indent"))
+
+
+class ORJSONParser(BaseParser):
+    media_type = "application/json"
+
+    def parse(self, stream, media_type=None, parser_context=None):  # noqa: PLR6301
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as e:
+            raise ParseError(f"JSON parse error - {e}") from e
@@ -1,34 +1,38 @@
 from auth_app.utils.helpers import check_user_authenticated
 import graphene  # pyright: ignore[reportMissingImports]
 
+from blog_app.idempotency import idempotent_mutation
 from blog_app.models import Blog
 from blog_app.schema.types import BlogType
 from blog_app.serializers import BlogSerializer
 from blog_app.utils.constants import (
     DEFAULT_BLOG_DESCRIPTION,
     ERROR_BLOG_NOT_FOUND,
-    ERROR_BLOG_USER_HAS_BLOG,
     ERROR_DONT_HAVE_PERMISSION_TO_EDIT_BLOG,
     SUCCESS_BLOG_CREATED,
     SUCCESS_BLOG_UPDATED,
 )
+from blog_app.utils.helpers import get_blog_creation_error
 
 
 class CreateBlog(graphene.Mutation):
     class Arguments:
         title = graphene.String(required=True)
         description = graphene.String(required=False)
+        idempotency_key = graphene.String(required=False)
 
     blog = graphene.Field(BlogType)
     errors = graphene.List(graphene.String)
     message = graphene.String()
 
+    @idempotent_mutation("blog")
     def mutate(self, info, title, description=None):  # noqa: PLR6301
         user = check_user_authenticated(info)
 
         if not user.is_superuser:
-            if Blog.objects.filter(user=user).exists():
-                return CreateBlog(blog=None, errors=[ERROR_BLOG_USER_HAS_BLOG])
+            error = get_blog_creation_error(user)
+            if error:
+                return CreateBlog(blog=None, errors=[error])
 
         data = {
             "title": title,
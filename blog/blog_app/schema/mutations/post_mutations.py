@@ -2,6 +2,7 @@ from auth_app.utils.helpers import check_user_authenticated
 import graphene  # pyright: ignore[reportMissingImports]
 from rest_framework.exceptions import PermissionDenied
 
+from blog_app.idempotency import idempotent_mutation
 from blog_app.models import Post
 from blog_app.schema.types import PostType
 from blog_app.serializers import PostSerializer
@@ -18,12 +19,18 @@ class CreatePost(graphene.Mutation):
     class Arguments:
         title = graphene.String(required=True)
         content = graphene.String(required=True)
+        status = graphene.String(required=False)
+        published_at = graphene.DateTime(required=False)
+        idempotency_key = graphene.String(required=False)
 
     post = graphene.Field(PostType)
     errors = graphene.List(graphene.String)
     message = graphene.String()
 
-    def mutate(self, info, title, content):  # noqa: PLR6301
+    @idempotent_mutation("post")
+    def mutate(  # noqa: PLR6301
+        self, info, title, content, status=None, published_at=None
+    ):
         user = check_user_authenticated(info)
 
         try:
@@ -31,10 +38,13 @@ class CreatePost(graphene.Mutation):
         except PermissionDenied as e:
             return CreatePost(post=None, errors=[str(e)], message=None)
 
-        serializer = PostSerializer(
-            data={"title": title, "content": content},
-            context={"request": info.context},
-        )
+        data = {"title": title, "content": content}
+        if status is not None:
+            data["status"] = status
+        if published_at is not None:
+            data["published_at"] = published_at
+
+        serializer = PostSerializer(data=data, context={"request": info.context})
 
         if serializer.is_valid():
             post = serializer.save(blog=blog)
@@ -49,12 +59,16 @@ class UpdatePost(graphene.Mutation):
         id = graphene.ID(required=True)
         title = graphene.String(required=False)
         content = graphene.String(required=False)
+        status = graphene.String(required=False)
+        published_at = graphene.DateTime(required=False)
 
     post = graphene.Field(PostType)
     errors = graphene.List(graphene.String)
     message = graphene.String()
 
-    def mutate(self, info, id, title=None, content=None):  # noqa: PLR6301
+    def mutate(  # noqa: PLR6301
+        self, info, id, title=None, content=None, status=None, published_at=None
+    ):
         user = check_user_authenticated(info)
 
         try:
@@ -71,6 +85,10 @@ class UpdatePost(graphene.Mutation):
             "title": title if title is not None else post.title,
             "content": content if content is not None else post.content,
         }
+        if status is not None:
+            data["status"] = status
+        if published_at is not None:
+            data["published_at"] = published_at
 
         serializer = PostSerializer(post, data=data, partial=True)
 
@@ -101,5 +119,5 @@ class DeletePost(graphene.Mutation):
         posts_qs = Post.objects.filter(id=id)
         validate_posts_for_user(user, post_ids, posts_qs)
 
-        post.delete()
+        post.soft_delete()
         return DeletePost(errors=[], message=SUCCESS_POST_DELETED)
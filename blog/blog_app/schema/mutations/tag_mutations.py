@@ -2,6 +2,7 @@ from auth_app.utils.helpers import check_user_authenticated
 import graphene  # pyright: ignore[reportMissingImports]
 from rest_framework.exceptions import PermissionDenied
 
+from blog_app.idempotency import idempotent_mutation
 from blog_app.models import Post, Tag
 from blog_app.schema.types import TagType
 from blog_app.utils.constants import (
@@ -21,11 +22,13 @@ class CreateTag(graphene.Mutation):
     class Arguments:
         name = graphene.String(required=True)
         post_ids = graphene.List(graphene.Int, required=True)
+        idempotency_key = graphene.String(required=False)
 
     tag = graphene.Field(TagType)
     errors = graphene.List(graphene.String)
     message = graphene.String()
 
+    @idempotent_mutation("tag")
     def mutate(self, info, name, post_ids):  # noqa: PLR6301
         user = check_user_authenticated(info)
 
@@ -111,5 +114,5 @@ class DeleteTag(graphene.Mutation):
             except (ValueError, PermissionDenied) as e:
                 return DeleteTag(errors=[str(e)])
 
-        tag.delete()
+        tag.soft_delete()
         return DeleteTag(errors=[], message=SUCCESS_TAG_DELETED)
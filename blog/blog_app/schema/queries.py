@@ -1,29 +1,94 @@
 from auth_app.utils.helpers import check_user_authenticated
 import graphene  # pyright: ignore[reportMissingImports]
+from graphql import FieldNode, FragmentSpreadNode, InlineFragmentNode
 
-from blog_app.models import Blog, Post, Tag
-from blog_app.schema.types import BlogType, PostType, TagType
+from blog_app.changes import get_changes, load_changed_objects
+from blog_app.models import Change
+from blog_app.schema.types import BlogType, ChangeFeedType, PostType, TagType
+from blog_app.tag_index import suggest_tags
+from blog_app.utils.helpers import (
+    RELATED_POSTS_PREFETCH,
+    get_visible_blogs,
+    get_visible_posts,
+    get_visible_tags,
+)
+
+
+def child_fields(info, selection_set):
+    """Field nodes of a selection set, through fragments and inline fragments."""
+    for selection in selection_set.selections if selection_set else ():
+        if isinstance(selection, FieldNode):
+            yield selection
+        elif isinstance(selection, InlineFragmentNode):
+            yield from child_fields(info, selection.selection_set)
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = info.fragments[selection.name.value]
+            yield from child_fields(info, fragment.selection_set)
+
+
+def selects(info, *path):
+    """Whether the resolved field asks for ``path`` (GraphQL field names)."""
+    nodes = info.field_nodes
+    for name in path:
+        nodes = [
+            field
+            for node in nodes
+            for field in child_fields(info, node.selection_set)
+            if field.name.value == name
+        ]
+    return bool(nodes)
 
 
 class Query(graphene.ObjectType):
     all_blogs = graphene.List(BlogType)
-    all_posts = graphene.List(PostType)
+    all_posts = graphene.List(PostType, live=graphene.Boolean())
     all_tags = graphene.List(TagType)
+    changes = graphene.Field(
+        ChangeFeedType, since=graphene.String(), limit=graphene.Int()
+    )
+    tag_suggestions = graphene.List(graphene.String, q=graphene.String(required=True))
 
     def resolve_all_blogs(self, info):  # noqa: PLR6301
         user = check_user_authenticated(info)
-        if user.is_superuser:
-            return Blog.objects.all()
-        return Blog.objects.filter(user=user)
+        return get_visible_blogs(user)
 
-    def resolve_all_posts(self, info):  # noqa: PLR6301
+    def resolve_all_posts(self, info, live=False):  # noqa: PLR6301
         user = check_user_authenticated(info)
-        if user.is_superuser:
-            return Post.objects.all()
-        return Post.objects.filter(blog__user=user)
+        posts = get_visible_posts(user).select_related("view_count")
+        if selects(info, "relatedPosts"):
+            posts = posts.prefetch_related(RELATED_POSTS_PREFETCH)
+        return posts.live() if live else posts
 
     def resolve_all_tags(self, info):  # noqa: PLR6301
         user = check_user_authenticated(info)
-        if user.is_superuser:
-            return Tag.objects.all()
-        return Tag.objects.filter(posts__blog__user=user).distinct()
+        return get_visible_tags(user)
+
+    def resolve_tag_suggestions(self, info, q):  # noqa: PLR6301
+        user = check_user_authenticated(info)
+        return suggest_tags(user, q)
+
+    def resolve_changes(self, info, since=None, limit=None):  # noqa: PLR6301
+        user = check_user_authenticated(info)
+        changes, next_token, has_more = get_changes(user, since, limit)
+        posts = get_visible_posts(user).select_related("view_count")
+        if selects(info, "changes", "post", "relatedPosts"):
+            posts = posts.prefetch_related(RELATED_POSTS_PREFETCH)
+        changes, rows = load_changed_objects(
+            changes,
+            {
+                Change.Model.BLOG: lambda ids: get_visible_blogs(user)
+                .filter(id__in=ids)
+                .in_bulk()
+                .items(),
+                Change.Model.POST: lambda ids: posts.filter(id__in=ids)
+                .in_bulk()
+                .items(),
+                Change.Model.TAG: lambda ids: get_visible_tags(user)
+                .filter(id__in=ids)
+                .in_bulk()
+                .items(),
+            },
+        )
+        for change in changes:
+            change.rows = rows
+        return {"changes": changes, "next": next_token, "has_more": has_more}
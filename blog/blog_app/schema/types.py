@@ -2,6 +2,7 @@ import graphene  # pyright: ignore[reportMissingImports]
 from graphene_django import DjangoObjectType  # pyright: ignore[reportMissingImports]
 
 from blog_app.models import Blog, Post, Tag
+from blog_app.related import get_related_posts
 
 
 class UserType(graphene.ObjectType):
@@ -19,12 +20,64 @@ class BlogType(DjangoObjectType):
 
 
 class PostType(DjangoObjectType):
+    views = graphene.Int()  # Post.views
+    related_posts = graphene.List(lambda: PostType)
+
     class Meta:
         model = Post
-        fields = ("id", "title", "content", "created_at", "updated_at", "blog", "tags")
+        fields = (
+            "id",
+            "title",
+            "content",
+            "content_html",
+            "excerpt",
+            "reading_time",
+            "status",
+            "published_at",
+            "created_at",
+            "updated_at",
+            "blog",
+            "tags",
+        )
+
+    def resolve_related_posts(self, info):  # noqa: PLR6301
+        links = getattr(self, "prefetched_related_links", None)
+        if links is None:  # Not fetched with RELATED_POSTS_PREFETCH
+            return get_related_posts(self.pk).select_related("view_count")
+        return [link.related for link in links]
 
 
 class TagType(DjangoObjectType):
     class Meta:
         model = Tag
         fields = ("id", "name", "posts")
+
+
+class ChangeType(graphene.ObjectType):
+    token = graphene.String()
+    model = graphene.String()
+    object_id = graphene.ID()
+    action = graphene.String()
+    created_at = graphene.DateTime()
+    # Current state of the object (null for tombstones)
+    blog = graphene.Field(BlogType)
+    post = graphene.Field(PostType)
+    tag = graphene.Field(TagType)
+
+    def resolve_token(self, info):  # noqa: PLR6301
+        return str(self.id)
+
+    def resolve_blog(self, info):  # noqa: PLR6301
+        return self.rows.get(("blog", self.object_id))
+
+    def resolve_post(self, info):  # noqa: PLR6301
+        return self.rows.get(("post", self.object_id))
+
+    def resolve_tag(self, info):  # noqa: PLR6301
+        return self.rows.get(("tag", self.object_id))
+
+
+class ChangeFeedType(graphene.ObjectType):
+    changes = graphene.List(ChangeType)
+    next = graphene.String()
+    has_more = graphene.Boolean()
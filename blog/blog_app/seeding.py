@@ -0,0 +1,182 @@
+"""
+Bulk generation of users, blogs, posts and tags (``manage.py seed``).
+
+Rows are inserted with ``bulk_create`` in chunks, so neither ``save()`` nor
+the signals run: what they would have done (slug, derived content, change
+log, related posts) is filled in here. Every user shares one precomputed password hash and
+all the values come from ``random.Random(seed)``: the same arguments always
+generate the same data.
+"""
+
+from datetime import timedelta
+import random
+
+from blog_app.content import process_content
+from blog_app.models import Blog, Change, Post, Tag
+from blog_app.related import refresh_related_posts
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+
+CHUNK_SIZE = 2000
+BLOGS_PER_TRANSACTION = 200  # Bounds the rows held in memory at once
+CONTENT_VARIANTS = 50  # Distinct bodies: process_content runs once per body
+PARETO_ALPHA = 1.16  # 80/20: a fifth of the blogs hold most of the posts
+MINUTES_PER_YEAR = 525600
+DISTRIBUTIONS = ("fixed", "uniform", "pareto")
+WORDS = (
+    "django api blog post tag python cache query index async server client "
+    "database model view token user data feed schema deploy worker request "
+    "response latency release review design guide update note story idea"
+).split()
+
+
+def sample_count(rng, mean, distribution):
+    """A count with the given ``mean``: always it, 0..2*mean or long-tailed."""
+    if distribution == "fixed" or mean == 0:
+        return mean
+    if distribution == "uniform":
+        return rng.randint(0, 2 * mean)
+    scale = mean * (PARETO_ALPHA - 1) / PARETO_ALPHA
+    return min(round(rng.paretovariate(PARETO_ALPHA) * scale), 100 * mean)
+
+
+def username_prefix(seed):
+    return f"seed{seed}-"
+
+
+def sentence(rng, words):
+    return " ".join(rng.choices(WORDS, k=words)).capitalize()
+
+
+def build_contents(rng):
+    contents = []
+    for _ in range(CONTENT_VARIANTS):
+        content = "".join(
+            f"<p>{sentence(rng, rng.randint(20, 60))}.</p>"
+            for _ in range(rng.randint(2, 8))
+        )
+        contents.append((content, process_content(content)))
+    return contents
+
+
+def change_rows(model, rows):
+    # What the post_save signals would have logged for the change feed
+    return [
+        Change(model=model, object_id=row.pk, blog_id=getattr(row, "blog_id", row.pk))
+        for row in rows
+    ]
+
+
+def seed_data(
+    blogs,
+    posts_per_blog,
+    tags_per_blog,
+    tags_per_post,
+    distribution="fixed",
+    draft_ratio=0.0,
+    password="seed1234",
+    seed=0,
+):
+    """Create ``blogs`` users with a blog each; returns ``{model: count}``.
+
+    ``posts_per_blog`` and ``tags_per_post`` are means, spread over the
+    blogs/posts following ``distribution``.
+    """
+    rng = random.Random(seed)
+    password_hash = make_password(password)
+    contents = build_contents(rng)
+    now = timezone.now()
+    counts = dict.fromkeys(("users", "blogs", "posts", "tags", "tag_posts"), 0)
+
+    for start in range(0, blogs, BLOGS_PER_TRANSACTION):
+        numbers = range(start, min(start + BLOGS_PER_TRANSACTION, blogs))
+        with transaction.atomic():
+            users = User.objects.bulk_create(
+                [
+                    User(
+                        username=f"{username_prefix(seed)}{number}",
+                        password=password_hash,
+                    )
+                    for number in numbers
+                ],
+                batch_size=CHUNK_SIZE,
+            )
+            blog_rows = []
+            for user in users:
+                title = sentence(rng, rng.randint(2, 5))
+                blog_rows.append(
+                    Blog(
+                        user=user,
+                        title=title,
+                        slug=f"{slugify(title)[:100]}-{user.pk}",
+                        description=sentence(rng, 20),
+                    )
+                )
+            blog_rows = Blog.objects.bulk_create(blog_rows, batch_size=CHUNK_SIZE)
+
+            tag_rows = Tag.objects.bulk_create(
+                [
+                    Tag(blog=blog, name=f"{rng.choice(WORDS)}-{number}")
+                    for blog in blog_rows
+                    for number in range(tags_per_blog)
+                ],
+                batch_size=CHUNK_SIZE,
+            )
+            post_rows = []
+            for blog in blog_rows:
+                for _ in range(sample_count(rng, posts_per_blog, distribution)):
+                    content, derived = rng.choice(contents)
+                    post = Post(
+                        blog=blog,
+                        title=sentence(rng, rng.randint(3, 10)),
+                        content=content,
+                        **derived,
+                    )
+                    if rng.random() < draft_ratio:
+                        post.status = Post.Status.DRAFT
+                    else:  # Published at some point of the last year
+                        post.published_at = now - timedelta(
+                            minutes=rng.randint(0, MINUTES_PER_YEAR)
+                        )
+                    post_rows.append(post)
+            post_rows = Post.objects.bulk_create(post_rows, batch_size=CHUNK_SIZE)
+
+            tags_by_blog = {}
+            for tag in tag_rows:
+                tags_by_blog.setdefault(tag.blog_id, []).append(tag.pk)
+            links = []
+            for post in post_rows:
+                blog_tags = tags_by_blog.get(post.blog_id, [])
+                count = sample_count(rng, tags_per_post, distribution)
+                links += [
+                    Tag.posts.through(post_id=post.pk, tag_id=tag_id)
+                    for tag_id in rng.sample(blog_tags, min(count, len(blog_tags)))
+                ]
+            Tag.posts.through.objects.bulk_create(links, batch_size=CHUNK_SIZE)
+
+            posts_by_blog = {}
+            for post in post_rows:
+                posts_by_blog.setdefault(post.blog_id, []).append(post.pk)
+            for blog_id, post_ids in posts_by_blog.items():
+                refresh_related_posts(blog_id, post_ids, tags_removed=False)
+
+            Change.objects.bulk_create(
+                [
+                    *change_rows(Change.Model.BLOG, blog_rows),
+                    *change_rows(Change.Model.POST, post_rows),
+                    *change_rows(Change.Model.TAG, tag_rows),
+                ],
+                batch_size=CHUNK_SIZE,
+            )
+
+        counts["users"] += len(users)
+        counts["blogs"] += len(blog_rows)
+        counts["posts"] += len(post_rows)
+        counts["tags"] += len(tag_rows)
+        counts["tag_posts"] += len(links)
+    return counts
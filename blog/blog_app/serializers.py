@@ -1,14 +1,53 @@
 from auth_app.utils.helpers import admin_permissions, create_user
 from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
 
+from blog_app.instrumentation import TimedSerializerMixin
 from blog_app.models import Blog, Post, Tag
-from blog_app.utils.helpers import get_user_blog
+from blog_app.sparse import SparseFieldsSerializerMixin
+from blog_app.utils.constants import ERROR_SCHEDULED_POST_NEEDS_DATE
+from blog_app.utils.helpers import get_user_blog, validate_posts_for_user
 
 from django.contrib.auth.models import User
-
-
-class TagSerializer(serializers.ModelSerializer):
-    posts = serializers.PrimaryKeyRelatedField(
+from django.core.exceptions import ValidationError as DjangoValidationError
+
+
+class BulkManyRelatedField(serializers.ManyRelatedField):
+    """Looks all the primary keys up in one query instead of one per item."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        relation = self.child_relation
+        pk_field = relation.get_queryset().model._meta.pk
+        try:
+            pks = [pk_field.to_python(pk) for pk in data]
+        except (TypeError, ValueError, DjangoValidationError):
+            relation.fail("incorrect_type", data_type=type(data).__name__)
+        found = relation.get_queryset().in_bulk(pks)
+        for pk in pks:
+            if pk not in found:
+                relation.fail("does_not_exist", pk_value=pk)
+        return [found[pk] for pk in pks]
+
+
+class BulkPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BulkManyRelatedField(**list_kwargs)
+
+
+class TagSerializer(
+    TimedSerializerMixin, SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
+    posts = BulkPrimaryKeyRelatedField(
         many=True, queryset=Post.objects.all(), required=False
     )
     blog = serializers.StringRelatedField(read_only=True)
@@ -19,27 +58,98 @@ class TagSerializer(serializers.ModelSerializer):
 
     def validate(self, attrs):
         user = self.context["request"].user
-        get_user_blog(user)
+        blog = get_user_blog(user)
+        if self.instance is None or "posts" in attrs:
+            post_ids = [post.id for post in attrs.get("posts", [])]
+            try:
+                validate_posts_for_user(
+                    user, post_ids, Post.objects.filter(id__in=post_ids)
+                )
+            except ValueError as e:
+                raise serializers.ValidationError({"posts": str(e)}) from e
+        if self.instance is None:
+            attrs["blog"] = blog  # Reused by TagViewSet.perform_create
         return attrs
 
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(
+    TimedSerializerMixin, SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     tags = TagSerializer(many=True, read_only=True)
     blog = serializers.StringRelatedField(read_only=True)
+    views = serializers.IntegerField(read_only=True)  # Post.views
 
     class Meta:
         model = Post
-        fields = ["id", "title", "content", "created_at", "updated_at", "blog", "tags"]
+        fields = [
+            "id",
+            "title",
+            "content",
+            "content_html",
+            "excerpt",
+            "reading_time",
+            "views",
+            "status",
+            "published_at",
+            "created_at",
+            "updated_at",
+            "blog",
+            "tags",
+        ]
 
+    def validate(self, attrs):
+        status = attrs.get("status", getattr(self.instance, "status", None))
+        published_at = attrs.get(
+            "published_at", getattr(self.instance, "published_at", None)
+        )
+        if status == Post.Status.SCHEDULED and published_at is None:
+            raise serializers.ValidationError(
+                {"published_at": ERROR_SCHEDULED_POST_NEEDS_DATE}
+            )
+        return attrs
 
-class BlogSerializer(serializers.ModelSerializer):
+
+class BlogSerializer(
+    TimedSerializerMixin, SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     posts = PostSerializer(many=True, read_only=True)
     description = serializers.CharField(required=False, allow_blank=True)
 
     class Meta:
         model = Blog
-        fields = ["id", "title", "description", "user", "posts"]
-        read_only_fields = ["user"]
+        fields = ["id", "title", "slug", "description", "user", "posts"]
+        read_only_fields = ["user", "slug"]
+
+
+# --- Public (anonymous) read serializers ---
+class PublicBlogSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    class Meta:
+        model = Blog
+        fields = ["id", "title", "slug", "description", "created_at", "updated_at"]
+
+
+class PublicPostSummarySerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    tags = serializers.SlugRelatedField(many=True, read_only=True, slug_field="name")
+
+    class Meta:
+        model = Post
+        fields = [
+            "id",
+            "title",
+            "excerpt",
+            "reading_time",
+            "image",
+            "published_at",
+            "updated_at",
+            "tags",
+        ]
+
+
+class PublicPostSerializer(PublicPostSummarySerializer):
+    content = serializers.CharField(source="content_html")  # Sanitized HTML
+
+    class Meta(PublicPostSummarySerializer.Meta):
+        fields = [*PublicPostSummarySerializer.Meta.fields, "content"]
 
 
 class RegisterSerializer(serializers.ModelSerializer):
@@ -0,0 +1,163 @@
+from blog_app.cdn import blog_key, blog_posts_key, post_key, purge_surrogate_keys
+from blog_app.changes import record_change, record_post_changes
+from blog_app.feeds import invalidate_feeds
+from blog_app.related import refresh_related_posts
+from blog_app.tag_index import invalidate_tag_index
+
+from .models import Blog, Change, Post, Tag
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+
+def is_purge(signal, instance):
+    # Hard delete of a soft-deleted row (purge_deleted): its CDN purge and
+    # tombstone already happened when it was flagged
+    return signal is post_delete and instance.deleted_at is not None
+
+
+# --- Public cache invalidation ---
+@receiver([post_save, post_delete], sender=Blog)
+def purge_blog(sender, instance, signal, **kwargs):
+    if not is_purge(signal, instance):
+        purge_surrogate_keys(blog_key(instance.pk))
+
+
+@receiver([post_save, post_delete], sender=Post)
+def purge_post(sender, instance, signal, **kwargs):
+    if not is_purge(signal, instance):
+        purge_surrogate_keys(blog_posts_key(instance.blog_id), post_key(instance.pk))
+
+
+@receiver([post_save, post_delete], sender=Tag)
+def purge_tag(sender, instance, signal, **kwargs):
+    # Tag names are rendered inside the posts: renames are rare, purge the blog
+    if not is_purge(signal, instance):
+        purge_surrogate_keys(blog_key(instance.blog_id))
+
+
+@receiver(m2m_changed, sender=Tag.posts.through)
+def purge_tag_posts(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear" and not reverse:
+        # clear() doesn't send the pks: remember them before the rows are gone
+        instance._cleared_post_ids = list(instance.posts.values_list("id", flat=True))
+        return
+    if not action.startswith("post_"):
+        return
+
+    if reverse:  # post.tags.add(...)
+        post_ids = [instance.pk]
+    elif action == "post_clear":  # tag.posts.clear()
+        post_ids = getattr(instance, "_cleared_post_ids", [])
+    else:  # tag.posts.add(...)
+        post_ids = pk_set or []
+    purge_surrogate_keys(
+        blog_posts_key(instance.blog_id), *(post_key(pk) for pk in post_ids)
+    )
+
+
+# --- Change log (sync feed) ---
+def change_action(signal, instance):
+    if signal is post_delete or instance.deleted_at is not None:  # soft delete
+        return Change.Action.DELETE
+    return Change.Action.UPSERT
+
+
+@receiver([post_save, post_delete], sender=Blog)
+def log_blog_change(sender, instance, signal, **kwargs):
+    if not is_purge(signal, instance):
+        action = change_action(signal, instance)
+        record_change(Change.Model.BLOG, instance.pk, instance.pk, action)
+
+
+@receiver([post_save, post_delete], sender=Post)
+def log_post_change(sender, instance, signal, **kwargs):
+    if not is_purge(signal, instance):
+        action = change_action(signal, instance)
+        record_change(Change.Model.POST, instance.pk, instance.blog_id, action)
+
+
+@receiver([post_save, post_delete], sender=Tag)
+def log_tag_change(sender, instance, signal, **kwargs):
+    if not is_purge(signal, instance):
+        action = change_action(signal, instance)
+        record_change(Change.Model.TAG, instance.pk, instance.blog_id, action)
+
+
+@receiver(m2m_changed, sender=Tag.posts.through)
+def log_tag_posts_change(sender, instance, action, reverse, pk_set, **kwargs):
+    # Both sides render the relation (tag.posts and post.tags): log both
+    if action == "pre_clear":
+        related = instance.tags if reverse else instance.posts
+        instance._cleared_change_ids = list(related.values_list("id", flat=True))
+        return
+    if not action.startswith("post_"):
+        return
+
+    related_ids = (
+        getattr(instance, "_cleared_change_ids", [])
+        if action == "post_clear"
+        else list(pk_set or [])
+    )
+    if reverse:  # post.tags.add(...)
+        post_ids = [instance.pk]
+        tags = Tag.objects.filter(id__in=related_ids).values_list("id", "blog_id")
+    else:  # tag.posts.add(...)
+        post_ids = related_ids
+        tags = [(instance.pk, instance.blog_id)]
+    for tag_id, blog_id in tags:
+        record_change(Change.Model.TAG, tag_id, blog_id)
+    record_post_changes(post_ids)
+
+
+# --- Related posts ---
+@receiver(m2m_changed, sender=Tag.posts.through)
+def refresh_related_on_tag_posts(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in {"post_add", "post_remove", "post_clear"}:
+        return
+    if reverse:  # post.tags.add(...)
+        post_ids = [instance.pk]
+    elif action == "post_clear":  # tag.posts.clear(): pks kept by purge_tag_posts
+        post_ids = getattr(instance, "_cleared_post_ids", [])
+    else:  # tag.posts.add(...)
+        post_ids = list(pk_set or [])
+    if post_ids:
+        refresh_related_posts(
+            instance.blog_id, post_ids, tags_removed=action != "post_add"
+        )
+
+
+@receiver(post_save, sender=Tag)
+def refresh_related_on_tag_delete(sender, instance, **kwargs):
+    # A soft-deleted tag keeps its links but no longer counts
+    if instance.deleted_at is not None:
+        post_ids = list(instance.posts.values_list("id", flat=True))
+        if post_ids:
+            refresh_related_posts(instance.blog_id, post_ids)
+
+
+@receiver(post_save, sender=Post)
+def refresh_related_on_post_delete(sender, instance, **kwargs):
+    # Drop the soft-deleted post from the lists that included it
+    if instance.deleted_at is not None:
+        refresh_related_posts(instance.blog_id, [instance.pk])
+
+
+# --- Tag suggestions index ---
+@receiver([post_save, post_delete], sender=Tag)
+def invalidate_tag_suggestions(sender, instance, signal, **kwargs):
+    if not is_purge(signal, instance):
+        invalidate_tag_index(instance.blog.user_id)
+
+
+# --- Feeds and sitemaps ---
+@receiver([post_save, post_delete], sender=Blog)
+def invalidate_blog_feeds(sender, instance, signal, **kwargs):
+    if not is_purge(signal, instance):
+        invalidate_feeds([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=Post)
+def invalidate_post_feeds(sender, instance, signal, **kwargs):
+    if not is_purge(signal, instance):
+        invalidate_feeds([instance.blog_id])
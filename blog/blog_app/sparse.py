@@ -0,0 +1,98 @@
+from rest_framework.exceptions import ValidationError
+
+from blog_app.utils.constants import ERROR_UNKNOWN_FIELDS
+
+
+TRUE_VALUES = {"1", "true"}
+
+
+def parse_field_list(value):
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+class SparseFieldsSerializerMixin:
+    """Serializer that renders only a subset of its fields.
+
+    ``fields`` keeps the listed fields, ``expand`` adds relations on top of
+    them and ``omit`` drops fields (used by the excerpt mode).
+    """
+
+    def __init__(self, *args, fields=None, expand=(), omit=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            keep = {*fields, *expand}
+            for name in list(self.fields):
+                if name not in keep:
+                    self.fields.pop(name)
+        for name in omit:
+            self.fields.pop(name, None)
+
+
+class SparseFieldsetMixin:
+    """``?fields=``, ``?expand=`` and ``?excerpt=true`` for read requests.
+
+    Only the columns behind the rendered fields are selected (the rest are
+    deferred) and relations are joined/prefetched only when rendered.
+    """
+
+    sparse_select_related = {}  # rendered field -> select_related lookups
+    sparse_prefetch_related = {}  # rendered field -> prefetch_related lookups
+    excerpt_omit = ()  # fields dropped by ?excerpt=true
+
+    def get_sparse_options(self):
+        if hasattr(self, "_sparse_options"):
+            return self._sparse_options
+
+        options = {}
+        params = self.request.query_params if self.request.method == "GET" else {}
+        if "fields" in params:
+            options["fields"] = parse_field_list(params["fields"])
+        if "expand" in params:
+            options["expand"] = parse_field_list(params["expand"])
+        if params.get("excerpt", "").lower() in TRUE_VALUES:
+            options["omit"] = self.excerpt_omit
+
+        available = set(self.get_serializer_class()().fields)
+        unknown = {
+            *options.get("fields", ()),
+            *options.get("expand", ()),
+        } - available
+        if unknown:
+            raise ValidationError(
+                {
+                    "fields": ERROR_UNKNOWN_FIELDS.format(
+                        fields=", ".join(sorted(unknown))
+                    )
+                }
+            )
+
+        self._sparse_options = options
+        return options
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.update(self.get_sparse_options())
+        return super().get_serializer(*args, **kwargs)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        rendered = self.get_serializer().fields
+
+        for name in rendered:
+            if name in self.sparse_select_related:
+                queryset = queryset.select_related(*self.sparse_select_related[name])
+            if name in self.sparse_prefetch_related:
+                queryset = queryset.prefetch_related(
+                    *self.sparse_prefetch_related[name]
+                )
+
+        if self.get_sparse_options():
+            sources = {field.source for field in rendered.values()}
+            unused = [
+                field.name
+                for field in queryset.model._meta.concrete_fields
+                if not field.primary_key
+                and not field.is_relation
+                and field.name not in sources
+            ]
+            queryset = queryset.defer(*unused)
+        return queryset
@@ -0,0 +1,71 @@
+"""
+Tag name suggestions from an in-memory prefix index.
+
+Each process keeps the sorted tag names of the blogs it served, so a prefix
+is answered with a binary search, without touching the database. The index
+of a blog is keyed on its owner (a request finds it without loading the
+blog) and checked against a version token in the default cache, which the
+tag signals drop when the tags of the blog change: every worker rebuilds it
+(one query) on its next suggestion. That needs the shared cache (CACHE_URL);
+as a backstop, an index is also rebuilt once it is TAG_INDEX_TTL seconds old.
+"""
+
+from bisect import bisect_left
+from collections import OrderedDict
+import threading
+import time
+
+from blog_app.models import Tag
+from blog_app.utils.constants import (
+    TAG_INDEX_MAX_BLOGS,
+    TAG_INDEX_TTL,
+    TAG_SUGGESTIONS_LIMIT,
+)
+from blog_app.utils.helpers import drop_cache_versions, get_cache_version
+
+
+LAST_CHARACTER = chr(0x10FFFF)  # prefix + this sorts after every name with prefix
+
+indexes = OrderedDict()  # owner id -> (version, built at, sorted names), LRU order
+indexes_lock = threading.Lock()
+
+
+def version_key(owner_id):
+    return f"tag-index:{owner_id}"
+
+
+def invalidate_tag_index(owner_id):
+    drop_cache_versions(version_key(owner_id))
+
+
+def get_tag_index(owner_id):
+    version = get_cache_version(version_key(owner_id))
+    now = time.monotonic()
+    with indexes_lock:
+        entry = indexes.get(owner_id)
+        if entry is not None and entry[0] == version and now - entry[1] < TAG_INDEX_TTL:
+            indexes.move_to_end(owner_id)
+            return entry[2]
+
+    names = sorted(
+        Tag.objects.filter(
+            blog__user_id=owner_id, blog__deleted_at__isnull=True
+        ).values_list("name", flat=True)
+    )
+    with indexes_lock:
+        indexes[owner_id] = (version, now, names)
+        indexes.move_to_end(owner_id)
+        while len(indexes) > TAG_INDEX_MAX_BLOGS:
+            indexes.popitem(last=False)
+    return names
+
+
+def suggest_tags(user, prefix, limit=TAG_SUGGESTIONS_LIMIT):
+    """Names of the tags of the user's blog that start with ``prefix``."""
+    prefix = prefix.strip().lower()  # Names are stored normalized (get_or_create_tag)
+    if not prefix:
+        return []
+    names = get_tag_index(user.pk)
+    start = bisect_left(names, prefix)
+    end = bisect_left(names, prefix + LAST_CHARACTER, lo=start)
+    return names[start : min(end, start + limit)]
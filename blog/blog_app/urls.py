@@ -1,8 +1,72 @@
-from . import views
+from . import feeds, views
+from .async_api import AsyncBlogView, AsyncPostView, AsyncTagView
+from .public_api import (
+    PublicBlogView,
+    PublicPostDetailView,
+    PublicPostListView,
+    PublicPostViewCountView,
+)
 
 from django.urls import path
 
 
 urlpatterns = [
     path("", views.home, name="home"),
+    # Async read-only endpoints (list/retrieve) for ASGI deployments
+    path("api/async/blogs/", AsyncBlogView.as_view(), name="async-blog-list"),
+    path(
+        "api/async/blogs/<int:pk>/",
+        AsyncBlogView.as_view(),
+        name="async-blog-detail",
+    ),
+    path("api/async/posts/", AsyncPostView.as_view(), name="async-post-list"),
+    path(
+        "api/async/posts/<int:pk>/",
+        AsyncPostView.as_view(),
+        name="async-post-detail",
+    ),
+    path("api/async/tags/", AsyncTagView.as_view(), name="async-tag-list"),
+    path(
+        "api/async/tags/<int:pk>/",
+        AsyncTagView.as_view(),
+        name="async-tag-detail",
+    ),
+    # Public read API (anonymous, cacheable by the CDN)
+    path(
+        "api/public/blogs/<slug:slug>/",
+        PublicBlogView.as_view(),
+        name="public-blog-detail",
+    ),
+    path(
+        "api/public/blogs/<slug:slug>/posts/",
+        PublicPostListView.as_view(),
+        name="public-post-list",
+    ),
+    path(
+        "api/public/blogs/<slug:slug>/posts/<int:pk>/",
+        PublicPostDetailView.as_view(),
+        name="public-post-detail",
+    ),
+    path(
+        "api/public/blogs/<slug:slug>/posts/<int:pk>/views/",
+        PublicPostViewCountView.as_view(),
+        name="public-post-views",
+    ),
+    # Feeds and sitemaps for crawlers and aggregators (blog_app.feeds)
+    path("sitemap.xml", feeds.sitemap_index_view, name="sitemap-index"),
+    path(
+        "api/public/blogs/<slug:slug>/sitemap.xml",
+        feeds.sitemap_view,
+        name="blog-sitemap",
+    ),
+    path(
+        "api/public/blogs/<slug:slug>/rss.xml",
+        feeds.rss_feed_view,
+        name="blog-feed-rss",
+    ),
+    path(
+        "api/public/blogs/<slug:slug>/atom.xml",
+        feeds.atom_feed_view,
+        name="blog-feed-atom",
+    ),
 ]
@@ -7,6 +7,15 @@ ERROR_POST_IS_REQUERIED = "Debes indicar al menos un post válido para asociar e
 ERROR_DONT_HAVE_PERMISSION_TO_EDIT_BLOG = "No tienes permiso para editar este blog."
 ERROR_BLOG_NOT_FOUND = "Blog no encontrado."
 ERROR_POST_NOT_FOUND = "Post no encontrado."
+ERROR_IDEMPOTENCY_KEY_REUSED = "Esta clave de idempotencia ya se usó con otros datos."
+ERROR_IDEMPOTENCY_KEY_TOO_LONG = (
+    "La clave de idempotencia no puede superar los 255 caracteres."
+)
+ERROR_UNKNOWN_FIELDS = "Campos no válidos: {fields}."
+ERROR_INVALID_CHANGE_TOKEN = "Token de sincronización no válido."
+ERROR_SCHEDULED_POST_NEEDS_DATE = (
+    "Un post programado necesita una fecha de publicación (published_at)."
+)
 
 # --- Success messages ---
 SUCCESS_BLOG_CREATED = "Blog creado correctamente."
@@ -22,3 +31,22 @@ SUCCESS_TAG_DELETED = "Tag eliminado correctamente."
 
 # --- Default values ---
 DEFAULT_BLOG_DESCRIPTION = "Blog"
+
+# --- Post content processing ---
+EXCERPT_LENGTH = 280  # characters
+WORDS_PER_MINUTE = 200  # reading speed used for reading_time
+
+# --- Change feed ---
+CHANGE_FEED_PAGE_SIZE = 100
+CHANGE_FEED_MAX_PAGE_SIZE = 1000
+
+# --- Tag suggestions (/api/tags/suggest/) ---
+TAG_SUGGESTIONS_LIMIT = 10
+TAG_INDEX_MAX_BLOGS = 1000  # per-process indexes kept (least recently used out)
+TAG_INDEX_TTL = 300  # seconds before an index is rebuilt even if unchanged
+
+# --- Feeds and sitemaps ---
+FEED_ITEMS = 50  # latest live posts per feed
+FEED_CACHE_TIMEOUT = 3600  # seconds (posts made live by date alone show up after it)
+SITEMAP_MAX_URLS = 50000  # per sitemap file (protocol limit)
+SITEMAP_CHUNK_SIZE = 2000  # posts read and sent per chunk
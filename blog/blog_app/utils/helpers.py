@@ -1,8 +1,15 @@
+import uuid
+
 from rest_framework.exceptions import PermissionDenied
 
-from blog_app.models import Blog, Tag
+from blog_app.models import Blog, Post, RelatedPost, Tag
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
 
 from .constants import (
+    ERROR_BLOG_USER_HAS_BLOG,
     ERROR_NEED_CREATE_BLOG,
     ERROR_POST_IS_REQUERIED,
     ERROR_TAG_NOT_FOUND_POSTS_IDS,
@@ -10,10 +17,17 @@ from .constants import (
 
 
 def get_user_blog(user):
-    try:
-        return user.blog
-    except Blog.DoesNotExist:
-        raise PermissionDenied(ERROR_NEED_CREATE_BLOG)  # noqa: B904
+    blog = Blog.objects.filter(user=user).first()
+    if blog is None:
+        raise PermissionDenied(ERROR_NEED_CREATE_BLOG)
+    blog.user = user  # Already loaded: str(blog) needs no query
+    return blog
+
+
+def get_blog_creation_error(user):
+    if Blog.objects.filter(user=user).exists():
+        return ERROR_BLOG_USER_HAS_BLOG
+    return None
 
 
 def validate_posts_for_user(user, post_ids, posts_qs):
@@ -33,3 +47,71 @@ def get_or_create_tag(blog, name):
     name = name.strip().lower()
     tag, _ = Tag.objects.get_or_create(blog=blog, name=name)
     return tag
+
+
+# --- Prefetches for the read serializers (avoid per-row queries) ---
+# Nested lists use explicit orderings (with pk tie-breakers) so that the values()
+# read serializers (blog_app.read_serializers) render them in the same order.
+
+# Only the pk of the posts is rendered inside a tag (PrimaryKeyRelatedField)
+POST_PKS = Post.objects.only("id").order_by("-created_at", "-id")
+
+# Nested tags of PostSerializer (TagSerializer renders str(blog) and post pks)
+POST_TAGS_PREFETCH = (
+    Prefetch("tags", queryset=Tag.objects.select_related("blog__user").order_by("id")),
+    Prefetch("tags__posts", queryset=POST_PKS),
+)
+
+# Nested posts of BlogSerializer (each one rendered with PostSerializer)
+BLOG_POSTS_PREFETCH = Prefetch(
+    "posts",
+    queryset=Post.objects.select_related("blog__user", "view_count")
+    .prefetch_related(*POST_TAGS_PREFETCH)
+    .order_by("-created_at", "-id"),
+)
+
+# Related posts of each post, best first (PostType.related_posts)
+RELATED_POSTS_PREFETCH = Prefetch(
+    "related_links",
+    queryset=RelatedPost.objects.filter(
+        related__deleted_at__isnull=True
+    ).select_related("related__view_count"),
+    to_attr="prefetched_related_links",
+)
+
+
+# --- Visibility helpers (superusers see everything, the rest only their own) ---
+def get_visible_blogs(user):
+    if user.is_superuser:
+        return Blog.objects.all()
+    return Blog.objects.filter(user=user)
+
+
+def get_visible_posts(user):
+    if user.is_superuser:
+        return Post.objects.all()
+    return Post.objects.filter(blog__user=user)
+
+
+def get_visible_tags(user):
+    if user.is_superuser:
+        return Tag.objects.all()
+    return Tag.objects.filter(
+        posts__blog__user=user, posts__deleted_at__isnull=True
+    ).distinct()
+
+
+# --- Cache versions (per-process indexes and cached documents) ---
+# A random token in the default cache: dropping it makes every worker rebuild
+# what it derived from the old one, and a lost key is just a new version.
+def get_cache_version(key, timeout=None):
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=timeout)
+        version = cache.get(key)
+    return version
+
+
+def drop_cache_versions(*keys):
+    # After the commit: a rebuild before it would read the old rows
+    transaction.on_commit(lambda: cache.delete_many(keys))
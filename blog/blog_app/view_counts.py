@@ -0,0 +1,120 @@
+"""
+Write-behind post view counters.
+
+``record_view`` only increments a Counter of the process. A daemon thread of
+each worker writes the pending increments every VIEW_COUNT_FLUSH_INTERVAL
+seconds, as batched upserts on PostViewCount, so a popular post costs one
+write per worker and interval instead of an UPDATE (and a row lock) per view.
+The counts the API renders lag the real ones by at most that interval. What
+is pending when a worker exits is written by an atexit handler; a worker that
+is killed loses it.
+"""
+
+import atexit
+from collections import Counter
+import logging
+import os
+import threading
+import time
+
+from blog_app.models import Post, PostViewCount
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Case, F, PositiveBigIntegerField, Value, When
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500  # posts per upsert
+
+
+def save_view_counts(views):
+    """Add ``{post_id: views}`` to the counters (posts purged since are skipped)."""
+    # Sorted: concurrent flushes of several workers lock the rows in one order
+    post_ids = sorted(
+        Post.all_objects.filter(id__in=views).values_list("id", flat=True)
+    )
+    now = timezone.now()
+    for start in range(0, len(post_ids), BATCH_SIZE):
+        batch = post_ids[start : start + BATCH_SIZE]
+        with transaction.atomic():
+            PostViewCount.objects.bulk_create(
+                [PostViewCount(post_id=post_id) for post_id in batch],
+                ignore_conflicts=True,
+            )
+            PostViewCount.objects.filter(post_id__in=batch).update(
+                count=F("count")
+                + Case(
+                    *(
+                        When(post_id=post_id, then=Value(views[post_id]))
+                        for post_id in batch
+                    ),
+                    output_field=PositiveBigIntegerField(),
+                ),
+                updated_at=now,
+            )
+
+
+class ViewCounter:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending = Counter()
+        self.pid = None
+
+    def add(self, post_id):
+        with self.lock:
+            if self.pid != os.getpid():  # First view in this (maybe forked) process
+                self.start()
+            self.pending[post_id] += 1
+
+    def start(self):
+        # Views inherited through fork() are the parent's to write
+        self.pending.clear()
+        self.pid = os.getpid()
+        atexit.register(self.flush)
+        if settings.VIEW_COUNT_FLUSH_INTERVAL > 0:
+            threading.Thread(target=self.run, name="view-counts", daemon=True).start()
+
+    def drain(self):
+        with self.lock:
+            pending, self.pending = self.pending, Counter()
+        return pending
+
+    def flush(self):
+        """Write the pending views; returns how many were written."""
+        pending = self.drain()
+        if not pending:
+            return 0
+        try:
+            save_view_counts(pending)
+        except Exception:
+            logger.exception("Could not save the views of %s posts", len(pending))
+            with self.lock:
+                self.pending.update(pending)  # Retried on the next flush
+            return 0
+        return pending.total()
+
+    def run(self):
+        while True:
+            time.sleep(settings.VIEW_COUNT_FLUSH_INTERVAL)
+            try:
+                self.flush()
+            except Exception:  # The thread must outlive any one failed flush
+                logger.exception("View count flush failed")
+            finally:
+                connections.close_all()  # Only the connections of this thread
+
+
+view_counter = ViewCounter()
+
+
+def record_view(post_id):
+    view_counter.add(post_id)
+    if settings.VIEW_COUNT_FLUSH_INTERVAL <= 0:
+        view_counter.flush()
+
+
+def flush_view_counts():
+    return view_counter.flush()
@@ -0,0 +1,72 @@
+"""
+Gunicorn configuration (``gunicorn -c gunicorn.conf.py``), tuned by workload.
+
+SERVER_WORKER_CLASS picks the worker and the application:
+
+- ``gthread`` (default): WSGI, several threads per worker. Requests spend
+  most of their time waiting on the database, so threads are cheaper than
+  more processes.
+- ``uvicorn``: ASGI (blog.asgi), for the async endpoints (``/api/async/...``,
+  ``/graphql/async/``).
+- ``sync``: WSGI, one request at a time per worker.
+
+The app is preloaded in the master (``preload_app``): workers are forked with
+Django already imported and set up, which makes them boot and recycle faster
+and share memory pages. The database connections the master opened while
+loading (BlogAppConfig.ready checks the default superuser) are closed before
+forking, so no worker inherits its sockets. Workers restart after
+``max_requests``, with jitter so they don't all recycle at once.
+
+WEB_CONCURRENCY, GUNICORN_THREADS, GUNICORN_PRELOAD, GUNICORN_MAX_REQUESTS and
+GUNICORN_MAX_REQUESTS_JITTER override the defaults.
+"""
+
+import os
+
+
+WORKER_CLASSES = {  # SERVER_WORKER_CLASS -> (gunicorn worker_class, application)
+    "gthread": ("gthread", "blog.wsgi:application"),
+    "uvicorn": ("uvicorn.workers.UvicornWorker", "blog.asgi:application"),
+    "sync": ("sync", "blog.wsgi:application"),
+}
+
+
+def cpu_count():
+    # CPUs this container may run on, not those of the host
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def default_workers(server_worker_class, cpus):
+    if server_worker_class == "sync":
+        return 2 * cpus + 1  # Every request blocks a whole process
+    return cpus + 1  # Threads (or the event loop) overlap the I/O waits
+
+
+server_worker_class = os.getenv("SERVER_WORKER_CLASS", "gthread")
+worker_class, wsgi_app = WORKER_CLASSES[server_worker_class]
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(
+    os.getenv("WEB_CONCURRENCY", default_workers(server_worker_class, cpu_count()))
+)
+threads = int(os.getenv("GUNICORN_THREADS", "4"))  # gthread only
+preload_app = os.getenv("GUNICORN_PRELOAD", "True").lower() == "true"
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+timeout = 30
+graceful_timeout = 30
+keepalive = 5  # Behind the platform's proxy, which reuses connections
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"  # Heartbeat file off the (maybe slow) disk
+
+
+def pre_fork(server, worker):
+    if not preload_app:
+        return
+    # The preloaded app may hold DB connections: a forked worker sharing the
+    # master's socket would interleave its queries with the other workers'
+    from django.db import connections  # noqa: PLC0415
+
+    connections.close_all()
@@ -0,0 +1,7 @@
+#!/bin/bash
+
+set -e  # detiene el script si algún comando falla
+
+# Fase de release: se ejecuta una vez por despliegue, antes de arrancar los workers
+# (pre-deploy command de Railway, ver railway.json)
+python manage.py migrate --noinput
@@ -5,13 +5,13 @@ set -e  # detiene el script si algún comando falla
 # Opcional: mostrar en logs el PORT que Railway asignó
 echo "Railway PORT: $PORT"
 
-# Aplicar migraciones automáticamente
-python manage.py migrate --noinput
+# Las migraciones se aplican una vez por despliegue (release.sh, pre-deploy de
+# Railway), no en cada arranque. MIGRATE_ON_START=true recupera el comportamiento anterior
+if [ "${MIGRATE_ON_START:-false}" = "true" ]; then
+    bash release.sh
+fi
 
-# 🔧 NUEVO: recopilar archivos estáticos antes de arrancar
-echo "Ejecutando collectstatic..."
-python manage.py collectstatic --noinput
-
-# Arrancar Gunicorn usando el puerto asignado por Railway
+# Los estáticos y el esquema OpenAPI ya vienen en la imagen (Dockerfile).
+# Workers, hilos, preload y reciclado: gunicorn.conf.py (SERVER_WORKER_CLASS, WEB_CONCURRENCY...)
 echo "Iniciando Gunicorn..."
-gunicorn blog.wsgi:application --bind 0.0.0.0:${PORT:-8000} --workers 3 --worker-tmp-dir /dev/shm
+exec gunicorn -c gunicorn.conf.py
@@ -0,0 +1,33 @@
+import pytest
+from rest_framework.test import APIClient
+
+from tests.factories import BlogFactory
+
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Cada test empieza con la caché vacía (buckets de throttling incluidos)
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def raise_on_repeated_queries(settings):
+    # Una petición que repite la misma consulta (N+1) hace fallar el test
+    settings.QUERY_REPEAT_DETECTION = "raise"
+
+
+@pytest.fixture
+def blog(db):
+    return BlogFactory()
+
+
+@pytest.fixture
+def owner_client(blog):
+    # Cliente de la API autenticado como el dueño de `blog`
+    client = APIClient()
+    client.force_authenticate(user=blog.user)
+    return client
@@ -2,9 +2,13 @@ import factory
 
 from blog_app.models import Blog, Post, Tag
 
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 
 
+PASSWORD_HASH = make_password("testpass123")
+
+
 # Usuario de prueba
 class UserFactory(
     factory.django.DjangoModelFactory
@@ -14,8 +18,8 @@ class UserFactory(
 
     username = factory.Faker("user_name")  # Genera un nombre de usuario aleatorio
     email = factory.Faker("email")  # Genera un correo aleatorio
-    password = factory.PostGenerationMethodCall("set_password", "testpass123")
-    # Usa el método set_password para que la contraseña quede cifrada correctamente
+    # Hash calculado una sola vez: hashear por usuario es lo más lento de los tests
+    password = factory.LazyFunction(lambda: PASSWORD_HASH)
 
 
 # Blog de prueba
@@ -45,7 +49,8 @@ class TagFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Tag
 
-    name = factory.Faker("word")  # Nombre de la etiqueta
+    # Nombre de la etiqueta (único: dos palabras de Faker repetidas en un blog chocan)
+    name = factory.Sequence(lambda n: f"tag-{n}")
 
     @factory.post_generation  # Asocia posts después de crear el tag
     def posts(self, create, extracted, **kwargs):
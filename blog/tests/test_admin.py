@@ -0,0 +1,111 @@
+import pytest
+from auth_app.utils.helpers import admin_permissions
+
+from blog_app import admin as blog_admin
+from blog_app.models import Post
+from tests.factories import BlogFactory, PostFactory, TagFactory, UserFactory
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+
+OK_REQUEST_STATUS = 200
+ESTIMATE = 5_000_000
+AUTOCOMPLETE_PAGE = 20
+
+
+def seed_blogs(count):
+    for blog in BlogFactory.create_batch(count):
+        posts = PostFactory.create_batch(2, blog=blog)
+        TagFactory(blog=blog, posts=posts)
+
+
+def changelist_queries(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == OK_REQUEST_STATUS
+    return len(queries)
+
+
+@pytest.fixture
+def admin_client(db, settings):
+    settings.STORAGES = {  # Sin manifest de collectstatic en los tests
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    }
+    client = Client()
+    client.force_login(UserFactory(is_staff=True, is_superuser=True))
+    return client
+
+
+# Sesión, usuario, COUNT, filas y fecha (MIN/MAX + días); posts y tags: + blogs del filtro
+@pytest.mark.parametrize(
+    ("url", "num_queries"),
+    [
+        ("/admin/blog_app/blog/", 6),
+        ("/admin/blog_app/post/", 7),
+        ("/admin/blog_app/tag/", 7),
+    ],
+)
+def test_changelist_num_queries(admin_client, url, num_queries):  # Sin N+1
+    seed_blogs(2)
+    assert changelist_queries(admin_client, url) == num_queries
+    seed_blogs(5)
+    assert changelist_queries(admin_client, url) == num_queries
+
+
+@pytest.mark.django_db
+def test_big_changelists_use_the_estimated_count(monkeypatch):  # Sin COUNT(*) exacto
+    PostFactory()
+    assert blog_admin.estimated_count(Post.objects.all()) is None  # Solo PostgreSQL
+    assert blog_admin.EstimatedCountPaginator(Post.objects.all(), 100).count == 1
+
+    monkeypatch.setattr(blog_admin, "estimated_count", lambda queryset: ESTIMATE)
+
+    assert blog_admin.EstimatedCountPaginator(Post.objects.all(), 100).count == ESTIMATE
+
+
+def autocomplete(client, model_name, field_name, term=""):
+    return client.get(
+        "/admin/autocomplete/",
+        {
+            "app_label": "blog_app",
+            "model_name": model_name,
+            "field_name": field_name,
+            "term": term,
+        },
+    ).json()
+
+
+@pytest.mark.django_db
+def test_posts_autocomplete_respects_ownership():  # Autocompletado solo con sus posts
+    staff = UserFactory(is_staff=True)
+    admin_permissions(staff)
+    own_posts = PostFactory.create_batch(
+        AUTOCOMPLETE_PAGE + 1, blog=BlogFactory(user=staff)
+    )
+    PostFactory(title="Ajeno")
+    client = Client()
+    client.force_login(staff)
+
+    page = autocomplete(client, "tag", "posts")
+
+    assert page["pagination"]["more"]  # Paginado: 20 resultados por página
+    ids = {int(result["id"]) for result in page["results"]}
+    assert ids <= {post.id for post in own_posts}
+    assert not autocomplete(client, "tag", "posts", term="Ajeno")["results"]
+
+
+def test_tag_form_renders_selected_posts_only(admin_client):  # Sin <option> por post
+    seed_blogs(3)
+    blog = BlogFactory()
+    tag = TagFactory(blog=blog, posts=PostFactory.create_batch(3, blog=blog))
+
+    response = admin_client.get(f"/admin/blog_app/tag/{tag.id}/change/")
+
+    options = response.content.decode().count("<option ")
+    assert options == tag.posts.count() + 1  # + el blog seleccionado
+    assert autocomplete(admin_client, "blog", "user")["results"]
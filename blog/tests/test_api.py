@@ -1,11 +1,12 @@
 import pytest
 from rest_framework.test import APIClient
 
-from tests.factories import BlogFactory, PostFactory, UserFactory
+from tests.factories import BlogFactory, PostFactory, TagFactory, UserFactory
 
 
 OK_REQUEST_STATUS = 200
-BAD_REQUEST = 403
+CREATED = 201
+BAD_REQUEST = 400
 
 
 # TESTS DE BLOGS
@@ -69,3 +70,54 @@ def test_create_tag_authenticated_user():  # Un usuario autenticado puede crear
 
     # Cambia de 403 a 400 porque el serializer valida los posts
     assert response.status_code == BAD_REQUEST
+    assert "posts" in response.data
+
+
+# CONSULTAS POR ENDPOINT: el número no crece con las filas (sin N+1)
+@pytest.fixture(params=[1, 5], ids=["1-fila", "5-filas"])
+def blog_with_content(request, blog):  # `blog` de conftest: `owner_client` es su dueño
+    posts = PostFactory.create_batch(request.param, blog=blog)
+    for number in range(request.param):
+        TagFactory(blog=blog, name=f"tag-{number}", posts=posts)
+    return blog
+
+
+@pytest.mark.parametrize(
+    ("url", "num_queries"),
+    [
+        ("/api/blogs/", 5),
+        ("/api/blogs/{blog}/", 4),
+        ("/api/posts/", 4),
+        ("/api/posts/{post}/", 3),
+        ("/api/tags/", 2),
+        ("/api/tags/{tag}/", 2),
+    ],
+)
+def test_read_endpoints_num_queries(
+    blog_with_content, owner_client, django_assert_num_queries, url, num_queries
+):
+    url = url.format(
+        blog=blog_with_content.id,
+        post=blog_with_content.posts.first().id,
+        tag=blog_with_content.tags.first().id,
+    )
+
+    with django_assert_num_queries(num_queries):
+        response = owner_client.get(url)
+
+    assert response.status_code == OK_REQUEST_STATUS
+
+
+def test_create_tag_num_queries(
+    blog_with_content, owner_client, django_assert_num_queries
+):  # Los posts del tag se validan en una sola consulta
+    post_ids = list(blog_with_content.posts.values_list("id", flat=True))
+    # Posts relacionados: enlaces del blog, borrado e inserción (con 2+ posts)
+    num_queries = 16 if len(post_ids) == 1 else 17
+
+    with django_assert_num_queries(num_queries):
+        response = owner_client.post(
+            "/api/tags/", {"name": "nuevo", "posts": post_ids}, format="json"
+        )
+
+    assert response.status_code == CREATED
@@ -0,0 +1,89 @@
+import pytest
+from rest_framework.test import APIClient
+
+from tests.factories import BlogFactory, PostFactory, TagFactory, UserFactory
+
+from django.test import Client
+
+
+OK_REQUEST_STATUS = 200
+UNAUTHORIZED = 401
+NOT_FOUND = 404
+TOO_MANY_REQUESTS = 429
+
+
+@pytest.mark.django_db
+def test_async_posts_match_sync_endpoint():  # La vista async devuelve lo mismo que /api/posts/
+    user = UserFactory()
+    post = PostFactory(blog__user=user)
+    TagFactory(blog=post.blog, posts=[post])
+    PostFactory()  # Post de otro usuario
+
+    sync_client = APIClient()
+    sync_client.force_authenticate(user=user)
+    async_client = Client()
+    async_client.force_login(user)
+
+    sync_response = sync_client.get("/api/posts/")
+    async_response = async_client.get("/api/async/posts/")
+
+    assert async_response.status_code == OK_REQUEST_STATUS
+    assert async_response.json() == sync_response.json()
+    assert [p["id"] for p in async_response.json()] == [post.id]
+
+
+@pytest.mark.django_db
+def test_async_blog_detail_is_scoped_to_owner():  # No se puede leer el blog de otro usuario
+    user = UserFactory()
+    own_blog = BlogFactory(user=user)
+    other_blog = BlogFactory()
+
+    client = Client()
+    client.force_login(user)
+
+    assert client.get(f"/api/async/blogs/{own_blog.id}/").json()["id"] == own_blog.id
+    assert client.get(f"/api/async/blogs/{other_blog.id}/").status_code == NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_async_endpoints_require_authentication():
+    assert Client().get("/api/async/tags/").status_code == UNAUTHORIZED
+
+
+@pytest.mark.django_db
+def test_async_endpoints_are_throttled(settings):  # Comparten el bucket por usuario
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": {
+            **settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"],
+            "user": "2/min",
+        },
+    }
+    client = Client()
+    client.force_login(UserFactory())
+
+    statuses = [client.get("/api/async/tags/").status_code for _ in range(2)]
+    response = client.get("/api/async/tags/")
+
+    assert statuses == [OK_REQUEST_STATUS, OK_REQUEST_STATUS]
+    assert response.status_code == TOO_MANY_REQUESTS
+    assert int(response["Retry-After"]) > 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_graphql_query():  # Las queries se ejecutan fuera del event loop
+    user = UserFactory()
+    post = PostFactory(blog__user=user)
+
+    client = Client()
+    client.force_login(user)
+    response = client.post(
+        "/graphql/async/",
+        {"query": "{ allPosts { id title } }"},
+        content_type="application/json",
+    )
+
+    assert response.status_code == OK_REQUEST_STATUS
+    assert response.json()["data"]["allPosts"] == [
+        {"id": str(post.id), "title": post.title}
+    ]
@@ -0,0 +1,121 @@
+import pytest
+from rest_framework.test import APIClient
+
+from tests.factories import PostFactory, TagFactory
+
+from django.test import Client
+
+
+OK_REQUEST_STATUS = 200
+BAD_REQUEST = 400
+NO_CONTENT = 204
+
+
+@pytest.fixture(autouse=True)
+def no_settle_window(settings):
+    settings.CHANGE_FEED_SETTLE_SECONDS = 0
+
+
+def get_feed(user, since=""):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client.get(f"/api/changes/?since={since}")
+
+
+def test_feed_returns_only_deltas(blog):  # Solo los cambios posteriores al token
+    post = PostFactory(blog=blog)
+    first = get_feed(blog.user).json()
+
+    assert first["has_more"] is False
+    assert [(c["model"], c["id"], c["action"]) for c in first["changes"]] == [
+        ("blog", blog.id, "upsert"),
+        ("post", post.id, "upsert"),
+    ]
+    assert first["changes"][1]["data"]["title"] == post.title
+
+    post.title = "Nuevo título"
+    post.save()
+    second = get_feed(blog.user, first["next"]).json()
+
+    assert [c["id"] for c in second["changes"]] == [post.id]
+    assert second["changes"][0]["data"]["title"] == "Nuevo título"
+    assert get_feed(blog.user, second["next"]).json()["changes"] == []
+
+
+def test_deletes_are_tombstones(blog):  # Post y tag borrados llegan como tombstones
+    post = PostFactory(blog=blog)
+    tag = TagFactory(blog=blog, posts=[post])
+    post_id, tag_id = post.id, tag.id
+    since = get_feed(blog.user).json()["next"]
+
+    post.delete()
+    tag.delete()
+    changes = get_feed(blog.user, since).json()["changes"]
+
+    assert [(c["model"], c["id"], c["action"], c["data"]) for c in changes] == [
+        ("post", post_id, "delete", None),
+        ("tag", tag_id, "delete", None),
+    ]
+
+
+def test_deleted_blog_sends_its_tombstones(blog):  # DELETE /api/blogs/{id}/
+    post = PostFactory(blog=blog)
+    tag = TagFactory(blog=blog, posts=[post])
+    since = get_feed(blog.user).json()["next"]
+    client = APIClient()
+    client.force_authenticate(user=blog.user)
+
+    assert client.delete(f"/api/blogs/{blog.id}/").status_code == NO_CONTENT
+    changes = get_feed(blog.user, since).json()["changes"]
+
+    assert {(c["model"], c["id"], c["action"]) for c in changes} == {
+        ("blog", blog.id, "delete"),
+        ("post", post.id, "delete"),
+        ("tag", tag.id, "delete"),
+    }
+
+
+def test_tag_posts_change_logs_both_sides(blog):  # tag.posts.add() cambia post y tag
+    post = PostFactory(blog=blog)
+    tag = TagFactory(blog=blog)
+    since = get_feed(blog.user).json()["next"]
+
+    tag.posts.add(post)
+    changes = get_feed(blog.user, since).json()["changes"]
+
+    assert {(c["model"], c["id"]) for c in changes} == {
+        ("tag", tag.id),
+        ("post", post.id),
+    }
+
+
+def test_feed_is_scoped_and_validates_token(blog):
+    PostFactory()  # Post de otro usuario
+
+    assert {c["model"] for c in get_feed(blog.user).json()["changes"]} == {"blog"}
+    assert get_feed(blog.user, "abc").status_code == BAD_REQUEST
+
+
+def test_graphql_changes(blog):
+    post = PostFactory(blog=blog)
+    client = Client()
+    client.force_login(blog.user)
+
+    response = client.post(
+        "/graphql/",
+        {
+            "query": '{ changes(since: "0") { next hasMore changes '
+            "{ model objectId action post { title } } } }"
+        },
+        content_type="application/json",
+    )
+
+    assert response.status_code == OK_REQUEST_STATUS
+    feed = response.json()["data"]["changes"]
+    assert feed["hasMore"] is False
+    assert feed["changes"][-1] == {
+        "model": "post",
+        "objectId": str(post.id),
+        "action": "upsert",
+        "post": {"title": post.title},
+    }
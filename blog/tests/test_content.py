@@ -0,0 +1,54 @@
+import pytest
+from rest_framework.test import APIClient
+
+from blog_app.content import build_excerpt, process_content
+from tests.factories import PostFactory
+
+
+OK_REQUEST_STATUS = 200
+EXCERPT_LENGTH = 30
+
+
+def test_process_content_sanitizes_and_extracts_text():  # El HTML de TinyMCE se sanea y se pasa a texto
+    derived = process_content(
+        '<h1>Título</h1><p onclick="x()">Hola&nbsp;<b>mundo</b></p>'
+        "<script>alert(1)</script><p>Adiós</p>"
+    )
+
+    assert "<script>" not in derived["content_html"]
+    assert "onclick" not in derived["content_html"]
+    assert derived["content_text"] == "Título Hola mundo Adiós"
+    assert derived["reading_time"] == 1
+
+
+def test_excerpt_is_cut_on_a_word_boundary():
+    excerpt = build_excerpt("palabra " * 100, length=EXCERPT_LENGTH)
+
+    assert len(excerpt) <= EXCERPT_LENGTH
+    assert excerpt.endswith("palabra…")
+
+
+@pytest.mark.django_db
+def test_post_save_stores_derived_columns():  # Al guardar se recalculan las columnas derivadas
+    post = PostFactory(content="<p>uno dos</p>")
+    assert post.excerpt == "uno dos"
+
+    post.content = "<p>tres</p>"
+    post.save(update_fields=["content"])
+    post.refresh_from_db()
+    assert post.content_text == "tres"
+
+
+@pytest.mark.django_db
+def test_public_list_ships_excerpts_and_detail_sanitized_html():
+    post = PostFactory(content="<p>Hola</p><script>x</script>")
+    base = f"/api/public/blogs/{post.blog.slug}/posts/"
+    client = APIClient()
+
+    listed = client.get(base).data["results"][0]
+    assert listed["excerpt"] == "Hola"
+    assert "content" not in listed
+
+    detail = client.get(f"{base}{post.id}/")
+    assert detail.status_code == OK_REQUEST_STATUS
+    assert detail.data["content"] == "<p>Hola</p>"
@@ -0,0 +1,124 @@
+import pytest
+from rest_framework.test import APIClient
+
+from blog_app.db_routing import (
+    ReplicaRouter,
+    check_shared_cache,
+    is_pinned,
+    read_from_replica,
+    replica_reads,
+)
+from blog_app.models import Post
+from tests.factories import BlogFactory
+
+from django.contrib.auth.models import AnonymousUser
+from django.core import checks
+from django.core.cache import cache
+from django.db import transaction
+from django.test import Client
+
+
+OK_REQUEST_STATUS = 200
+CREATED = 201
+
+
+@pytest.fixture
+def replica(settings):
+    # El alias de réplica apunta a la base por defecto: enruta sin otra base
+    settings.REPLICA_DATABASE = "default"
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def routed_reads(monkeypatch):
+    calls = []
+
+    def db_for_read(self, model, **hints):
+        calls.append(replica_reads.get())
+
+    monkeypatch.setattr(ReplicaRouter, "db_for_read", db_for_read)
+    return calls
+
+
+@pytest.mark.django_db(transaction=True)  # Sin el atomic que envuelve cada test
+def test_router_reads_from_replica_outside_transactions(replica):  # Router
+    router = ReplicaRouter()
+
+    assert router.db_for_read(Post) is None
+    with read_from_replica(AnonymousUser()):
+        assert router.db_for_read(Post) == "default"
+        with transaction.atomic():
+            assert router.db_for_read(Post) is None
+    assert router.db_for_read(Post) is None
+    assert router.db_for_write(Post) == "default"
+
+
+def test_replica_is_not_migrated():  # La réplica copia el esquema
+    assert not ReplicaRouter().allow_migrate("replica", "blog_app")
+    assert ReplicaRouter().allow_migrate("default", "blog_app")
+
+
+def test_replica_requires_a_shared_cache(replica, settings):  # Check de sistema
+    settings.DEBUG = False
+    assert [error.id for error in check_shared_cache()] == ["blog_app.E001"]
+    assert check_shared_cache()[0].level == checks.ERROR
+
+    settings.DEBUG = True  # runserver: un solo proceso
+    assert [warning.id for warning in check_shared_cache()] == ["blog_app.W001"]
+
+    settings.REPLICA_DATABASE = "sin-replica"
+    assert check_shared_cache() == []
+
+
+def test_without_replica_nothing_is_routed(settings):  # Sin réplica
+    with read_from_replica(AnonymousUser()):
+        assert not replica_reads.get()
+
+
+@pytest.mark.django_db
+def test_rest_write_pins_user_to_primary(replica, routed_reads):  # Lee tus escrituras
+    blog = BlogFactory()
+    client = APIClient()
+    client.force_authenticate(user=blog.user)
+
+    assert client.get("/api/posts/").status_code == OK_REQUEST_STATUS
+    assert True in routed_reads
+
+    response = client.post(
+        "/api/posts/",
+        {"title": "Hola", "content": "<p>Contenido</p>"},
+        format="json",
+    )
+    assert response.status_code == CREATED
+    assert is_pinned(blog.user)
+
+    routed_reads.clear()
+    assert client.get("/api/posts/").status_code == OK_REQUEST_STATUS
+    assert routed_reads
+    assert True not in routed_reads
+
+
+@pytest.mark.django_db
+def test_graphql_queries_read_from_replica(replica, routed_reads):  # GraphQL
+    blog = BlogFactory()
+    client = Client()
+    client.force_login(blog.user)
+
+    response = client.post(
+        "/graphql/",
+        {"query": "{ allBlogs { id } }"},
+        content_type="application/json",
+    )
+    assert response.status_code == OK_REQUEST_STATUS
+    assert True in routed_reads
+    assert not is_pinned(blog.user)
+
+    response = client.post(
+        "/graphql/",
+        {"query": 'mutation { createBlog(title: "Otro") { errors } }'},
+        content_type="application/json",
+    )
+    assert response.status_code == OK_REQUEST_STATUS
+    assert is_pinned(blog.user)
@@ -0,0 +1,154 @@
+import io
+from xml.etree import ElementTree
+
+import pytest
+
+from blog_app import feeds
+from blog_app.models import Post
+from tests.factories import BlogFactory, PostFactory
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import Client
+
+
+OK_REQUEST_STATUS = 200
+NOT_MODIFIED = 304
+NOT_FOUND = 404
+SITEMAP = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+
+@pytest.fixture
+def blog_with_posts(blog):  # Sobre el `blog` de conftest
+    PostFactory.create_batch(3, blog=blog)
+    PostFactory(blog=blog, title="Borrador", status=Post.Status.DRAFT)
+    PostFactory(title="De otro blog")
+    return blog
+
+
+def content(response):
+    if response.streaming:
+        return b"".join(response.streaming_content)
+    return response.content
+
+
+@pytest.mark.usefixtures("blog_with_posts")
+def test_rss_and_atom_feeds(blog):  # Solo los posts publicados del blog
+    client = Client()
+
+    rss = client.get(f"/api/public/blogs/{blog.slug}/rss.xml")
+    atom = client.get(f"/api/public/blogs/{blog.slug}/atom.xml")
+
+    assert rss.status_code == OK_REQUEST_STATUS
+    assert rss["Content-Type"].startswith("application/rss+xml")
+    items = ElementTree.fromstring(content(rss)).findall("channel/item")
+    assert len(items) == 3
+    assert "Borrador" not in {item.findtext("title") for item in items}
+    entries = ElementTree.fromstring(content(atom)).findall(
+        "{http://www.w3.org/2005/Atom}entry"
+    )
+    assert len(entries) == 3
+    assert rss["ETag"] != atom["ETag"]
+    assert client.get("/api/public/blogs/no-existe/rss.xml").status_code == NOT_FOUND
+
+
+@pytest.mark.usefixtures("blog_with_posts")
+def test_conditional_get_skips_the_database(
+    blog, django_assert_num_queries
+):  # 304 con If-None-Match, respondido desde la caché
+    client = Client()
+    url = f"/api/public/blogs/{blog.slug}/rss.xml"
+    first = client.get(url)
+    body = content(first)
+
+    with django_assert_num_queries(0):
+        not_modified = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        cached = client.get(url)
+
+    assert not_modified.status_code == NOT_MODIFIED
+    assert not cached.streaming
+    assert cached.content == body
+    assert "must-revalidate" in first["Cache-Control"]
+
+
+@pytest.mark.usefixtures("blog_with_posts")
+def test_post_saves_invalidate_the_feeds(
+    blog, django_capture_on_commit_callbacks
+):  # Nuevo ETag y nuevo contenido
+    client = Client()
+    url = f"/api/public/blogs/{blog.slug}/rss.xml"
+    first = client.get(url)
+    content(first)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        PostFactory(blog=blog, title="Nuevo post")
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert response.status_code == OK_REQUEST_STATUS
+    assert b"Nuevo post" in content(response)
+
+
+@pytest.mark.usefixtures("blog_with_posts")
+def test_etag_is_derived_from_the_posts(
+    blog, django_capture_on_commit_callbacks
+):  # Mismo ETag en cualquier worker o tras perder la caché
+    client = Client()
+    url = f"/api/public/blogs/{blog.slug}/atom.xml"
+    etag = client.get(url)["ETag"]
+
+    cache.clear()
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == NOT_MODIFIED
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Post.objects.live().filter(blog=blog).first().soft_delete()
+    assert client.get(url)["ETag"] != etag
+
+
+@pytest.mark.usefixtures("blog_with_posts")
+def test_rendering_post_content_changes_the_etag(
+    blog, django_capture_on_commit_callbacks
+):  # Tras render_post_content
+    client = Client()
+    url = f"/api/public/blogs/{blog.slug}/rss.xml"
+    etag = client.get(url)["ETag"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("render_post_content", stdout=io.StringIO())
+
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == OK_REQUEST_STATUS
+
+
+@pytest.mark.usefixtures("blog_with_posts")
+def test_blog_sitemap_is_streamed(blog, monkeypatch):  # Por trozos y por páginas
+    monkeypatch.setattr(feeds, "SITEMAP_CHUNK_SIZE", 2)
+    monkeypatch.setattr(feeds, "SITEMAP_MAX_URLS", 2)
+    client = Client()
+    url = f"/api/public/blogs/{blog.slug}/sitemap.xml"
+
+    response = client.get(url)
+    chunks = list(response.streaming_content)
+    second_page = client.get(url, {"p": 2})
+
+    assert len(chunks) > 1
+    first_urls = ElementTree.fromstring(b"".join(chunks)).findall(f"{SITEMAP}url")
+    assert len(first_urls) == 2
+    assert len(ElementTree.fromstring(content(second_page))) == 1
+    assert client.get(url, {"p": "x"}).status_code == NOT_FOUND
+
+
+@pytest.mark.usefixtures("blog_with_posts")
+def test_sitemap_index(blog, monkeypatch):  # Un sitemap por blog (y página)
+    monkeypatch.setattr(feeds, "SITEMAP_MAX_URLS", 2)
+    BlogFactory()  # Sin posts publicados: no aparece
+
+    response = Client().get("/sitemap.xml")
+
+    locations = [
+        element.findtext(f"{SITEMAP}loc")
+        for element in ElementTree.fromstring(content(response))
+    ]
+    assert len(locations) == 3  # `blog` (2 páginas) y el otro blog
+    assert f"http://testserver/api/public/blogs/{blog.slug}/sitemap.xml" in locations
+    assert (
+        f"http://testserver/api/public/blogs/{blog.slug}/sitemap.xml?p=2" in locations
+    )
@@ -0,0 +1,86 @@
+from datetime import timedelta
+
+import pytest
+
+from blog_app.models import Blog, IdempotencyKey, Post
+from tests.factories import UserFactory
+
+from django.core.management import call_command
+from django.test import Client
+from django.utils import timezone
+
+
+CREATED = 201
+BAD_REQUEST = 400
+UNPROCESSABLE_ENTITY = 422
+
+
+def create_post(client, key, title="Hola"):
+    return client.post(
+        "/api/posts/",
+        {"title": title, "content": "<p>Contenido</p>"},
+        format="json",
+        HTTP_IDEMPOTENCY_KEY=key,
+    )
+
+
+def test_retry_replays_stored_response(owner_client):  # El reintento no crea otro post
+    first = create_post(owner_client, "abc-1")
+    retry = create_post(owner_client, "abc-1")
+
+    assert first.status_code == retry.status_code == CREATED
+    assert retry.json() == first.json()
+    assert retry["Idempotent-Replayed"] == "true"
+    assert Post.objects.count() == 1
+
+    other = create_post(owner_client, "abc-2")  # Otra clave: otro post
+    assert other.json()["id"] != first.json()["id"]
+
+
+def test_key_reused_with_other_payload(owner_client):  # Misma clave, otros datos: 422
+    create_post(owner_client, "abc-1")
+
+    response = create_post(owner_client, "abc-1", title="Otro")
+
+    assert response.status_code == UNPROCESSABLE_ENTITY
+    assert Post.objects.count() == 1
+
+
+def test_failed_request_is_not_stored(owner_client):  # Un error no consume la clave
+    response = owner_client.post(
+        "/api/posts/", {"title": "Sin contenido"}, HTTP_IDEMPOTENCY_KEY="abc-1"
+    )
+
+    assert response.status_code == BAD_REQUEST
+    assert not IdempotencyKey.objects.exists()
+
+
+def test_expired_keys_are_pruned(owner_client):
+    create_post(owner_client, "abc-1")
+    IdempotencyKey.objects.update(created_at=timezone.now() - timedelta(days=2))
+
+    call_command("prune_idempotency_keys", stdout=None)
+
+    assert not IdempotencyKey.objects.exists()
+
+
+@pytest.mark.django_db
+def test_graphql_create_blog_with_idempotency_key():
+    user = UserFactory()
+    client = Client()
+    client.force_login(user)
+    mutation = (
+        'mutation { createBlog(title: "Mi blog", idempotencyKey: "k1") '
+        "{ blog { id } errors } }"
+    )
+
+    first = client.post(
+        "/graphql/", {"query": mutation}, content_type="application/json"
+    )
+    retry = client.post(
+        "/graphql/", {"query": mutation}, content_type="application/json"
+    )
+
+    assert first.json()["data"] == retry.json()["data"]
+    assert retry.json()["data"]["createBlog"]["errors"] == []
+    assert Blog.objects.count() == 1
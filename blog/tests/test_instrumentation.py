@@ -0,0 +1,133 @@
+from collections import Counter
+
+import pytest
+
+from blog_app.instrumentation import (
+    InstrumentedCache,
+    RepeatedQueriesError,
+    RequestMetrics,
+    check_repeated_queries,
+    current_metrics,
+    query_shape,
+)
+from tests.factories import PostFactory
+
+from django.test import Client, RequestFactory
+
+
+OK_REQUEST_STATUS = 200
+FORBIDDEN = 403
+NOT_FOUND = 404
+
+
+@pytest.fixture
+def blog_with_posts(blog):  # Sobre el `blog` de conftest
+    PostFactory.create_batch(2, blog=blog)
+    return blog
+
+
+def timings(response):
+    return {
+        entry.split(";")[0]: entry for entry in response["Server-Timing"].split(", ")
+    }
+
+
+@pytest.mark.usefixtures("blog_with_posts")
+def test_rest_server_timing(blog, settings):  # Cabecera Server-Timing en REST
+    settings.SERVER_TIMING_HEADER = True
+
+    client = Client()
+    client.force_login(blog.user)
+
+    response = client.get("/api/blogs/")
+
+    assert response.status_code == OK_REQUEST_STATUS
+    entries = timings(response)
+    assert {"total", "db", "cache", "serializer"} <= set(entries)
+    assert "queries" in entries["db"]
+
+
+@pytest.mark.usefixtures("blog_with_posts")
+def test_graphql_resolver_metrics(blog, settings):  # Tiempos de resolvers GraphQL
+    settings.SERVER_TIMING_HEADER = True
+    settings.DEBUG = True  # /metrics sin token
+
+    response = Client().post(
+        "/graphql/",
+        {"query": "{ allPosts { title } }"},
+        content_type="application/json",
+    )
+
+    assert "graphql" in timings(response)
+    metrics = Client().get("/metrics").content.decode()
+    assert 'graphql_resolver_calls_total{field="Query.allPosts"}' in metrics
+    assert 'http_request_duration_seconds_count{method="POST",route="graphql/"}' in (
+        metrics
+    )
+
+
+@pytest.mark.usefixtures("blog_with_posts")
+def test_cache_hits_and_misses(blog, settings):  # Aciertos y fallos de caché
+    settings.SERVER_TIMING_HEADER = True
+    client = Client()
+    client.force_login(blog.user)
+
+    first = client.get("/api/blogs/")  # Crea el bucket del throttle
+    second = client.get("/api/blogs/")  # Lo lee de la caché
+
+    assert timings(first)["cache"] == 'cache;desc="0 hits / 1 misses"'
+    assert timings(second)["cache"] == 'cache;desc="1 hits / 0 misses"'
+
+
+def test_any_cache_backend_is_instrumented():  # El wrapper envuelve cualquier backend
+    cache = InstrumentedCache(
+        "otra",
+        {"OPTIONS": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    )
+    cache.set("a", 1)
+    metrics = RequestMetrics()
+    token = current_metrics.set(metrics)
+    try:
+        assert cache.get("a") == 1
+        assert cache.get("b", "x") == "x"
+        assert cache.get_many(["a", "b", "c"]) == {"a": 1}
+    finally:
+        current_metrics.reset(token)
+
+    assert (metrics.cache_hits, metrics.cache_misses) == (2, 3)
+    assert cache.incr("a") == 2
+    assert cache.add("a", 5) is False
+
+
+def test_metrics_token(db, settings):  # /metrics protegido con token
+    settings.METRICS_TOKEN = "secreto"
+
+    assert Client().get("/metrics").status_code == FORBIDDEN
+    response = Client().get("/metrics", HTTP_AUTHORIZATION="Bearer secreto")
+    assert response.status_code == OK_REQUEST_STATUS
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+
+
+def test_metrics_without_token_only_in_debug(db, settings):  # Sin token: solo en dev
+    settings.METRICS_TOKEN = ""
+    settings.DEBUG = False
+    assert Client().get("/metrics").status_code == NOT_FOUND
+
+    settings.DEBUG = True
+    assert Client().get("/metrics").status_code == OK_REQUEST_STATUS
+
+
+def test_repeated_queries_are_detected(settings, caplog):  # Detector de N+1
+    metrics = RequestMetrics(query_shapes=Counter())
+    for post_id in range(3):
+        metrics.query_shapes[
+            query_shape(f'SELECT * FROM "blog_app_post" WHERE "id" = {post_id}')
+        ] += 1
+    request = RequestFactory().get("/api/posts/")
+
+    with pytest.raises(RepeatedQueriesError, match="3x SELECT"):
+        check_repeated_queries(request, metrics)
+
+    settings.QUERY_REPEAT_DETECTION = "log"
+    check_repeated_queries(request, metrics)
+    assert "Repeated queries (N+1?) in GET /api/posts/" in caplog.text
@@ -0,0 +1,89 @@
+import gzip
+import json
+
+import pytest
+
+from blog_app.openapi import VERSION_KEY, code_version, schema_document, write_schema
+
+from django.test import Client
+
+
+OK_REQUEST_STATUS = 200
+NOT_MODIFIED = 304
+
+
+@pytest.fixture
+def schema_file(settings, tmp_path):
+    settings.OPENAPI_SCHEMA_FILE = tmp_path / "openapi.json"
+    schema_document.cache_clear()
+    yield settings.OPENAPI_SCHEMA_FILE
+    schema_document.cache_clear()
+
+
+def test_openapi_is_served_compressed(db, schema_file):  # Esquema comprimido
+    response = Client().get("/openapi.json", HTTP_ACCEPT_ENCODING="gzip, br")
+
+    assert response.status_code == OK_REQUEST_STATUS
+    assert response["Content-Encoding"] == "gzip"
+    schema = json.loads(gzip.decompress(response.content))
+    assert "/blogs/" in schema["paths"]
+    assert "host" not in schema
+    assert schema[VERSION_KEY] == code_version()
+
+
+def test_openapi_etag(db, schema_file):  # Petición condicional con ETag
+    client = Client()
+    etag = client.get("/openapi.json")["ETag"]
+
+    response = client.get("/openapi.json", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == NOT_MODIFIED
+    assert response.content == b""
+
+
+def test_openapi_etag_per_encoding(db, schema_file):  # Un ETag por representación
+    client = Client()
+    plain = client.get("/openapi.json")
+    gzipped = client.get("/openapi.json", HTTP_ACCEPT_ENCODING="gzip")
+
+    assert plain["ETag"] != gzipped["ETag"]
+    assert gzipped["Vary"] == "Accept-Encoding"
+    response = client.get(
+        "/openapi.json", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=plain["ETag"]
+    )
+    assert response.status_code == OK_REQUEST_STATUS
+    assert response["Content-Encoding"] == "gzip"
+
+
+def test_openapi_uses_built_file(db, schema_file):  # Usa el fichero del build
+    content = write_schema()
+    document = json.loads(content)
+    document["info"]["title"] = "Generado en el build"
+    schema_file.write_text(json.dumps(document))
+
+    assert Client().get("/openapi.json").json()["info"]["title"] == (
+        "Generado en el build"
+    )
+
+
+def test_openapi_ignores_stale_file(db, schema_file):  # Fichero de otra versión
+    schema_file.write_text(json.dumps({VERSION_KEY: "otra", "paths": {}}))
+
+    schema = Client().get("/openapi.json").json()
+
+    assert schema[VERSION_KEY] == code_version()
+    assert schema["paths"]
+
+
+def test_swagger_ui_points_to_static_schema(db, settings):  # La UI no lo genera
+    settings.STORAGES = {  # Sin manifest de collectstatic en los tests
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    }
+
+    response = Client().get("/swagger/")
+
+    assert response.status_code == OK_REQUEST_STATUS
+    assert b"/openapi.json" in response.content
@@ -0,0 +1,67 @@
+from unittest import mock
+
+import pytest
+from rest_framework.test import APIClient
+
+from tests.factories import BlogFactory, PostFactory, TagFactory
+
+
+OK_REQUEST_STATUS = 200
+NOT_FOUND = 404
+
+
+@pytest.mark.django_db
+def test_public_post_list_is_anonymous_and_cacheable():  # Cualquiera puede leer los posts de un blog por slug
+    blog = BlogFactory(title="Mi Blog")
+    post = PostFactory(blog=blog)
+    TagFactory(blog=blog, name="django", posts=[post])
+    PostFactory()  # Post de otro blog
+
+    response = APIClient().get(f"/api/public/blogs/{blog.slug}/posts/")
+
+    assert blog.slug == "mi-blog"
+    assert response.status_code == OK_REQUEST_STATUS
+    assert [p["id"] for p in response.data["results"]] == [post.id]
+    assert response.data["results"][0]["tags"] == ["django"]
+
+    cache_control = response["Cache-Control"]
+    assert "public" in cache_control
+    assert "s-maxage=" in cache_control
+    assert "stale-while-revalidate=" in cache_control
+    assert response["Surrogate-Key"].split() == [
+        f"blog-{blog.id}",
+        f"blog-{blog.id}-posts",
+        f"post-{post.id}",
+    ]
+
+
+@pytest.mark.django_db
+def test_public_post_detail_is_scoped_to_blog():  # Un post solo se ve bajo el slug de su blog
+    post = PostFactory()
+    other_blog = BlogFactory()
+    client = APIClient()
+
+    detail = client.get(f"/api/public/blogs/{post.blog.slug}/posts/{post.id}/")
+    assert detail.status_code == OK_REQUEST_STATUS
+    assert detail["Surrogate-Key"] == f"blog-{post.blog.id} post-{post.id}"
+
+    wrong = client.get(f"/api/public/blogs/{other_blog.slug}/posts/{post.id}/")
+    assert wrong.status_code == NOT_FOUND
+    assert "Surrogate-Key" not in wrong
+
+
+@pytest.mark.django_db
+def test_saving_a_post_purges_its_surrogate_keys(
+    settings, django_capture_on_commit_callbacks
+):  # Editar un post purga su detalle y los listados del blog en la CDN
+    settings.CDN_PURGE_URL = "https://cdn.example.com/purge"
+    post = PostFactory()
+
+    with mock.patch("blog_app.cdn.send_purge_request") as send_purge:
+        with django_capture_on_commit_callbacks(execute=True):
+            post.title = "Nuevo título"
+            post.save()
+
+    send_purge.assert_called_once_with(
+        (f"blog-{post.blog.id}-posts", f"post-{post.id}")
+    )
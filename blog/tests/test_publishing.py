@@ -0,0 +1,69 @@
+from datetime import timedelta
+
+import pytest
+from rest_framework.test import APIClient
+
+from blog_app.models import Post
+from tests.factories import BlogFactory, PostFactory
+
+from django.core.management import call_command
+from django.utils import timezone
+
+
+BAD_REQUEST = 400
+POSTS_IN_BLOG = 3
+
+
+@pytest.mark.django_db
+def test_live_posts_exclude_drafts_and_future_posts():  # Solo los posts publicados son "live"
+    blog = BlogFactory()
+    published = PostFactory(blog=blog)
+    PostFactory(blog=blog, status=Post.Status.DRAFT)
+    PostFactory(
+        blog=blog,
+        status=Post.Status.SCHEDULED,
+        published_at=timezone.now() + timedelta(days=1),
+    )
+
+    assert published.published_at is not None
+    assert list(Post.objects.live()) == [published]
+
+    client = APIClient()
+    client.force_authenticate(user=blog.user)
+    assert len(client.get("/api/posts/").data) == POSTS_IN_BLOG
+    assert [p["id"] for p in client.get("/api/posts/?live=true").data] == [published.id]
+
+    public = client.get(f"/api/public/blogs/{blog.slug}/posts/")
+    assert [p["id"] for p in public.data["results"]] == [published.id]
+
+
+@pytest.mark.django_db
+def test_publish_scheduled_command_flips_due_posts_in_batches():
+    past = timezone.now() - timedelta(minutes=5)
+    due = PostFactory.create_batch(3, status=Post.Status.SCHEDULED, published_at=past)
+    future = PostFactory(
+        status=Post.Status.SCHEDULED,
+        published_at=timezone.now() + timedelta(days=1),
+    )
+
+    call_command("publish_scheduled", batch_size=2)
+
+    assert set(Post.objects.live()) == set(due)
+    future.refresh_from_db()
+    assert future.status == Post.Status.SCHEDULED
+
+
+@pytest.mark.django_db
+def test_scheduled_post_requires_a_publication_date():
+    blog = BlogFactory()
+    client = APIClient()
+    client.force_authenticate(user=blog.user)
+
+    response = client.post(
+        "/api/posts/",
+        {"title": "t", "content": "c", "status": "scheduled"},
+        format="json",
+    )
+
+    assert response.status_code == BAD_REQUEST
+    assert "published_at" in response.data
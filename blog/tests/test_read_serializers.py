@@ -0,0 +1,84 @@
+import pytest
+from rest_framework.test import APIClient
+
+from blog_app.models import Post, PostViewCount
+from blog_app.read_serializers import (
+    BlogReadSerializer,
+    PostReadSerializer,
+    TagReadSerializer,
+)
+from blog_app.renderers import ORJSONRenderer
+from blog_app.serializers import BlogSerializer, PostSerializer, TagSerializer
+from blog_app.utils.helpers import BLOG_POSTS_PREFETCH, POST_PKS, POST_TAGS_PREFETCH
+from tests.factories import BlogFactory, PostFactory, TagFactory
+
+from django.db.models import Prefetch
+
+
+SPARSE_OPTIONS = [
+    {},
+    {"fields": ["id", "title"]},
+    {"fields": ["id"], "expand": ["tags", "posts"]},
+    {"omit": ["content", "content_html"]},
+]
+
+
+@pytest.fixture
+def blogs(db):
+    blogs = BlogFactory.create_batch(2)
+    for blog in blogs:
+        posts = PostFactory.create_batch(3, blog=blog, content="<p>Hola mundo</p>")
+        TagFactory(blog=blog, posts=posts)
+        TagFactory(blog=blog, posts=posts[:1])
+        PostViewCount.objects.create(post=posts[0], count=12)  # Resto: 0 visitas
+    PostFactory(blog=blogs[0])  # Post sin tags
+    # Borrados (soft delete): no aparecen en ninguna de las dos salidas
+    PostFactory(blog=blogs[1], title="borrado").tags.add(TagFactory(blog=blogs[1]))
+    Post.all_objects.get(title="borrado").soft_delete()
+    TagFactory(blog=blogs[0], posts=blogs[0].posts.all()).soft_delete()
+    return blogs
+
+
+def render(data):
+    return ORJSONRenderer().render(data)
+
+
+@pytest.mark.parametrize("options", SPARSE_OPTIONS)
+@pytest.mark.parametrize(
+    ("read_serializer", "serializer", "prefetch"),
+    [
+        (PostReadSerializer, PostSerializer, ["blog__user", *POST_TAGS_PREFETCH]),
+        (TagReadSerializer, TagSerializer, ["blog__user", Prefetch("posts", POST_PKS)]),
+        (BlogReadSerializer, BlogSerializer, [BLOG_POSTS_PREFETCH]),
+    ],
+)
+def test_read_serializer_matches_model_serializer(
+    blogs, options, read_serializer, serializer, prefetch
+):  # Misma salida (bytes) que el ModelSerializer
+    model = serializer.Meta.model
+    instances = model.objects.order_by("id").prefetch_related(*prefetch)
+    options = {
+        "fields": options.get("fields"),
+        "expand": options.get("expand", ()),
+        "omit": [
+            name for name in options.get("omit", ()) if name in serializer.Meta.fields
+        ],
+    }
+
+    expected = serializer(instances, many=True, **options).data
+    data = read_serializer(**options).serialize(model.objects.order_by("id"))
+
+    assert render(data) == render(expected)
+
+
+def test_list_endpoint_uses_values_rows(blogs, django_assert_max_num_queries):
+    client = APIClient()
+    client.force_authenticate(user=blogs[0].user)
+
+    # Posts, enlaces post-tag, tags y posts de cada tag: sin consultas por fila
+    with django_assert_max_num_queries(4):
+        response = client.get("/api/posts/")
+
+    assert len(response.data) == blogs[0].posts.count()
+    detail = client.get(f"/api/posts/{response.data[0]['id']}/")
+    assert render(detail.data) == render(response.data[0])
@@ -0,0 +1,122 @@
+import pytest
+from rest_framework.test import APIClient
+
+from blog_app.models import RelatedPost
+from blog_app.related import get_related_posts
+from tests.factories import BlogFactory, PostFactory, TagFactory
+
+from django.core.management import call_command
+from django.test import Client
+
+
+OK_REQUEST_STATUS = 200
+NOT_FOUND = 404
+
+
+@pytest.fixture
+def posts(db):
+    # a y b comparten dos tags, c solo uno y d ninguno; e es de otro blog
+    blog = BlogFactory()
+    a, b, c, d = PostFactory.create_batch(4, blog=blog)
+    TagFactory(blog=blog, name="x", posts=[a, b, c])
+    TagFactory(blog=blog, name="y", posts=[a, b])
+    TagFactory(blog=blog, name="z", posts=[d])
+    e = PostFactory()
+    TagFactory(blog=e.blog, name="x", posts=[e])
+    return a, b, c, d, e
+
+
+def related(post):
+    return [(row.related_id, row.score) for row in scores(post)]
+
+
+def scores(post):
+    return RelatedPost.objects.filter(post=post).order_by("-score", "-related_id")
+
+
+def test_related_posts_by_tag_overlap(posts):  # Jaccard dentro del blog
+    a, b, c, d, e = posts
+
+    assert related(a) == [(b.id, 1.0), (c.id, 0.5)]
+    assert related(c) == [(b.id, 0.5), (a.id, 0.5)]
+    assert related(d) == []
+    assert related(e) == []
+    assert list(get_related_posts(a.id)) == [b, c]
+
+
+def test_related_posts_follow_tag_changes(posts):  # Recalculo incremental
+    a, b, c, d, _ = posts
+
+    b.tags.remove(b.tags.get(name="y"))
+    assert related(a) == [(c.id, 0.5), (b.id, 0.5)]
+    assert related(b) == [(c.id, 1.0), (a.id, 0.5)]
+
+    a.tags.get(name="x").posts.clear()
+    assert related(a) == []
+    assert related(c) == []
+
+    d.tags.add(a.tags.get(name="y"))
+    assert related(a) == [(d.id, 1 / 2)]
+
+
+def test_deleted_posts_and_tags_are_dropped(posts):  # Soft delete
+    a, b, c, _, _ = posts
+
+    b.soft_delete()
+    assert related(a) == [(c.id, 0.5)]
+
+    a.tags.get(name="x").soft_delete()
+    assert related(a) == []
+
+
+def test_related_posts_limit(posts, settings):  # Solo los N mejores
+    settings.RELATED_POSTS_LIMIT = 1
+    a, b, *_ = posts
+
+    call_command("rebuild_related_posts", blog_ids=[a.blog_id])
+
+    assert related(a) == [(b.id, 1.0)]
+
+
+def test_rebuild_command_matches_incremental(posts):  # Mismo resultado
+    expected = sorted(RelatedPost.objects.values_list("post", "related", "score"))
+    RelatedPost.objects.all().delete()
+
+    call_command("rebuild_related_posts")
+
+    assert (
+        sorted(RelatedPost.objects.values_list("post", "related", "score")) == expected
+    )
+
+
+def test_related_endpoint(posts):  # /api/posts/{id}/related/
+    a, b, c, _, e = posts
+    client = APIClient()
+    client.force_authenticate(user=a.blog.user)
+
+    response = client.get(f"/api/posts/{a.id}/related/?fields=id,title")
+
+    assert response.status_code == OK_REQUEST_STATUS
+    assert response.data == [
+        {"id": b.id, "title": b.title},
+        {"id": c.id, "title": c.title},
+    ]
+    assert client.get(f"/api/posts/{e.id}/related/").status_code == NOT_FOUND
+
+
+def test_graphql_related_posts(posts):  # Campo relatedPosts de PostType
+    a, b, c, _, _ = posts
+    client = Client()
+    client.force_login(a.blog.user)
+
+    response = client.post(
+        "/graphql/",
+        {"query": "{ allPosts { id relatedPosts { id } } }"},
+        content_type="application/json",
+    )
+
+    related_ids = {
+        int(post["id"]): [int(other["id"]) for other in post["relatedPosts"]]
+        for post in response.json()["data"]["allPosts"]
+    }
+    assert related_ids[a.id] == [b.id, c.id]
@@ -0,0 +1,41 @@
+from decimal import Decimal
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from blog_app.renderers import ORJSONRenderer
+from blog_app.serializers import PostSerializer
+from tests.factories import PostFactory, TagFactory, UserFactory
+
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+
+
+BAD_REQUEST = 400
+
+
+@pytest.mark.django_db
+def test_orjson_renderer_matches_drf_json_renderer():  # Mismo JSON que el renderer de DRF
+    post = PostFactory(content="<p>ñandú</p>")
+    TagFactory(blog=post.blog, posts=[post])
+    data = {
+        "posts": PostSerializer([post], many=True).data,
+        "now": timezone.now(),
+        "price": Decimal("1.50"),
+        "lazy": gettext_lazy("Blog"),
+    }
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@pytest.mark.django_db
+def test_orjson_parser_rejects_invalid_json():
+    client = APIClient()
+    client.force_authenticate(user=UserFactory())
+
+    response = client.post(
+        "/api/blogs/", data=b"{no es json", content_type="application/json"
+    )
+
+    assert response.status_code == BAD_REQUEST
@@ -0,0 +1,48 @@
+import pytest
+
+from blog_app.models import Blog, Change, Post, RelatedPost, Tag
+from blog_app.seeding import seed_data
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+
+
+BLOGS = 3
+POSTS_PER_BLOG = 4
+TAGS_PER_BLOG = 2
+
+
+@pytest.mark.django_db
+def test_seed_command_creates_the_rows():  # seed crea usuarios, blogs, posts y tags
+    call_command(
+        "seed",
+        blogs=BLOGS,
+        posts_per_blog=POSTS_PER_BLOG,
+        tags_per_blog=TAGS_PER_BLOG,
+        tags_per_post=TAGS_PER_BLOG,
+        stdout=None,
+    )
+
+    assert Blog.objects.count() == BLOGS
+    assert Post.objects.count() == BLOGS * POSTS_PER_BLOG
+    assert Tag.posts.through.objects.count() == BLOGS * POSTS_PER_BLOG * TAGS_PER_BLOG
+    assert Change.objects.count() == BLOGS * (1 + POSTS_PER_BLOG + TAGS_PER_BLOG)
+    # Todos los posts de un blog comparten sus tags: cada uno tiene a los demás
+    assert RelatedPost.objects.count() == BLOGS * POSTS_PER_BLOG * (POSTS_PER_BLOG - 1)
+    post = Post.objects.first()
+    assert post.content_html and post.published_at
+    assert User.objects.first().check_password("seed1234")
+
+    with pytest.raises(CommandError):  # Misma semilla: los usuarios ya existen
+        call_command("seed", blogs=1, stdout=None)
+
+
+@pytest.mark.django_db
+def test_seed_is_deterministic():  # Misma semilla, mismos datos
+    def seeded_posts():
+        seed_data(BLOGS, POSTS_PER_BLOG, TAGS_PER_BLOG, 1, distribution="pareto")
+        posts = list(Post.objects.order_by("id").values_list("title", "blog__title"))
+        User.objects.all().delete()
+        return posts
+
+    assert seeded_posts() == seeded_posts()
@@ -0,0 +1,55 @@
+from pathlib import Path
+import runpy
+
+import pytest
+
+from django.db import connection
+
+
+CONFIG = Path(__file__).resolve().parent.parent / "gunicorn.conf.py"
+
+
+def load_config(monkeypatch, **env):
+    for name in ("SERVER_WORKER_CLASS", "WEB_CONCURRENCY", "GUNICORN_PRELOAD"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    return runpy.run_path(str(CONFIG))
+
+
+@pytest.mark.parametrize(
+    ("server_worker_class", "worker_class", "wsgi_app"),
+    [
+        ("gthread", "gthread", "blog.wsgi:application"),
+        ("sync", "sync", "blog.wsgi:application"),
+        ("uvicorn", "uvicorn.workers.UvicornWorker", "blog.asgi:application"),
+    ],
+)
+def test_worker_profiles(monkeypatch, server_worker_class, worker_class, wsgi_app):
+    # Clase de worker y aplicación (WSGI/ASGI) según el perfil
+    config = load_config(monkeypatch, SERVER_WORKER_CLASS=server_worker_class)
+
+    assert config["worker_class"] == worker_class
+    assert config["wsgi_app"] == wsgi_app
+    assert config["preload_app"] is True
+    assert config["max_requests_jitter"] > 0
+
+
+def test_worker_count(monkeypatch):  # Workers según CPUs o WEB_CONCURRENCY
+    config = load_config(monkeypatch)
+
+    assert config["default_workers"]("sync", 4) == 9
+    assert config["default_workers"]("gthread", 4) == 5
+    assert config["workers"] == config["cpu_count"]() + 1
+    assert load_config(monkeypatch, WEB_CONCURRENCY="7")["workers"] == 7
+
+
+def test_pre_fork_closes_connections(db, monkeypatch):  # Sin conexiones heredadas
+    config = load_config(monkeypatch)
+    connection.ensure_connection()
+    closed = []
+    monkeypatch.setattr(connection, "close", lambda: closed.append(True))
+
+    config["pre_fork"](None, None)
+
+    assert closed
@@ -0,0 +1,60 @@
+from blog_app.deletion import purge_batch
+from blog_app.models import Blog, Change, Post, Tag
+from blog_app.utils.constants import ERROR_BLOG_USER_HAS_BLOG
+from tests.factories import PostFactory, TagFactory
+
+from django.core.management import call_command
+
+
+NO_CONTENT = 204
+FORBIDDEN = 403
+CREATED = 201
+BATCH_SIZE = 2
+
+
+def test_deleted_post_is_hidden(
+    blog, owner_client
+):  # El post borrado desaparece de la API
+    post, other = PostFactory.create_batch(2, blog=blog)
+    tag = TagFactory(blog=blog, posts=[post, other])
+
+    assert owner_client.delete(f"/api/posts/{post.id}/").status_code == NO_CONTENT
+
+    assert [p["id"] for p in owner_client.get("/api/posts/").data] == [other.id]
+    assert owner_client.get("/api/tags/").data[0]["posts"] == [other.id]
+    assert Post.all_objects.get(id=post.id).deleted_at is not None
+    assert Change.objects.filter(
+        model="post", object_id=post.id, action="delete"
+    ).exists()
+    tag.refresh_from_db()
+    assert list(tag.posts.all()) == [other]
+
+
+def test_deleted_blog_is_purged_in_batches(
+    blog, owner_client
+):  # Borrado diferido por lotes
+    posts = PostFactory.create_batch(5, blog=blog)
+    TagFactory(blog=blog, posts=posts)
+
+    assert owner_client.delete(f"/api/blogs/{blog.id}/").status_code == NO_CONTENT
+    assert not Post.objects.filter(blog=blog).exists()
+    # El blog borrado no ocupa el hueco: se puede crear otro antes de la purga
+    assert owner_client.post("/api/blogs/", {"title": "Nuevo"}).status_code == CREATED
+    response = owner_client.post("/api/blogs/", {"title": "Otro"})
+    assert response.status_code == FORBIDDEN
+    assert response.data["detail"] == ERROR_BLOG_USER_HAS_BLOG
+
+    assert purge_batch(Post, BATCH_SIZE) == BATCH_SIZE
+    call_command("purge_deleted", batch_size=BATCH_SIZE, stdout=None)
+
+    assert not Post.all_objects.exists()
+    assert not Tag.all_objects.exists()
+    assert list(Blog.all_objects.values_list("title", flat=True)) == ["Nuevo"]
+
+
+def test_deleted_tag_name_can_be_reused(
+    blog,
+):  # El nombre de un tag borrado se reutiliza
+    TagFactory(blog=blog, name="django").soft_delete()
+
+    assert Tag.objects.create(blog=blog, name="django").pk
@@ -0,0 +1,64 @@
+import pytest
+from rest_framework.test import APIClient
+
+from tests.factories import BlogFactory, PostFactory, TagFactory
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+BAD_REQUEST = 400
+
+
+@pytest.fixture
+def client_with_post(db):
+    blog = BlogFactory()
+    post = PostFactory(blog=blog, content="<p>cuerpo</p>")
+    TagFactory(blog=blog, posts=[post])
+    client = APIClient()
+    client.force_authenticate(user=blog.user)
+    return client, post
+
+
+def test_fields_selects_only_requested_columns(
+    client_with_post,
+):  # ?fields= limita campos y columnas
+    client, post = client_with_post
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/api/posts/?fields=id,title")
+
+    assert response.data == [{"id": post.id, "title": post.title}]
+    post_query = next(q["sql"] for q in queries if 'FROM "blog_app_post"' in q["sql"])
+    assert '"content"' not in post_query
+    assert not any('"blog_app_tag"' in q["sql"] for q in queries)  # Sin prefetch
+
+
+def test_expand_adds_relations(client_with_post):
+    client, _ = client_with_post
+
+    response = client.get("/api/posts/?fields=id&expand=tags")
+
+    assert set(response.data[0]) == {"id", "tags"}
+    assert len(response.data[0]["tags"]) == 1
+
+
+def test_excerpt_mode_omits_bodies(
+    client_with_post,
+):  # ?excerpt=true no envía el contenido
+    client, _ = client_with_post
+
+    post_data = client.get("/api/posts/?excerpt=true").data[0]
+
+    assert post_data["excerpt"] == "cuerpo"
+    assert "content" not in post_data
+    assert "content_html" not in post_data
+
+
+def test_unknown_fields_are_rejected(client_with_post):
+    client, _ = client_with_post
+
+    response = client.get("/api/blogs/?fields=id,password")
+
+    assert response.status_code == BAD_REQUEST
+    assert "password" in response.data["fields"]
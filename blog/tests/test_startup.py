@@ -0,0 +1,48 @@
+import asyncio
+import importlib
+
+from blog.urls import lazy_view
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+
+def test_lazy_view_is_built_once():  # La vista se construye en el 1er uso
+    built = []
+
+    def factory():
+        built.append(1)
+        return lambda request: HttpResponse("ok")
+
+    view = lazy_view(factory)
+    assert built == []
+
+    request = RequestFactory().get("/")
+    assert view(request).content == b"ok"
+    assert view(request).content == b"ok"
+    assert built == [1]
+
+
+def test_lazy_async_view():  # Variante async (graphql/async/)
+    async def inner(request):
+        return HttpResponse("async")
+
+    view = lazy_view(lambda: inner, is_async=True)
+
+    response = asyncio.run(view(RequestFactory().get("/")))
+    assert response.content == b"async"
+
+
+def test_api_profile_urls(settings):  # Perfil api: sin admin ni documentación
+    urls = importlib.import_module("blog.urls")
+    settings.PROCESS_PROFILE = "api"
+    try:
+        routes = {
+            str(pattern.pattern) for pattern in importlib.reload(urls).urlpatterns
+        }
+    finally:
+        settings.PROCESS_PROFILE = "full"
+        importlib.reload(urls)
+
+    assert {"api/", "graphql/", "graphql/async/"} <= routes
+    assert not {"admin/", "tinymce/", "swagger/", "openapi.json"} & routes
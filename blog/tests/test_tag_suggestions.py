@@ -0,0 +1,101 @@
+import pytest
+from rest_framework.test import APIClient
+
+from blog_app import tag_index
+from blog_app.tag_index import suggest_tags
+from tests.factories import BlogFactory, TagFactory
+
+from django.test import Client
+
+
+OK_REQUEST_STATUS = 200
+CREATED = 201
+
+
+@pytest.fixture
+def blog_with_tags(blog):  # Sobre el `blog` de conftest
+    for name in ["django", "docker", "djangorest", "python", "dj"]:
+        TagFactory(blog=blog, name=name)
+    TagFactory(blog=BlogFactory(), name="django-otro")  # Tag de otro blog
+    TagFactory(blog=blog, name="django-borrado").soft_delete()
+    return blog
+
+
+@pytest.mark.usefixtures("blog_with_tags")
+def test_suggestions_by_prefix(blog):  # Orden alfabético, solo del blog del usuario
+    user = blog.user
+
+    assert suggest_tags(user, "dj") == ["dj", "django", "djangorest"]
+    assert suggest_tags(user, " DJANGO ") == ["django", "djangorest"]
+    assert suggest_tags(user, "d", limit=2) == ["dj", "django"]
+    assert suggest_tags(user, "rust") == []
+    assert suggest_tags(user, "") == []
+
+
+@pytest.mark.usefixtures("blog_with_tags")
+def test_hot_prefixes_skip_the_database(
+    blog, django_assert_num_queries
+):  # Índice en memoria
+    suggest_tags(blog.user, "d")
+
+    with django_assert_num_queries(0):
+        assert suggest_tags(blog.user, "py") == ["python"]
+
+
+@pytest.mark.usefixtures("blog_with_tags")
+def test_index_is_invalidated_on_tag_changes(
+    blog, django_capture_on_commit_callbacks
+):  # Crear, renombrar y borrar tags
+    user = blog.user
+    assert suggest_tags(user, "do") == ["docker"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        TagFactory(blog=blog, name="dokku")
+    assert suggest_tags(user, "do") == ["docker", "dokku"]
+
+    docker = blog.tags.get(name="docker")
+    with django_capture_on_commit_callbacks(execute=True):
+        docker.name = "podman"
+        docker.save()
+    assert suggest_tags(user, "do") == ["dokku"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        blog.tags.get(name="dokku").soft_delete()
+    assert suggest_tags(user, "do") == []
+
+
+@pytest.mark.usefixtures("blog_with_tags")
+def test_old_indexes_are_rebuilt(blog, monkeypatch):  # Aunque no llegue la invalidación
+    user = blog.user
+    assert suggest_tags(user, "ru") == []
+
+    TagFactory(blog=blog, name="rust")  # Sin on_commit: la versión no cambia
+    assert suggest_tags(user, "ru") == []
+
+    monkeypatch.setattr(tag_index, "TAG_INDEX_TTL", 0)
+    assert suggest_tags(user, "ru") == ["rust"]
+
+
+@pytest.mark.usefixtures("blog_with_tags")
+def test_suggest_endpoint(blog):  # /api/tags/suggest/?q=
+    client = APIClient()
+    client.force_authenticate(user=blog.user)
+
+    response = client.get("/api/tags/suggest/", {"q": "djan"})
+
+    assert response.status_code == OK_REQUEST_STATUS
+    assert response.data == ["django", "djangorest"]
+
+
+@pytest.mark.usefixtures("blog_with_tags")
+def test_graphql_tag_suggestions(blog):  # Campo tagSuggestions
+    client = Client()
+    client.force_login(blog.user)
+
+    response = client.post(
+        "/graphql/",
+        {"query": '{ tagSuggestions(q: "p") }'},
+        content_type="application/json",
+    )
+
+    assert response.json()["data"]["tagSuggestions"] == ["python"]
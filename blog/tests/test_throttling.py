@@ -0,0 +1,106 @@
+from graphql import parse
+import pytest
+from rest_framework.test import APIClient
+
+from auth_app.graphql_cost import graphql_query_cost
+from auth_app.throttling import consume
+from blog.schema import schema
+from tests.factories import UserFactory
+
+from django.core.cache import cache
+from django.test import Client
+
+
+TOO_MANY_REQUESTS = 429
+BAD_REQUEST = 400
+OK_REQUEST_STATUS = 200
+LIST_QUERY_COST = 21  # allPosts (1) + 10 x (id + title)
+
+
+@pytest.fixture
+def rates(settings):
+    def set_rates(**rates):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            "DEFAULT_THROTTLE_RATES": {
+                **settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"],
+                **rates,
+            },
+        }
+
+    return set_rates
+
+
+def test_token_bucket():  # Permite ráfagas hasta la capacidad y luego espera
+    assert consume("test", "2/min") == 0
+    assert consume("test", "2/min") == 0
+    assert consume("test", "2/min") == pytest.approx(30, abs=1)
+
+
+def test_local_fallback_when_cache_fails(monkeypatch):  # Sin caché sigue limitando
+    def broken(*args, **kwargs):
+        raise ConnectionError
+
+    monkeypatch.setattr(cache, "get", broken)
+    monkeypatch.setattr(cache, "set", broken)
+
+    assert consume("test-local", "1/min") == 0
+    assert consume("test-local", "1/min") > 0
+
+
+@pytest.mark.django_db
+def test_login_endpoint_is_throttled_by_ip(rates):  # /api/token/ limita intentos
+    rates(login="2/min")
+    client = APIClient()
+    data = {"username": "nadie", "password": "incorrecta"}
+
+    statuses = [client.post("/api/token/", data).status_code for _ in range(3)]
+
+    assert statuses[-1] == TOO_MANY_REQUESTS
+    assert TOO_MANY_REQUESTS not in statuses[:2]
+
+
+@pytest.mark.django_db
+def test_spoofed_forwarded_for_shares_the_bucket(rates, settings):  # Cabecera falsa
+    rates(login="2/min")
+    settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}
+    client = APIClient()
+    data = {"username": "nadie", "password": "incorrecta"}
+
+    # El proxy añade la IP real al final de lo que envía el cliente
+    statuses = [
+        client.post(
+            "/api/token/", data, HTTP_X_FORWARDED_FOR=f"10.0.0.{i}, 203.0.113.7"
+        ).status_code
+        for i in range(3)
+    ]
+    other_client = client.post(
+        "/api/token/", data, HTTP_X_FORWARDED_FOR="10.0.0.1, 203.0.113.8"
+    )
+
+    assert statuses[-1] == TOO_MANY_REQUESTS
+    assert other_client.status_code != TOO_MANY_REQUESTS
+
+
+def test_graphql_query_cost():  # Los campos de listas cuentan por 10
+    document = parse("{ allPosts { id title } }")
+
+    assert graphql_query_cost(schema.graphql_schema, document) == LIST_QUERY_COST
+
+
+@pytest.mark.django_db
+def test_graphql_is_cost_throttled(rates):
+    rates(graphql=f"{LIST_QUERY_COST * 2}/min")
+    client = Client()
+    client.force_login(UserFactory())
+
+    def run(query):
+        return client.post(
+            "/graphql/", {"query": query}, content_type="application/json"
+        )
+
+    statuses = [run("{ allPosts { id title } }").status_code for _ in range(3)]
+    assert statuses == [OK_REQUEST_STATUS, OK_REQUEST_STATUS, TOO_MANY_REQUESTS]
+
+    deep = "{ allBlogs { posts { tags { posts { id title } } } } }"
+    assert run(deep).status_code == BAD_REQUEST  # Más caro que el bucket entero
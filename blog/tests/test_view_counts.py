@@ -0,0 +1,155 @@
+import os
+import threading
+from unittest import mock
+
+import pytest
+from rest_framework.test import APIClient
+
+from blog_app import view_counts
+from blog_app.models import Post, PostViewCount
+from blog_app.view_counts import ViewCounter, flush_view_counts, record_view
+from tests.factories import BlogFactory, PostFactory
+
+from django.db import DatabaseError, connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+
+NO_CONTENT = 204
+NOT_FOUND = 404
+
+
+@pytest.fixture(autouse=True)
+def view_counter(monkeypatch):
+    # Contador propio del test, sin el hilo que escribe en segundo plano
+    counter = ViewCounter()
+    counter.pid = os.getpid()
+    monkeypatch.setattr(view_counts, "view_counter", counter)
+    return counter
+
+
+def count_view(client, post):
+    return client.post(f"/api/public/blogs/{post.blog.slug}/posts/{post.id}/views/")
+
+
+@pytest.mark.django_db
+def test_views_are_written_on_flush():  # Las visitas se acumulan hasta el volcado
+    post = PostFactory()
+    client = APIClient()
+
+    for _ in range(3):
+        assert count_view(client, post).status_code == NO_CONTENT
+    assert not PostViewCount.objects.exists()
+
+    assert flush_view_counts() == 3
+    assert Post.objects.get(id=post.id).views == 3
+
+    count_view(client, post)
+    count_view(client, post)
+    flush_view_counts()
+    assert Post.objects.get(id=post.id).views == 5
+
+
+@pytest.mark.django_db
+def test_flush_queries_do_not_grow_with_posts():  # Un upsert por lote, no por post
+    posts = PostFactory.create_batch(10)
+    PostViewCount.objects.create(post=posts[0], count=4)
+
+    record_view(posts[0].id)
+    with CaptureQueriesContext(connection) as one_post:
+        flush_view_counts()
+    for post in posts:
+        record_view(post.id)
+    with CaptureQueriesContext(connection) as ten_posts:
+        flush_view_counts()
+
+    assert len(ten_posts) == len(one_post)
+    assert [post.views for post in Post.objects.filter(id=posts[0].id)] == [6]
+    assert PostViewCount.objects.filter(count=1).count() == 9
+
+
+@pytest.mark.django_db
+def test_only_live_posts_of_the_blog_are_counted():  # 404 fuera del blog o en borrador
+    post = PostFactory()
+    draft = PostFactory(blog=post.blog, status=Post.Status.DRAFT)
+    client = APIClient()
+
+    response = client.post(
+        f"/api/public/blogs/{BlogFactory().slug}/posts/{post.id}/views/"
+    )
+    assert response.status_code == NOT_FOUND
+    assert count_view(client, draft).status_code == NOT_FOUND
+    assert flush_view_counts() == 0
+
+
+@pytest.mark.django_db
+def test_failed_flush_keeps_pending_views():  # Se reintenta en el siguiente volcado
+    post = PostFactory()
+    record_view(post.id)
+
+    with mock.patch.object(view_counts, "save_view_counts", side_effect=DatabaseError):
+        assert flush_view_counts() == 0
+
+    assert flush_view_counts() == 1
+    assert Post.objects.get(id=post.id).views == 1
+
+
+def test_flush_thread_survives_unexpected_errors(
+    settings, view_counter
+):  # El hilo sigue vivo
+    settings.VIEW_COUNT_FLUSH_INTERVAL = 0.01
+    attempts = []
+    saved = threading.Event()
+
+    def save(views):
+        attempts.append(dict(views))
+        if len(attempts) < 3:
+            raise RuntimeError  # No es un DatabaseError
+        saved.set()
+
+    view_counter.add(1)
+    view_counter.add(1)
+    with mock.patch.object(view_counts, "save_view_counts", side_effect=save):
+        thread = threading.Thread(target=view_counter.run, daemon=True)
+        thread.start()
+        assert saved.wait(timeout=5)
+
+    assert thread.is_alive()
+    assert attempts == [{1: 2}] * 3
+
+
+@pytest.mark.django_db
+def test_zero_interval_writes_every_view(settings):  # Sin búfer
+    settings.VIEW_COUNT_FLUSH_INTERVAL = 0
+    post = PostFactory()
+
+    record_view(post.id)
+
+    assert Post.objects.get(id=post.id).views == 1
+
+
+@pytest.mark.django_db
+def test_views_are_exposed_in_rest_and_graphql():  # Campo views en PostSerializer y PostType
+    blog = BlogFactory()
+    viewed, unviewed = PostFactory.create_batch(2, blog=blog)
+    PostViewCount.objects.create(post=viewed, count=7)
+    expected = {viewed.id: 7, unviewed.id: 0}
+
+    api = APIClient()
+    api.force_authenticate(user=blog.user)
+    listed = api.get("/api/posts/").data
+    detail = api.get(f"/api/posts/{viewed.id}/").data
+
+    client = Client()
+    client.force_login(blog.user)
+    response = client.post(
+        "/graphql/",
+        {"query": "{ allPosts { id views } }"},
+        content_type="application/json",
+    )
+
+    assert {post["id"]: post["views"] for post in listed} == expected
+    assert detail["views"] == 7
+    assert {
+        int(post["id"]): post["views"] for post in response.json()["data"]["allPosts"]
+    } == expected
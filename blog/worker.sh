@@ -0,0 +1,23 @@
+#!/bin/bash
+
+set -e  # detiene el script si algún comando falla
+
+# Tareas periódicas: se ejecutan en un servicio aparte de Railway (railway.worker.json),
+# no en los workers web. Cada tarea repite su comando en bucle (--loop).
+
+# Purga de blogs, posts y tags borrados (soft delete). El margen deja tiempo a los
+# clientes de /api/changes/ para recibir los tombstones antes de que desaparezca el blog
+python manage.py purge_deleted \
+    --loop "${PURGE_DELETED_INTERVAL:-3600}" \
+    --older-than "${PURGE_DELETED_AFTER:-2592000}" &
+
+# Publicación de los posts programados cuando llega su fecha
+python manage.py publish_scheduled --loop "${PUBLISH_SCHEDULED_INTERVAL:-60}" &
+
+# Claves de idempotencia caducadas (IDEMPOTENCY_KEY_TTL)
+python manage.py prune_idempotency_keys --loop "${PRUNE_IDEMPOTENCY_KEYS_INTERVAL:-3600}" &
+
+# Si una tarea termina (solo ocurre con un error) se detiene el servicio y
+# Railway lo reinicia (restartPolicyType ON_FAILURE)
+wait -n
+exit 1